@@ -0,0 +1,42 @@
+"""
+Benchmark the evaluation of the Christoffel symbols of a Levi-Civita
+connection against the batch size, with and without the cache.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_christoffel
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.connection import LeviCivitaConnection
+
+DIMENSION = 3
+N_POINTS_LIST = [1, 10, 100, 1000, 10000, 100000]
+
+
+def main(n_points_list=N_POINTS_LIST):
+    gs.random.seed(0)
+    metric = helper.ConformalMetric(dimension=DIMENSION)
+    connection = LeviCivitaConnection(metric)
+
+    helper.print_header(
+        'Christoffel symbols in dimension {}'.format(DIMENSION),
+        ['n_points', 'time (s)', 'points/s', 'cached (pts/s)'])
+    for n_points in n_points_list:
+        base_point = gs.random.rand(n_points, DIMENSION)
+        duration = helper.time_function(
+            lambda: connection.christoffel_symbols(base_point))
+
+        cached_connection = LeviCivitaConnection(metric, cache_size=n_points)
+        cached_connection.christoffel_symbols(base_point)
+        cached_duration = helper.time_function(
+            lambda: cached_connection.christoffel_symbols(base_point))
+
+        helper.print_row([
+            n_points, duration, n_points / duration,
+            n_points / cached_duration])
+
+
+if __name__ == "__main__":
+    main()
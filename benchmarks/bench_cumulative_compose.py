@@ -0,0 +1,55 @@
+"""
+Benchmark the cumulative composition of points of Lie groups,
+computed with a parallel prefix scan, against a sequential loop
+of compositions.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_cumulative_compose
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_POINTS_LIST = [100, 10000, 1000000]
+N_LOOP_POINTS = 1000
+
+
+def sequential_compose(group, points):
+    cumulative = [points[:1]]
+    for i in range(1, points.shape[0]):
+        cumulative.append(group.compose(cumulative[-1], points[i:i + 1]))
+    return gs.concatenate(cumulative, axis=0)
+
+
+def main(n_points_list=N_POINTS_LIST, n_loop_points=N_LOOP_POINTS):
+    gs.random.seed(0)
+    groups = {
+        'SO(3) vector': SpecialOrthogonalGroup(n=3),
+        'SO(3) quaternion': SpecialOrthogonalGroup(
+            n=3, point_type='quaternion'),
+        'SE(3) vector': SpecialEuclideanGroup(n=3),
+        'SE(3) matrix': SpecialEuclideanGroup(n=3, point_type='matrix'),
+    }
+
+    helper.print_header(
+        'Cumulative composition',
+        ['group', 'n_points', 'scan (s)', 'scan (points/s)',
+         'loop (points/s)'])
+    for name, group in groups.items():
+        loop_points = group.random_uniform(n_samples=n_loop_points)
+        loop_duration = helper.time_function(
+            lambda: sequential_compose(group, loop_points))
+        for n_points in n_points_list:
+            points = group.random_uniform(n_samples=n_points)
+            duration = helper.time_function(
+                lambda: group.cumulative_compose(points))
+            helper.print_row(
+                [name, n_points, duration, n_points / duration,
+                 n_loop_points / loop_duration])
+
+
+if __name__ == "__main__":
+    main()
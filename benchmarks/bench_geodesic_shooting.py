@@ -0,0 +1,59 @@
+"""
+Benchmark the numerical exp and the shooting log of a Levi-Civita
+connection against the batch size, for a metric without closed forms,
+with and without warm starts of the log.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_geodesic_shooting
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.connection import LeviCivitaConnection
+
+DIMENSION = 3
+N_SAMPLES_LIST = [100, 1000, 10000]
+WARM_START_NOISE = 1e-2
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    connection = LeviCivitaConnection(
+        helper.ConformalMetric(dimension=DIMENSION))
+
+    helper.print_header(
+        'Geodesic shooting in dimension {}'.format(DIMENSION),
+        ['n_samples', 'exp (pairs/s)', 'log (pairs/s)', 'iterations',
+         'warm (pairs/s)', 'warm iter.'])
+    for n_samples in n_samples_list:
+        base_point = gs.random.rand(n_samples, DIMENSION)
+        tangent_vec = gs.random.rand(n_samples, DIMENSION) - .5
+        point = connection.exp(tangent_vec, base_point)
+        initial_tangent_vec = tangent_vec + WARM_START_NOISE * (
+            gs.random.rand(n_samples, DIMENSION) - .5)
+
+        exp_duration = helper.time_function(
+            lambda: connection.exp(tangent_vec, base_point), n_repeats=1)
+        log_duration = helper.time_function(
+            lambda: connection.log(point, base_point), n_repeats=1)
+        _, info = connection.log(point, base_point, return_info=True)
+        warm_duration = helper.time_function(
+            lambda: connection.log(
+                point, base_point, initial_tangent_vec=initial_tangent_vec),
+            n_repeats=1)
+        _, warm_info = connection.log(
+            point, base_point, initial_tangent_vec=initial_tangent_vec,
+            return_info=True)
+
+        helper.print_row([
+            n_samples,
+            n_samples / exp_duration,
+            n_samples / log_duration,
+            float(gs.mean(info['n_iterations'])),
+            n_samples / warm_duration,
+            float(gs.mean(warm_info['n_iterations']))])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark the group exponential and logarithm of SE(3), as functions
+of the fraction of base points that differ from the identity.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_group_exp_log
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+
+N_SAMPLES = 10000
+FRACTIONS = [0., 0.1, 1.]
+
+
+def main(n_samples=N_SAMPLES, fractions=FRACTIONS):
+    gs.random.seed(0)
+    group = SpecialEuclideanGroup(n=3)
+    tangent_vec = group.random_uniform(n_samples=n_samples)
+    point = group.random_uniform(n_samples=n_samples)
+
+    helper.print_header(
+        'SE(3) group exp and log of %d samples' % n_samples,
+        ['base points', 'exp (s)', 'log (s)'])
+
+    exp_duration = helper.time_function(
+        lambda: group.group_exp(tangent_vec))
+    log_duration = helper.time_function(
+        lambda: group.group_log(point))
+    helper.print_row(['None', exp_duration, log_duration])
+
+    for fraction in fractions:
+        base_point = gs.zeros((n_samples, group.dimension))
+        n_not_identity = int(fraction * n_samples)
+        base_point[:n_not_identity] = group.random_uniform(
+            n_samples=n_not_identity)
+
+        exp_duration = helper.time_function(
+            lambda: group.group_exp(tangent_vec, base_point))
+        log_duration = helper.time_function(
+            lambda: group.group_log(point, base_point))
+        helper.print_row(
+            ['%d%% not id' % (100 * fraction), exp_duration, log_duration])
+
+
+if __name__ == "__main__":
+    main()
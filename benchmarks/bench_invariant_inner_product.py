@@ -0,0 +1,55 @@
+"""
+Benchmark the left-invariant inner product of SO(3), with points
+represented as matrices, translated to the identity by batched solves,
+against points represented as rotation vectors, translated with the
+inverse jacobian of the left translation.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_invariant_inner_product
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.invariant_metric import InvariantMetric
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES_LIST = [10, 1000, 100000]
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    group = SpecialOrthogonalGroup(n=3)
+    group_matrix = SpecialOrthogonalGroup(n=3, point_type='matrix')
+    inner_product_mat = gs.diag(gs.array([1., 2., 3.]))
+    metric = InvariantMetric(
+        group=group, inner_product_mat_at_identity=inner_product_mat)
+    metric_matrix = InvariantMetric(
+        group=group_matrix, inner_product_mat_at_identity=inner_product_mat)
+
+    helper.print_header(
+        'SO(3) left-invariant inner product',
+        ['n_samples', 'vector (s)', 'matrix (s)'])
+    for n_samples in n_samples_list:
+        base_point = group.random_uniform(n_samples=n_samples)
+        tangent_vec_a = group.random_uniform(n_samples=n_samples)
+        tangent_vec_b = group.random_uniform(n_samples=n_samples)
+
+        base_point_matrix = group.matrix_from_rotation_vector(base_point)
+        tangent_vec_a_matrix = gs.matmul(
+            base_point_matrix, group.skew_matrix_from_vector(tangent_vec_a))
+        tangent_vec_b_matrix = gs.matmul(
+            base_point_matrix, group.skew_matrix_from_vector(tangent_vec_b))
+
+        vector_duration = helper.time_function(
+            lambda: metric.inner_product(
+                tangent_vec_a, tangent_vec_b, base_point))
+        matrix_duration = helper.time_function(
+            lambda: metric_matrix.inner_product(
+                tangent_vec_a_matrix, tangent_vec_b_matrix,
+                base_point_matrix))
+        helper.print_row([n_samples, vector_duration, matrix_duration])
+
+
+if __name__ == "__main__":
+    main()
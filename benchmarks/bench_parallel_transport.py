@@ -0,0 +1,85 @@
+"""
+Benchmark the closed-form parallel transports against the pole ladder,
+on the hypersphere, the hyperbolic space, the SPD matrices and SO(3).
+
+Run from the root of the repository with:
+python -m benchmarks.bench_parallel_transport
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.connection import Connection
+from geomstats.hyperbolic_space import HyperbolicSpace
+from geomstats.hypersphere import Hypersphere
+from geomstats.spd_matrices_space import SPDMatricesSpace
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES = 1000
+N_RUNGS_LIST = [1, 4]
+
+
+def embedded_tangent_vecs(space, n_samples):
+    base_point = space.random_uniform(n_samples=n_samples)
+    tangent_vecs = [
+        space.projection_to_tangent_space(
+            vector=gs.random.rand(n_samples, space.dimension + 1) - .5,
+            base_point=base_point)
+        for _ in range(2)]
+    return tangent_vecs + [base_point]
+
+
+def spd_tangent_vecs(space, n_samples):
+    base_point = space.random_uniform(n_samples=n_samples)
+    tangent_vecs = [
+        .5 * space.random_tangent_vec_uniform(
+            n_samples=n_samples, base_point=base_point)
+        for _ in range(2)]
+    return tangent_vecs + [base_point]
+
+
+def so3_tangent_vecs(group, n_samples):
+    base_point = group.random_uniform(n_samples=n_samples)
+    tangent_vecs = [
+        gs.random.rand(n_samples, group.dimension) - .5
+        for _ in range(2)]
+    return tangent_vecs + [base_point]
+
+
+def main(n_samples=N_SAMPLES, n_rungs_list=N_RUNGS_LIST):
+    gs.random.seed(0)
+    sphere = Hypersphere(dimension=3)
+    hyperbolic = HyperbolicSpace(dimension=3)
+    spd = SPDMatricesSpace(n=3)
+    so3_group = SpecialOrthogonalGroup(n=3)
+
+    spaces = {
+        'S3': (sphere.metric, embedded_tangent_vecs(sphere, n_samples)),
+        'H3': (hyperbolic.metric,
+               embedded_tangent_vecs(hyperbolic, n_samples)),
+        'SPD(3)': (spd.metric, spd_tangent_vecs(spd, n_samples)),
+        'SO(3)': (so3_group.bi_invariant_metric,
+                  so3_tangent_vecs(so3_group, n_samples)),
+    }
+
+    helper.print_header(
+        'Parallel transport of {} tangent vectors'.format(n_samples),
+        ['space', 'method', 'time (s)', 'max abs error'])
+    for name, (metric, args) in spaces.items():
+        closed_form = metric.parallel_transport(*args)
+        duration = helper.time_function(
+            lambda: metric.parallel_transport(*args))
+        helper.print_row([name, 'closed form', duration, 0.])
+
+        for n_rungs in n_rungs_list:
+            def ladder():
+                return Connection.parallel_transport(
+                    metric, *args, n_rungs=n_rungs)
+            error = gs.amax(gs.abs(ladder() - closed_form))
+            duration = helper.time_function(ladder, n_repeats=1)
+            helper.print_row([
+                name, 'ladder x{}'.format(n_rungs), duration, float(error)])
+
+
+if __name__ == "__main__":
+    main()
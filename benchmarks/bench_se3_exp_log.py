@@ -0,0 +1,38 @@
+"""
+Benchmark the group exponential and logarithm from the identity
+in SE(3) against the batch size, which should scale linearly.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_se3_exp_log
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+
+N_SAMPLES_LIST = [10, 1000, 100000]
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    group = SpecialEuclideanGroup(n=3)
+
+    helper.print_header(
+        'SE(3) group exp and log from the identity',
+        ['n_samples', 'exp (s)', 'log (s)', 'exp (samples/s)',
+         'log (samples/s)'])
+    for n_samples in n_samples_list:
+        tangent_vec = group.random_uniform(n_samples=n_samples)
+        point = group.random_uniform(n_samples=n_samples)
+        exp_duration = helper.time_function(
+            lambda: group.group_exp_from_identity(tangent_vec))
+        log_duration = helper.time_function(
+            lambda: group.group_log_from_identity(point))
+        helper.print_row(
+            [n_samples, exp_duration, log_duration,
+             n_samples / exp_duration, n_samples / log_duration])
+
+
+if __name__ == "__main__":
+    main()
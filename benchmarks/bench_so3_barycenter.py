@@ -0,0 +1,52 @@
+"""
+Benchmark the group exponential barycenter of rotation vectors in SO(3),
+computed with the Frechet iterations or estimated from the top eigenvector
+of the quaternion outer products, possibly refined.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_so3_barycenter
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES_LIST = [100, 1000, 10000]
+N_ITERATIONS = 2
+SPREAD = 0.5
+
+
+def main(n_samples_list=N_SAMPLES_LIST, n_iterations=N_ITERATIONS):
+    gs.random.seed(0)
+    group = SpecialOrthogonalGroup(n=3)
+    base_point = group.random_uniform()
+
+    helper.print_header(
+        'SO(3) group exponential barycenter',
+        ['n_samples', 'frechet (s)', 'quaternion_eig (s)',
+         'refined (s)', 'deviation', 'refined deviation'])
+    for n_samples in n_samples_list:
+        points = group.compose(
+            base_point, SPREAD * gs.random.normal(size=(n_samples, 3)))
+
+        frechet_duration = helper.time_function(
+            lambda: group.group_exponential_barycenter(points))
+        eig_duration = helper.time_function(
+            lambda: group.group_exponential_barycenter(
+                points, method='quaternion_eig'))
+        refined_duration = helper.time_function(
+            lambda: group.group_exponential_barycenter(
+                points, method='quaternion_eig', n_iterations=n_iterations))
+        _, deviation = group.group_exponential_barycenter(
+            points, method='quaternion_eig', return_deviation=True)
+        _, refined_deviation = group.group_exponential_barycenter(
+            points, method='quaternion_eig', n_iterations=n_iterations,
+            return_deviation=True)
+        helper.print_row(
+            [n_samples, frechet_duration, eig_duration, refined_duration,
+             deviation[0, 0], refined_deviation[0, 0]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the composition of rotations in SO(3) against the batch size,
+for rotation vectors, with and without conversions to rotation matrices,
+and for unit quaternions.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_so3_compose
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES_LIST = [10, 1000, 100000]
+
+
+def compose_through_matrices(group, point_a, point_b):
+    rot_mat_a = group.matrix_from_rotation_vector(point_a)
+    rot_mat_b = group.matrix_from_rotation_vector(point_b)
+    return group.rotation_vector_from_matrix(gs.matmul(rot_mat_a, rot_mat_b))
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    groups = {
+        'vector': SpecialOrthogonalGroup(n=3),
+        'quaternion': SpecialOrthogonalGroup(n=3, point_type='quaternion'),
+    }
+    vector_group = groups['vector']
+
+    helper.print_header(
+        'SO(3) compose',
+        ['point_type', 'n_samples', 'time (s)', 'samples/s'])
+    for point_type, group in groups.items():
+        for n_samples in n_samples_list:
+            point_a = group.random_uniform(n_samples=n_samples)
+            point_b = group.random_uniform(n_samples=n_samples)
+            duration = helper.time_function(
+                lambda: group.compose(point_a, point_b))
+            helper.print_row(
+                [point_type, n_samples, duration, n_samples / duration])
+
+    for n_samples in n_samples_list:
+        point_a = vector_group.random_uniform(n_samples=n_samples)
+        point_b = vector_group.random_uniform(n_samples=n_samples)
+        duration = helper.time_function(
+            lambda: compose_through_matrices(vector_group, point_a, point_b))
+        helper.print_row(
+            ['matrices', n_samples, duration, n_samples / duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the throughput of the conversions between the rotation vectors,
+rotation matrices, unit quaternions and Tait-Bryan angles of SO(3).
+
+Run from the root of the repository with:
+python -m benchmarks.bench_so3_conversions
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES = 100000
+
+
+def main(n_samples=N_SAMPLES):
+    gs.random.seed(0)
+    group = SpecialOrthogonalGroup(n=3)
+
+    rot_vec = group.random_uniform(n_samples=n_samples)
+    representations = {
+        'vector': rot_vec,
+        'matrix': group.matrix_from_rotation_vector(rot_vec),
+        'quaternion': group.quaternion_from_rotation_vector(rot_vec),
+        'tait_bryan': group.tait_bryan_angles_from_rotation_vector(rot_vec)}
+    conversions = [
+        ('vector', 'matrix', group.matrix_from_rotation_vector),
+        ('matrix', 'vector', group.rotation_vector_from_matrix),
+        ('vector', 'quaternion', group.quaternion_from_rotation_vector),
+        ('quaternion', 'vector', group.rotation_vector_from_quaternion),
+        ('quaternion', 'matrix', group.matrix_from_quaternion),
+        ('matrix', 'quaternion', group.quaternion_from_matrix),
+        ('tait_bryan', 'matrix', group.matrix_from_tait_bryan_angles),
+        ('matrix', 'tait_bryan', group.tait_bryan_angles_from_matrix),
+        ('tait_bryan', 'quaternion', group.quaternion_from_tait_bryan_angles),
+        ('quaternion', 'tait_bryan', group.tait_bryan_angles_from_quaternion),
+        ('tait_bryan', 'vector',
+         group.rotation_vector_from_tait_bryan_angles),
+        ('vector', 'tait_bryan',
+         group.tait_bryan_angles_from_rotation_vector)]
+
+    helper.print_header(
+        'SO(3) conversions of %d samples' % n_samples,
+        ['from', 'to', 'time (s)', 'conversions/s'])
+    for source, target, conversion in conversions:
+        duration = helper.time_function(
+            lambda: conversion(representations[source]))
+        helper.print_row(
+            [source, target, duration, n_samples / duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark the jacobian of the left translation in SO(3)
+and its closed-form inverse against the batch size,
+which should scale linearly.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_so3_jacobian
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES_LIST = [10, 1000, 100000, 1000000]
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    group = SpecialOrthogonalGroup(n=3)
+
+    helper.print_header(
+        'SO(3) jacobian_translation',
+        ['n_samples', 'jacobian (s)', 'inverse (s)', 'linalg.inv (s)'])
+    for n_samples in n_samples_list:
+        point = group.random_uniform(n_samples=n_samples)
+        jacobian_duration = helper.time_function(
+            lambda: group.jacobian_translation(point))
+        inverse_duration = helper.time_function(
+            lambda: group.inverse_jacobian_translation(point))
+        linalg_duration = helper.time_function(
+            lambda: gs.linalg.inv(group.jacobian_translation(point)))
+        helper.print_row(
+            [n_samples, jacobian_duration, inverse_duration, linalg_duration])
+
+
+if __name__ == "__main__":
+    main()
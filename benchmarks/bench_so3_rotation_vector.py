@@ -0,0 +1,48 @@
+"""
+Benchmark the conversion of rotation matrices to rotation vectors
+in SO(3) against the batch size, for angles close to 0,
+generic angles and angles close to pi.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_so3_rotation_vector
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_SAMPLES_LIST = [10, 1000, 100000]
+ANGLE_RANGES = {
+    'close to 0': (0., 1e-4),
+    'generic': (0., gs.pi),
+    'close to pi': (gs.pi - 1e-4, gs.pi),
+}
+
+
+def random_rotation_matrices(group, n_samples, min_angle, max_angle):
+    axes = gs.random.rand(n_samples, 3) - .5
+    axes /= gs.linalg.norm(axes, axis=1, keepdims=True)
+    angles = min_angle + (max_angle - min_angle) * gs.random.rand(n_samples)
+    rot_vecs = gs.einsum('n,ni->ni', angles, axes)
+    return group.matrix_from_rotation_vector(rot_vecs)
+
+
+def main(n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    group = SpecialOrthogonalGroup(n=3)
+
+    helper.print_header(
+        'SO(3) rotation_vector_from_matrix',
+        ['angles', 'n_samples', 'time (s)', 'samples/s'])
+    for name, (min_angle, max_angle) in ANGLE_RANGES.items():
+        for n_samples in n_samples_list:
+            rot_mats = random_rotation_matrices(
+                group, n_samples, min_angle, max_angle)
+            duration = helper.time_function(
+                lambda: group.rotation_vector_from_matrix(rot_mats))
+            helper.print_row([name, n_samples, duration, n_samples / duration])
+
+
+if __name__ == "__main__":
+    main()
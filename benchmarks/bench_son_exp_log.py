@@ -0,0 +1,45 @@
+"""
+Benchmark the conversions between rotation vectors and rotation matrices
+in SO(n), i.e. the exponential of skew-symmetric matrices and the
+logarithm of rotation matrices, against scipy's expm and logm.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_son_exp_log
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_LIST = [4, 10, 50]
+N_SAMPLES = 100
+
+
+def main(n_list=N_LIST, n_samples=N_SAMPLES):
+    gs.random.seed(0)
+
+    helper.print_header(
+        'SO(n) exp and log of %d samples' % n_samples,
+        ['n', 'exp (s)', 'expm (s)', 'log (s)', 'logm (s)'])
+    for n in n_list:
+        group = SpecialOrthogonalGroup(n=n)
+        rot_mat = group.random_uniform(
+            n_samples=n_samples, point_type='matrix')
+        rot_vec = group.rotation_vector_from_matrix(rot_mat)
+        skew_mat = group.skew_matrix_from_vector(rot_vec)
+
+        exp_duration = helper.time_function(
+            lambda: group.matrix_from_rotation_vector(rot_vec))
+        expm_duration = helper.time_function(
+            lambda: gs.linalg.expm(skew_mat))
+        log_duration = helper.time_function(
+            lambda: group.rotation_vector_from_matrix(rot_mat))
+        logm_duration = helper.time_function(
+            lambda: gs.linalg.logm(rot_mat))
+        helper.print_row(
+            [n, exp_duration, expm_duration, log_duration, logm_duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark the projection of nearly orthogonal matrices on SO(n),
+with the singular value decomposition and the Newton-Schulz iterations,
+against the former mat (mat^T mat)^(-1/2) with scipy's sqrtm.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_son_projection
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+
+N_LIST = [3, 4, 10]
+N_SAMPLES = 1000
+NOISE = 1e-6
+
+
+def projection_sqrtm(mat):
+    aux_mat = gs.matmul(gs.transpose(mat, axes=(0, 2, 1)), mat)
+    return gs.matmul(mat, gs.linalg.inv(gs.linalg.sqrtm(aux_mat)))
+
+
+def main(n_list=N_LIST, n_samples=N_SAMPLES):
+    gs.random.seed(0)
+
+    helper.print_header(
+        'SO(n) projection of %d samples' % n_samples,
+        ['n', 'svd (s)', 'newton-schulz (s)', 'sqrtm (s)'])
+    for n in n_list:
+        group = SpecialOrthogonalGroup(n=n)
+        rot_mat = group.random_uniform(
+            n_samples=n_samples, point_type='matrix')
+        mat = rot_mat + NOISE * gs.random.normal(size=(n_samples, n, n))
+
+        svd_duration = helper.time_function(
+            lambda: group.projection(mat, method='svd'))
+        newton_schulz_duration = helper.time_function(
+            lambda: group.projection(mat, method='newton_schulz'))
+        sqrtm_duration = helper.time_function(
+            lambda: projection_sqrtm(mat))
+        helper.print_row(
+            [n, svd_duration, newton_schulz_duration, sqrtm_duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark repeated calls of the affine-invariant exp, log and inner
+product of SPD matrices at a single base point, without and with the
+cache of the base point factors, and with precomputed factors.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_spd_base_point
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.spd_matrices_space import SPDBasePoint
+from geomstats.spd_matrices_space import SPDMatricesSpace
+from geomstats.spd_matrices_space import SPDMetric
+
+N = 3
+N_SAMPLES_LIST = [1, 100, 10000]
+N_CALLS = 20
+
+
+def repeated_calls(metric, points, tangent_vec, base_point, n_calls):
+    for _ in range(n_calls):
+        log = metric.log(points, base_point)
+        metric.inner_product(log, tangent_vec, base_point)
+        metric.exp(log, base_point)
+
+
+def main(n=N, n_samples_list=N_SAMPLES_LIST, n_calls=N_CALLS):
+    gs.random.seed(0)
+    space = SPDMatricesSpace(n=n)
+    metric = SPDMetric(n=n)
+    cached_metric = SPDMetric(n=n, cache_size=1)
+
+    helper.print_header(
+        'SPD(%d) %d calls of log, inner_product, exp' % (n, n_calls),
+        ['n_samples', 'no cache (s)', 'cache (s)', 'factors (s)'])
+    for n_samples in n_samples_list:
+        base_point = space.random_uniform(n_samples=1)
+        points = space.random_uniform(n_samples=n_samples)
+        tangent_vec = space.random_tangent_vec_uniform(
+            n_samples=n_samples, base_point=base_point)
+
+        no_cache_duration = helper.time_function(
+            lambda: repeated_calls(
+                metric, points, tangent_vec, base_point, n_calls))
+        cache_duration = helper.time_function(
+            lambda: repeated_calls(
+                cached_metric, points, tangent_vec, base_point, n_calls))
+        factors_duration = helper.time_function(
+            lambda: repeated_calls(
+                metric, points, tangent_vec, SPDBasePoint(base_point),
+                n_calls))
+        helper.print_row(
+            [n_samples, no_cache_duration, cache_duration, factors_duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark the Frechet mean and the pairwise distances of SPD matrices
+for the affine-invariant, Log-Euclidean, Bures-Wasserstein and
+Log-Cholesky metrics.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_spd_metrics
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.spd_matrices_space import SPDMatricesSpace
+from geomstats.spd_matrices_space import SPDMetric
+from geomstats.spd_matrices_space import SPDMetricBuresWasserstein
+from geomstats.spd_matrices_space import SPDMetricLogCholesky
+from geomstats.spd_matrices_space import SPDMetricLogEuclidean
+
+N = 3
+N_SAMPLES_LIST = [10, 50]
+
+
+def main(n=N, n_samples_list=N_SAMPLES_LIST):
+    gs.random.seed(0)
+    space = SPDMatricesSpace(n=n)
+    metrics = {
+        'affine': SPDMetric(n=n),
+        'log-euclidean': SPDMetricLogEuclidean(n=n),
+        'bures': SPDMetricBuresWasserstein(n=n),
+        'log-cholesky': SPDMetricLogCholesky(n=n)}
+
+    for n_samples in n_samples_list:
+        points = space.random_uniform(n_samples=n_samples)
+        points_a = gs.repeat(points, n_samples, axis=0)
+        points_b = gs.tile(points, (n_samples, 1, 1))
+
+        helper.print_header(
+            'SPD(%d) metrics on %d samples' % (n, n_samples),
+            ['metric', 'mean (s)', 'pairwise (s)'])
+        for name, metric in metrics.items():
+            mean_duration = helper.time_function(
+                lambda: metric.mean(points))
+            pairwise_duration = helper.time_function(
+                lambda: metric.squared_dist(points_a, points_b))
+            helper.print_row([name, mean_duration, pairwise_duration])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark the batched evaluation of Bezier splines against
+the naive per-sample de Casteljau algorithm, on SO(3), SE(3)
+and the hypersphere.
+
+Run from the root of the repository with:
+python -m benchmarks.bench_splines
+"""
+
+import geomstats.backend as gs
+import benchmarks.helper as helper
+
+from geomstats.hypersphere import Hypersphere
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+from geomstats.splines import _naive_evaluate as naive_evaluate
+from geomstats.splines import BezierSpline
+
+DEGREE = 3
+N_SEGMENTS = 4
+N_NAIVE_SAMPLES = 20
+N_SAMPLES_LIST = [100, 1000]
+
+
+def main(n_samples_list=N_SAMPLES_LIST, n_naive_samples=N_NAIVE_SAMPLES):
+    gs.random.seed(0)
+    so3_group = SpecialOrthogonalGroup(n=3)
+    se3_group = SpecialEuclideanGroup(n=3)
+    sphere = Hypersphere(dimension=2)
+
+    spaces = {
+        'SO(3)': (so3_group.bi_invariant_metric,
+                  so3_group.random_uniform(N_SEGMENTS * (DEGREE + 1))),
+        'SE(3)': (se3_group.left_canonical_metric,
+                  se3_group.random_uniform(N_SEGMENTS * (DEGREE + 1))),
+        'S2': (sphere.metric,
+               sphere.random_uniform(N_SEGMENTS * (DEGREE + 1))),
+    }
+
+    helper.print_header(
+        'Bezier spline evaluation of degree {}'.format(DEGREE),
+        ['space', 'n_samples', 'naive (s/s)', 'batched (s/s)', 'speedup'])
+    for name, (metric, points) in spaces.items():
+        control_points = gs.reshape(
+            points, (N_SEGMENTS, DEGREE + 1) + points.shape[1:])
+        spline = BezierSpline(metric, control_points)
+
+        naive_times = gs.linspace(0., N_SEGMENTS, n_naive_samples)
+        naive_duration = helper.time_function(
+            lambda: naive_evaluate(spline, naive_times), n_repeats=1)
+        naive_throughput = n_naive_samples / naive_duration
+
+        for n_samples in n_samples_list:
+            times = gs.linspace(0., N_SEGMENTS, n_samples)
+            duration = helper.time_function(lambda: spline(times))
+            throughput = n_samples / duration
+            helper.print_row([
+                name, n_samples, naive_throughput, throughput,
+                throughput / naive_throughput])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Helper functions for the benchmarks.
+"""
+
+import time
+
+import autograd.numpy
+
+from geomstats.riemannian_metric import RiemannianMetric
+
+N_REPEATS = 3
+
+
+class ConformalMetric(RiemannianMetric):
+    """
+    Conformal metric exp(sum_i sin(x_i)) Id on R^dimension, which has
+    no closed-form exp and log. It is written with autograd so that
+    its Christoffel symbols can be computed.
+    """
+    def __init__(self, dimension):
+        super(ConformalMetric, self).__init__(dimension=dimension)
+
+    def inner_product_matrix(self, base_point=None):
+        factor = autograd.numpy.exp(
+            autograd.numpy.sum(autograd.numpy.sin(base_point), axis=1))
+        return autograd.numpy.einsum(
+            'n,ij->nij', factor, autograd.numpy.eye(self.dimension))
+
+
+def time_function(function, n_repeats=N_REPEATS):
+    """
+    Best running time in seconds of function, over n_repeats calls.
+    """
+    durations = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def print_header(title, columns):
+    print(title)
+    print(' | '.join('{:>14}'.format(column) for column in columns))
+
+
+def print_row(values):
+    row = []
+    for value in values:
+        if isinstance(value, float):
+            row.append('{:>14.4g}'.format(value))
+        else:
+            row.append('{:>14}'.format(value))
+    print(' | '.join(row))
@@ -37,6 +37,14 @@ def real(x):
     return np.real(x)
 
 
+def imag(x):
+    return np.imag(x)
+
+
+def conj(x):
+    return np.conj(x)
+
+
 def reshape(*args, **kwargs):
     return np.reshape(*args, **kwargs)
 
@@ -177,6 +185,10 @@ def maximum(a, b):
     return np.maximum(a, b)
 
 
+def minimum(a, b):
+    return np.minimum(a, b)
+
+
 def greater(a, b):
     return np.greater(a, b)
 
@@ -285,6 +297,10 @@ def where(*args, **kwargs):
     return np.where(*args, **kwargs)
 
 
+def searchsorted(*args, **kwargs):
+    return np.searchsorted(*args, **kwargs)
+
+
 def tile(*args, **kwargs):
     return np.tile(*args, **kwargs)
 
@@ -343,6 +359,10 @@ def log(*args, **kwargs):
     return np.log(*args, **kwargs)
 
 
+def log1p(*args, **kwargs):
+    return np.log1p(*args, **kwargs)
+
+
 def cov(*args, **kwargs):
     return np.cov(*args, **kwargs)
 
@@ -385,3 +405,7 @@ def mean(x, axis=None):
 
 def normal(*args, **kwargs):
     return np.random.normal(*args, **kwargs)
+
+
+def tril(*args, **kwargs):
+    return np.tril(*args, **kwargs)
@@ -19,6 +19,10 @@ def sqrtm(x):
         scipy.linalg.sqrtm, signature='(n,m)->(n,m)')(x)
 
 
+def schur(*args, **kwargs):
+    return scipy.linalg.schur(*args, **kwargs)
+
+
 def det(*args, **kwargs):
     return np.linalg.det(*args, **kwargs)
 
@@ -47,6 +51,10 @@ def eigh(*args, **kwargs):
     return np.linalg.eigh(*args, **kwargs)
 
 
+def solve(*args, **kwargs):
+    return np.linalg.solve(*args, **kwargs)
+
+
 def eig(*args, **kwargs):
     return np.linalg.eig(*args, **kwargs)
 
@@ -56,7 +64,8 @@ def exp(*args, **kwargs):
 
 
 def qr(*args, **kwargs):
-    return np.vectorize(
-        np.linalg.qr,
-        signature='(n,m)->(n,k),(k,m)',
-        excluded=['mode'])(*args, **kwargs)
+    return np.linalg.qr(*args, **kwargs)
+
+
+def cholesky(*args, **kwargs):
+    return np.linalg.cholesky(*args, **kwargs)
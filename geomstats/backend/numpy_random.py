@@ -17,3 +17,16 @@ def seed(*args, **kwargs):
 
 def normal(*args, **kwargs):
     return np.random.normal(*args, **kwargs)
+
+
+def default_rng(*args, **kwargs):
+    return np.random.default_rng(*args, **kwargs)
+
+
+def spawn_rngs(seed, n_streams):
+    """
+    Create independent generators for parallel streams of random numbers,
+    which are reproducible from a single seed.
+    """
+    seed_sequences = np.random.SeedSequence(seed).spawn(n_streams)
+    return [np.random.default_rng(seed_seq) for seed_seq in seed_sequences]
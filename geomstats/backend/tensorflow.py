@@ -27,6 +27,10 @@ def where(*args, **kwargs):
     return tf.where(*args, **kwargs)
 
 
+def searchsorted(sorted_sequence, values, side='left'):
+    return tf.searchsorted(sorted_sequence, values, side=side)
+
+
 def vectorize(x, pyfunc, multiple_args=False, dtype=None, **kwargs):
     if multiple_args:
         return tf.map_fn(lambda x: pyfunc(*x), elems=x, dtype=dtype)
@@ -49,6 +53,14 @@ def real(x):
     return tf.real(x)
 
 
+def imag(x):
+    return tf.imag(x)
+
+
+def conj(x):
+    return tf.conj(x)
+
+
 def cond(*args, **kwargs):
     return tf.cond(*args, **kwargs)
 
@@ -89,6 +101,10 @@ def log(x):
     return tf.log(x)
 
 
+def log1p(x):
+    return tf.log1p(x)
+
+
 def hstack(x):
     return tf.concat(x, axis=1)
 
@@ -183,6 +199,10 @@ def maximum(x, y):
     return tf.maximum(x, y)
 
 
+def minimum(x, y):
+    return tf.minimum(x, y)
+
+
 def greater(x, y):
     return tf.greater(x, y)
 
@@ -321,3 +341,13 @@ def diagonal(*args, **kwargs):
 
 def mean(x, axis=None):
     return tf.reduce_mean(x, axis)
+
+
+def tril(m, k=0):
+    if k not in (0, -1):
+        raise NotImplementedError(
+            'Only k=0 and k=-1 are implemented for tril.')
+    lower = tf.linalg.band_part(m, -1, 0)
+    if k == -1:
+        lower = lower - tf.linalg.band_part(m, 0, 0)
+    return lower
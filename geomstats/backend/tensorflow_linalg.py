@@ -59,6 +59,10 @@ def inv(x):
     return tf.linalg.inv(x)
 
 
+def solve(matrix, rhs):
+    return tf.linalg.solve(matrix, rhs)
+
+
 def matrix_rank(x):
     return tf.rank(x)
 
@@ -82,3 +86,7 @@ def qr(*args, mode='reduced'):
         dtype=(tf.float32, tf.float32))
 
     return qr
+
+
+def cholesky(x):
+    return tf.linalg.cholesky(x)
@@ -27,3 +27,13 @@ def seed(*args):
 
 def normal(loc=0.0, scale=1.0, size=(1, 1)):
     return tf.random_normal(mean=loc, stddev=scale, shape=size)
+
+
+def default_rng(*args, **kwargs):
+    raise NotImplementedError(
+        'Random generators are not implemented with tensorflow.')
+
+
+def spawn_rngs(seed, n_streams):
+    raise NotImplementedError(
+        'Random generators are not implemented with tensorflow.')
@@ -2,9 +2,32 @@
 Affine connections.
 """
 
+import collections
+
 import autograd
+import autograd.numpy
 
 import geomstats.backend as gs
+import geomstats.integrators as integrators
+
+N_RUNGS = 1
+N_STEPS = integrators.N_STEPS
+LOG_TOLERANCE = 1e-6
+LOG_MAX_ITER = 25
+FINITE_DIFF_EPSILON = 1e-7
+
+
+def _symmetrized_derivative(metric_derivative):
+    """
+    Combination d_l g_mk + d_k g_ml - d_m g_kl of the derivatives
+    metric_derivative[n, m, k, l, ...] = d_l g_mk, which can carry
+    trailing axes of further derivation.
+    """
+    trailing_axes = tuple(range(4, gs.ndim(metric_derivative)))
+    return (
+        metric_derivative
+        + gs.transpose(metric_derivative, axes=(0, 1, 3, 2) + trailing_axes)
+        - gs.transpose(metric_derivative, axes=(0, 3, 1, 2) + trailing_axes))
 
 
 class Connection(object):
@@ -12,7 +35,7 @@ class Connection(object):
     def __init__(self, dimension):
         self.dimension = dimension
 
-    def christoffel_symbol(self, base_point):
+    def christoffel_symbols(self, base_point):
         """
         Christoffel symbols associated with the connection.
         """
@@ -27,55 +50,156 @@ class Connection(object):
         raise NotImplementedError(
                 'connection is not implemented.')
 
-    def exp(self, tangent_vector_a, base_point):
+    def exp(self, tangent_vec, base_point, n_steps=N_STEPS, step='rk4'):
         """
-        Connection applied to tangent_vector_b in the direction of
-        tangent_vector_a, both tangent at base_point.
+        Exponential map associated to the affine connection.
+
+        The geodesic equation is integrated numerically from time 0 to 1,
+        simultaneously for all the pairs of tangent vectors and base points,
+        with n_steps steps of step 'euler' or 'rk4', or with the adaptive
+        'dopri' step, see geomstats.integrators.
         """
-        raise NotImplementedError(
-                'The affine connection exponential is not implemented.')
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_samples = max(tangent_vec.shape[0], base_point.shape[0])
+        assert tangent_vec.shape[0] in (1, n_samples)
+        assert base_point.shape[0] in (1, n_samples)
+        tangent_vec = gs.tile(
+            tangent_vec, (n_samples // tangent_vec.shape[0], 1))
+        base_point = gs.tile(base_point, (n_samples // base_point.shape[0], 1))
+
+        initial_state = gs.stack([base_point, tangent_vec], axis=1)
+        final_state = integrators.integrate(
+            self.geodesic_equation, initial_state,
+            n_steps=n_steps, step=step)
+        return final_state[:, 0]
 
-    def log(self, point, base_point):
+    def log(self, point, base_point, initial_tangent_vec=None,
+            n_steps=N_STEPS, step='rk4', tol=LOG_TOLERANCE,
+            max_iter=LOG_MAX_ITER, return_info=False):
         """
-        Connection applied to tangent_vector_b in the direction of
-        tangent_vector_a, both tangent at base_point.
+        Logarithm map associated to the affine connection.
+
+        The initial velocities of the geodesics from base_point to point
+        are found by geodesic shooting: Gauss-Newton iterations on the
+        residuals exp_(base_point)(tangent_vec) - point. At each iteration,
+        the residuals and their finite-difference jacobians are given
+        by one batched exp, evaluated only on the pairs which have not
+        converged yet.
+
+        The iterations start from initial_tangent_vec, e.g. the logs of
+        the previous frame of a time series, or from point - base_point.
+        If return_info is True, also return a dict with the number of
+        iterations, the norm of the residual and the convergence of
+        each pair.
         """
-        raise NotImplementedError(
-                'The affine connection logarithm is not implemented.')
+        point = gs.to_ndarray(point, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_samples = max(point.shape[0], base_point.shape[0])
+        assert point.shape[0] in (1, n_samples)
+        assert base_point.shape[0] in (1, n_samples)
+        point = gs.tile(point, (n_samples // point.shape[0], 1))
+        base_point = gs.tile(base_point, (n_samples // base_point.shape[0], 1))
+        dim = point.shape[1]
+
+        if initial_tangent_vec is None:
+            tangent_vec = point - base_point
+        else:
+            tangent_vec = gs.to_ndarray(initial_tangent_vec, to_ndim=2)
+            assert tangent_vec.shape[0] in (1, n_samples)
+            tangent_vec = gs.tile(
+                tangent_vec, (n_samples // tangent_vec.shape[0], 1))
+            tangent_vec = gs.copy(tangent_vec)
+
+        n_iterations = gs.cast(gs.zeros(n_samples), gs.int32)
+        residual_norms = gs.zeros(n_samples)
+        # Shooting directions: the current tangent vectors, then
+        # their perturbations along each coordinate.
+        perturbations = gs.concatenate(
+            [gs.zeros((1, dim)), FINITE_DIFF_EPSILON * gs.eye(dim)])
+
+        active_index = gs.arange(n_samples)
+        for i_iter in range(max_iter + 1):
+            n_active = len(active_index)
+            shooting_vecs = gs.reshape(
+                tangent_vec[active_index, None] + perturbations[None],
+                (-1, dim))
+            shooting_base_points = gs.repeat(
+                base_point[active_index], dim + 1, axis=0)
+            end_points = self.exp(
+                shooting_vecs, shooting_base_points,
+                n_steps=n_steps, step=step)
+            end_points = gs.reshape(end_points, (n_active, dim + 1, dim))
+
+            residual = end_points[:, 0] - point[active_index]
+            residual_norm = gs.linalg.norm(residual, axis=1)
+            residual_norms[active_index] = residual_norm
+
+            not_converged = residual_norm > tol
+            if i_iter == max_iter or not gs.any(not_converged):
+                break
+
+            active_index = active_index[not_converged]
+            residual = residual[not_converged]
+            end_points = end_points[not_converged]
+
+            jacobian = gs.transpose(
+                end_points[:, 1:] - end_points[:, :1],
+                axes=(0, 2, 1)) / FINITE_DIFF_EPSILON
+            update = gs.linalg.solve(jacobian, residual[..., None])[..., 0]
+            tangent_vec[active_index] -= update
+            n_iterations[active_index] += 1
+
+        if not return_info:
+            return tangent_vec
+
+        info = {
+            'n_iterations': n_iterations,
+            'residual_norm': residual_norms,
+            'converged': residual_norms <= tol,
+        }
+        return tangent_vec, info
 
     def pole_ladder_transport(
-            self, tangent_vector_a, tangent_vector_b, base_point):
+            self, tangent_vec_a, tangent_vec_b, base_point):
         """
         One step of pole ladder (parallel transport associated with the
         symmetric part of the connection using transvections).
+
+        Transport tangent_vec_a from base_point to
+        exp_(base_point)(tangent_vec_b), using the geodesic symmetry
+        at the midpoint of the geodesic. All the computations are
+        batched over the tangent vectors and base points.
         """
-        half_tangent_vector_b = 1. / 2. * tangent_vector_b
+        half_tangent_vec_b = 1. / 2. * tangent_vec_b
         mid_point = self.exp(
-                base_point=base_point,
-                tangent_vector=half_tangent_vector_b)
+                tangent_vec=half_tangent_vec_b,
+                base_point=base_point)
 
-        mid_tangent_vector = - self.log(
-                base_point=mid_point,
-                point=base_point)
+        mid_tangent_vec = - self.log(
+                point=base_point,
+                base_point=mid_point)
         end_point = self.exp(
-                base_point=mid_point,
-                tangent_vector=mid_tangent_vector)
+                tangent_vec=mid_tangent_vec,
+                base_point=mid_point)
 
         base_shoot = self.exp(
-                base_point=base_point,
-                tangent_vector=tangent_vector_a)
-        mid_tangent_vector_to_shoot = - self.log(
-                base_point=mid_point,
-                end_point=base_shoot)
+                tangent_vec=tangent_vec_a,
+                base_point=base_point)
+        mid_tangent_vec_to_shoot = - self.log(
+                point=base_shoot,
+                base_point=mid_point)
         end_shoot = self.exp(
-                base_point=mid_point,
-                tangent_vector=mid_tangent_vector_to_shoot)
+                tangent_vec=mid_tangent_vec_to_shoot,
+                base_point=mid_point)
 
-        tangent_vector = - self.log(base_point=end_point, point=end_shoot)
-        return tangent_vector
+        transported_tangent_vec = - self.log(
+                point=end_shoot,
+                base_point=end_point)
+        return transported_tangent_vec
 
     def parallel_transport(
-            self, tangent_vector_a, tangent_vector_b, base_point, n_points=1):
+            self, tangent_vec_a, tangent_vec_b, base_point, n_rungs=N_RUNGS):
         """
         Parallel transport of tangent vector a integrating the connection
         along the (affine connection) geodesic starting at the initial point
@@ -83,28 +207,28 @@ class Connection(object):
 
         Returns a tangent vector at the point
         exp_(base_point)(tangent_vector_b).
+
+        The transport is approximated by a pole ladder of n_rungs rungs.
+        Subclasses override this method when a closed form is known.
         """
-        current_point = gs.copy(base_point)
-        geodesic_tangent_vector = 1. / n_points * tangent_vector_b
-        transported_tangent_vector = gs.copy(tangent_vector_a)
-        for i_point in range(1, n_points):
-            transported_tangent_vector = self.pole_ladder_transport(
-                tangent_vector_a=transported_tangent_vector,
-                tangent_vector_b=geodesic_tangent_vector,
+        current_point = base_point
+        transported_tangent_vec = tangent_vec_a
+        for i_rung in range(n_rungs):
+            frac_tangent_vec_b = (i_rung + 1) / n_rungs * tangent_vec_b
+            next_point = self.exp(
+                tangent_vec=frac_tangent_vec_b,
+                base_point=base_point)
+            geodesic_tangent_vec = self.log(
+                point=next_point,
                 base_point=current_point)
-            current_point = self.exp(
-                base_point=current_point,
-                tangent_vector=geodesic_tangent_vector)
 
-            frac_tangent_vector_b = (i_point + 1) / n_points * tangent_vector_b
-            next_point = self.exp(
-                base_point=base_point,
-                tangent_vector=frac_tangent_vector_b)
-            geodesic_tangent_vector = self.log(
-                base_point=current_point,
-                point=next_point)
+            transported_tangent_vec = self.pole_ladder_transport(
+                tangent_vec_a=transported_tangent_vec,
+                tangent_vec_b=geodesic_tangent_vec,
+                base_point=current_point)
+            current_point = next_point
 
-        return transported_tangent_vector
+        return transported_tangent_vec
 
     def riemannian_curvature(self, base_point):
         """
@@ -113,21 +237,80 @@ class Connection(object):
         raise NotImplementedError(
                 'The Riemannian curvature tensor is not implemented.')
 
-    def geodesic_equation(self):
+    def geodesic_equation(self, state):
         """
         The geodesic ordinary differential equation associated
-        with the connection.
+        with the connection, as a first order system.
+
+        The states (position, velocity) have shape (n_samples, 2, dimension)
+        and the derivatives of the states are returned with the same shape.
         """
-        raise NotImplementedError(
-                'The geodesic equation tensor is not implemented.')
+        position = state[:, 0]
+        velocity = state[:, 1]
+        christoffel_symbols = self.christoffel_symbols(position)
+        acceleration = - gs.einsum(
+            'nikl,nk,nl->ni', christoffel_symbols, velocity, velocity)
+        return gs.stack([velocity, acceleration], axis=1)
 
     def geodesic(self, initial_point,
-                 end_point=None, initial_tangent_vec=None, point_ndim=1):
+                 end_point=None, initial_tangent_vec=None,
+                 point_type='vector'):
         """
-        Geodesic associated with the connection.
+        Geodesic curve defined by either:
+        - an initial point and an initial tangent vector,
+        or
+        -an initial point and an end point.
+
+        The geodesic is returned as a function parameterized by t.
         """
-        raise NotImplementedError(
-                'Geodesics are not implemented.')
+
+        point_ndim = 1
+        if point_type == 'matrix':
+            point_ndim = 2
+
+        initial_point = gs.to_ndarray(initial_point,
+                                      to_ndim=point_ndim+1)
+
+        if end_point is None and initial_tangent_vec is None:
+            raise ValueError('Specify an end point or an initial tangent '
+                             'vector to define the geodesic.')
+        if end_point is not None:
+            end_point = gs.to_ndarray(end_point,
+                                      to_ndim=point_ndim+1)
+            shooting_tangent_vec = self.log(point=end_point,
+                                            base_point=initial_point)
+            if initial_tangent_vec is not None:
+                assert gs.allclose(shooting_tangent_vec, initial_tangent_vec)
+            initial_tangent_vec = shooting_tangent_vec
+        initial_tangent_vec = gs.array(initial_tangent_vec)
+        initial_tangent_vec = gs.to_ndarray(initial_tangent_vec,
+                                            to_ndim=point_ndim+1)
+
+        def point_on_geodesic(t):
+            t = gs.cast(t, gs.float32)
+            t = gs.to_ndarray(t, to_ndim=1)
+            t = gs.to_ndarray(t, to_ndim=2, axis=1)
+            new_initial_point = gs.to_ndarray(
+                                          initial_point,
+                                          to_ndim=point_ndim+1)
+            new_initial_tangent_vec = gs.to_ndarray(
+                                          initial_tangent_vec,
+                                          to_ndim=point_ndim+1)
+
+            if point_type == 'vector':
+                tangent_vecs = gs.einsum('il,nk->ik',
+                                         t,
+                                         new_initial_tangent_vec)
+            elif point_type == 'matrix':
+                tangent_vecs = gs.einsum('il,nkm->ikm',
+                                         t,
+                                         new_initial_tangent_vec)
+
+            point_at_time_t = self.exp(tangent_vec=tangent_vecs,
+                                       base_point=new_initial_point)
+            return point_at_time_t
+
+        return point_on_geodesic
 
     def torsion(self, base_point):
         """
@@ -140,13 +323,29 @@ class Connection(object):
 class LeviCivitaConnection(Connection):
     """
     Levi-Civita connection associated with a Riemannian metric.
+
+    If cache_size is positive, the Christoffel symbols of the last
+    cache_size distinct base points are kept, so that repeated
+    geodesic integrations from the same base points reuse them.
     """
-    def __init__(self, metric):
+    def __init__(self, metric, cache_size=0):
         self.metric = metric
         self.dimension = metric.dimension
+        self.cache_size = cache_size
+        self.christoffel_cache = collections.OrderedDict()
 
     def metric_matrix(self, base_point):
+        """
+        Matrices of the metric at the base points,
+        of shape (n_base_points, dimension, dimension).
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_base_points = base_point.shape[0]
         metric_matrix = self.metric.inner_product_matrix(base_point)
+        metric_matrix = gs.to_ndarray(metric_matrix, to_ndim=3)
+        n_mats = metric_matrix.shape[0]
+        assert n_mats in (1, n_base_points)
+        metric_matrix = gs.tile(metric_matrix, (n_base_points // n_mats, 1, 1))
         return metric_matrix
 
     def cometric_matrix(self, base_point):
@@ -158,26 +357,220 @@ class LeviCivitaConnection(Connection):
         return cometric_matrix
 
     def metric_derivative(self, base_point):
-        metric_derivative = autograd.jacobian(self.metric_matrix)
-        return metric_derivative(base_point)
+        """
+        Derivatives of the metric matrices at the base points,
+        of shape (n_base_points, dimension, dimension, dimension),
+        where the last index is the one of the coordinate of derivation.
+
+        The metric at a base point only depends on this base point,
+        so that the derivatives of all the metric matrices are given by the
+        jacobian of their sum, computed in one backward pass over the batch.
+        The inner product matrix of the metric needs to be
+        differentiable by autograd.
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        metric_derivative = autograd.jacobian(
+            self._summed_metric_matrix)(base_point)
+        return gs.transpose(metric_derivative, axes=(2, 0, 1, 3))
+
+    def metric_second_derivative(self, base_point):
+        """
+        Second derivatives of the metric matrices at the base points,
+        of shape (n_base_points,) + (dimension,) * 4, where
+        metric_second_derivative[n, m, k, l, p] = d_p d_l g_mk.
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+
+        def summed_metric_derivative(point):
+            metric_derivative = autograd.jacobian(
+                self._summed_metric_matrix)(point)
+            return autograd.numpy.sum(metric_derivative, axis=2)
+
+        metric_second_derivative = autograd.jacobian(
+            summed_metric_derivative)(base_point)
+        return gs.transpose(metric_second_derivative, axes=(3, 0, 1, 2, 4))
+
+    def _summed_metric_matrix(self, point):
+        """
+        Sum of the metric matrices at a batch of points, whose jacobian
+        gives the derivatives of the metric at all the points.
+        """
+        metric_matrix = self.metric.inner_product_matrix(point)
+        return autograd.numpy.sum(metric_matrix, axis=0)
 
     def christoffel_symbols(self, base_point):
         """
-        Christoffel symbols associated with the connection.
+        Christoffel symbols associated with the connection,
+        of shape (n_base_points, dimension, dimension, dimension),
+        where christoffel_symbols[n, i, k, l] is Gamma^i_kl.
+
+        The metric, its inverse and its derivative are computed once
+        for the whole batch of base points which are not in the cache.
         """
-        term_1 = gs.einsum('nim,nmkl->nikl',
-                           self.cometric_matrix(base_point),
-                           self.metric_derivative(base_point))
-        term_2 = gs.einsum('nim,nmlk->nilk',
-                           self.cometric_matrix(base_point),
-                           self.metric_derivative(base_point))
-        term_3 = - gs.einsum('nim,nklm->nikl',
-                             self.cometric_matrix(base_point),
-                             self.metric_derivative(base_point))
-
-        christoffel_symbols = 0.5 * (term_1 + term_2 + term_3)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        if self.cache_size <= 0:
+            return self._christoffel_symbols(base_point)
+
+        keys = [point.tobytes() for point in base_point]
+        missing_keys = {}
+        for i_point, key in enumerate(keys):
+            if key not in self.christoffel_cache:
+                missing_keys.setdefault(key, i_point)
+
+        if len(missing_keys) > 0:
+            missing_index = gs.array(list(missing_keys.values()))
+            missing_symbols = self._christoffel_symbols(
+                base_point[missing_index])
+            for key, symbols in zip(missing_keys, missing_symbols):
+                self.christoffel_cache[key] = symbols
+
+        christoffel_symbols = []
+        for key in keys:
+            self.christoffel_cache.move_to_end(key)
+            christoffel_symbols.append(self.christoffel_cache[key])
+        while len(self.christoffel_cache) > self.cache_size:
+            self.christoffel_cache.popitem(last=False)
+        return gs.stack(christoffel_symbols)
+
+    def _christoffel_symbols(self, base_point):
+        """
+        Christoffel symbols at a batch of base points, without the cache.
+
+        With metric_derivative[n, m, k, l] the derivative of g_mk
+        along the coordinate l:
+        Gamma^i_kl = 1/2 g^im (d_l g_mk + d_k g_ml - d_m g_kl).
+        """
+        cometric_matrix = self.cometric_matrix(base_point)
+        metric_derivative = self.metric_derivative(base_point)
+
+        christoffel_symbols = 0.5 * gs.einsum(
+            'nim,nmkl->nikl',
+            cometric_matrix,
+            _symmetrized_derivative(metric_derivative))
         return christoffel_symbols
 
+    def christoffel_derivative(self, base_point):
+        """
+        Christoffel symbols and their derivatives at the base points.
+
+        The derivatives have shape (n_base_points,) + (dimension,) * 4,
+        where christoffel_derivative[n, i, k, l, p] = d_p Gamma^i_kl.
+        They are computed from the first and second derivatives of the
+        metric, using d_p g^-1 = - g^-1 (d_p g) g^-1.
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        cometric_matrix = self.cometric_matrix(base_point)
+        metric_derivative = self.metric_derivative(base_point)
+        metric_second_derivative = self.metric_second_derivative(base_point)
+
+        symmetrized_derivative = _symmetrized_derivative(metric_derivative)
+        cometric_derivative = - gs.einsum(
+            'nia,nabp,nbm->nimp',
+            cometric_matrix, metric_derivative, cometric_matrix)
+
+        christoffel_symbols = 0.5 * gs.einsum(
+            'nim,nmkl->nikl', cometric_matrix, symmetrized_derivative)
+        christoffel_derivative = 0.5 * (
+            gs.einsum('nimp,nmkl->niklp',
+                      cometric_derivative, symmetrized_derivative)
+            + gs.einsum('nim,nmklp->niklp',
+                        cometric_matrix,
+                        _symmetrized_derivative(metric_second_derivative)))
+        return christoffel_symbols, christoffel_derivative
+
+    def riemannian_curvature(self, base_point):
+        """
+        Riemannian curvature tensor at the base points,
+        of shape (n_base_points,) + (dimension,) * 4, where
+        riemannian_curvature[n, i, j, k, l] = R^i_jkl, i.e.
+        R(d_k, d_l) d_j = R^i_jkl d_i, with:
+        R^i_jkl = d_k Gamma^i_lj - d_l Gamma^i_kj
+                  + Gamma^i_km Gamma^m_lj - Gamma^i_lm Gamma^m_kj.
+
+        The tensor is antisymmetric in (k, l): only the components
+        with k < l are computed, the others are deduced.
+        """
+        christoffel_symbols, christoffel_derivative = (
+            self.christoffel_derivative(base_point))
+        n_base_points = christoffel_symbols.shape[0]
+        dim = self.dimension
+
+        index_k, index_l = gs.triu_indices(dim, 1)
+        # derivative[n, i, j, l, k] = d_k Gamma^i_lj
+        derivative = gs.transpose(
+            christoffel_derivative, axes=(0, 1, 3, 2, 4))
+        christoffel_k = christoffel_symbols[:, :, index_k]
+        christoffel_l = christoffel_symbols[:, :, index_l]
+
+        components = (
+            derivative[:, :, :, index_l, index_k]
+            - derivative[:, :, :, index_k, index_l]
+            + gs.einsum('nipm,nmpj->nijp', christoffel_k, christoffel_l)
+            - gs.einsum('nipm,nmpj->nijp', christoffel_l, christoffel_k))
+
+        curvature = gs.zeros((n_base_points,) + (dim,) * 4)
+        curvature[:, :, :, index_k, index_l] = components
+        curvature[:, :, :, index_l, index_k] = - components
+        return curvature
+
+    def ricci_tensor(self, base_point):
+        """
+        Ricci tensor at the base points, of shape
+        (n_base_points, dimension, dimension): Ric_jl = R^i_jil.
+        """
+        curvature = self.riemannian_curvature(base_point)
+        return gs.einsum('nijil->njl', curvature)
+
+    def scalar_curvature(self, base_point):
+        """
+        Scalar curvature at the base points, of shape (n_base_points, 1).
+        """
+        ricci_tensor = self.ricci_tensor(base_point)
+        cometric_matrix = self.cometric_matrix(base_point)
+        scalar_curvature = gs.einsum(
+            'njl,njl->n', cometric_matrix, ricci_tensor)
+        return gs.to_ndarray(scalar_curvature, to_ndim=2, axis=1)
+
+    def sectional_curvature(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Sectional curvature of the planes spanned by the tangent vectors
+        at the base points, of shape (n_base_points, 1):
+        <R(a, b)b, a> / (|a|^2 |b|^2 - <a, b>^2).
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        n_samples = max(
+            base_point.shape[0], tangent_vec_a.shape[0],
+            tangent_vec_b.shape[0])
+        assert base_point.shape[0] in (1, n_samples)
+        assert tangent_vec_a.shape[0] in (1, n_samples)
+        assert tangent_vec_b.shape[0] in (1, n_samples)
+        base_point = gs.tile(base_point, (n_samples // base_point.shape[0], 1))
+        tangent_vec_a = gs.tile(
+            tangent_vec_a, (n_samples // tangent_vec_a.shape[0], 1))
+        tangent_vec_b = gs.tile(
+            tangent_vec_b, (n_samples // tangent_vec_b.shape[0], 1))
+
+        curvature = self.riemannian_curvature(base_point)
+        metric_matrix = self.metric_matrix(base_point)
+
+        curvature_a_b_b = gs.einsum(
+            'nijkl,nj,nk,nl->ni',
+            curvature, tangent_vec_b, tangent_vec_a, tangent_vec_b)
+        numerator = gs.einsum(
+            'nim,ni,nm->n', metric_matrix, curvature_a_b_b, tangent_vec_a)
+
+        sq_norm_a = gs.einsum(
+            'nim,ni,nm->n', metric_matrix, tangent_vec_a, tangent_vec_a)
+        sq_norm_b = gs.einsum(
+            'nim,ni,nm->n', metric_matrix, tangent_vec_b, tangent_vec_b)
+        inner_prod = gs.einsum(
+            'nim,ni,nm->n', metric_matrix, tangent_vec_a, tangent_vec_b)
+        sectional_curvature = numerator / (
+            sq_norm_a * sq_norm_b - inner_prod ** 2)
+        return gs.to_ndarray(sectional_curvature, to_ndim=2, axis=1)
+
     def torsion(self, base_point):
         """
         Torsion tensor associated with the Levi-Civita connection is zero.
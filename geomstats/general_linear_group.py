@@ -49,7 +49,7 @@ class GeneralLinearGroup(LieGroup, MatricesSpace):
 
         return belongs
 
-    def compose(self, mat_a, mat_b):
+    def compose(self, mat_a, mat_b, point_type=None):
         """
         Matrix composition.
         """
@@ -58,13 +58,21 @@ class GeneralLinearGroup(LieGroup, MatricesSpace):
         composition = gs.einsum('nij,njk->nik', mat_a, mat_b)
         return composition
 
-    def inverse(self, mat):
+    def inverse(self, mat, point_type=None):
         """
         Matrix inverse.
         """
         mat = gs.to_ndarray(mat, to_ndim=3)
         return gs.linalg.inv(mat)
 
+    def vector_from_lie_algebra(self, tangent_vec):
+        """
+        Flatten matrices of the Lie algebra gl(n), row by row.
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        n_tangent_vecs, _, _ = tangent_vec.shape
+        return gs.reshape(tangent_vec, (n_tangent_vecs, self.n * self.n))
+
     def group_exp_from_identity(self, tangent_vec, point_type=None):
         """
         Group exponential of the Lie group of
@@ -84,8 +92,7 @@ class GeneralLinearGroup(LieGroup, MatricesSpace):
         tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
         base_point = gs.to_ndarray(base_point, to_ndim=3)
 
-        tangent_vec_at_identity = self.compose(
-            self.inverse(base_point), tangent_vec)
+        tangent_vec_at_identity = gs.linalg.solve(base_point, tangent_vec)
 
         group_exp_from_identity = self.group_exp_from_identity(
                 tangent_vec_at_identity)
@@ -255,6 +255,100 @@ class HyperbolicMetric(RiemannianMetric):
                - gs.einsum('ni,nj->nj', coef_2, base_point))
         return log
 
+    def parallel_transport(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Closed-form parallel transport of tangent_vec_a along the geodesic
+        starting at base_point with initial tangent vector tangent_vec_b.
+
+        Writing tangent_vec_b = angle * u with u a unit vector
+        for the Minkowski inner product:
+        P(a) = a + <u, a> ((cosh(angle) - 1) u + sinh(angle) base_point).
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+
+        sq_norm_tangent_vec_b = self.embedding_metric.squared_norm(
+            tangent_vec_b)
+        sq_norm_tangent_vec_b = gs.maximum(sq_norm_tangent_vec_b, 0.)
+        angle = gs.sqrt(sq_norm_tangent_vec_b)
+
+        mask_0 = gs.isclose(angle, 0.)
+        mask_0_float = gs.cast(mask_0, gs.float32)
+        # This avoids dividing by 0.
+        unit_tangent_vec_b = tangent_vec_b / (angle + mask_0_float)
+
+        coef = self.embedding_metric.inner_product(
+            unit_tangent_vec_b, tangent_vec_a)
+        transported_tangent_vec = tangent_vec_a + coef * (
+            (gs.cosh(angle) - 1.) * unit_tangent_vec_b
+            + gs.sinh(angle) * base_point)
+
+        return transported_tangent_vec
+
+    def riemannian_curvature(self, base_point):
+        """
+        Riemannian curvature tensor of the hyperbolic space, of constant
+        sectional curvature -1, in the coordinates of the embedding space:
+        R^i_jkl = - (P^i_k P_lj - P^i_l P_kj),
+        where P^i_k is the Minkowski-orthogonal projection on the
+        tangent space, and P_lj = eta_lm P^m_j with eta the Minkowski metric.
+        """
+        projection, lowered_projection = self._tangent_projection(base_point)
+        curvature = - (
+            gs.einsum('nik,nlj->nijkl', projection, lowered_projection)
+            - gs.einsum('nil,nkj->nijkl', projection, lowered_projection))
+        return curvature
+
+    def ricci_tensor(self, base_point):
+        """
+        Ricci tensor of the hyperbolic space, in the coordinates of the
+        embedding space: Ric_jl = - (dimension - 1) P_jl.
+        """
+        _, lowered_projection = self._tangent_projection(base_point)
+        return - (self.dimension - 1) * lowered_projection
+
+    def scalar_curvature(self, base_point):
+        """
+        Scalar curvature of the hyperbolic space:
+        - dimension (dimension - 1).
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_base_points = base_point.shape[0]
+        scalar_curvature = - self.dimension * (self.dimension - 1.)
+        return scalar_curvature * gs.ones((n_base_points, 1))
+
+    def sectional_curvature(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Sectional curvature of the hyperbolic space,
+        which is constant equal to -1.
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_samples = max(
+            base_point.shape[0], tangent_vec_a.shape[0],
+            tangent_vec_b.shape[0])
+        return - gs.ones((n_samples, 1))
+
+    def _tangent_projection(self, base_point):
+        """
+        Matrices of the Minkowski-orthogonal projections on the tangent
+        spaces, P^i_k = delta^i_k + x^i (eta x)_k, and their lowered
+        versions P_lj = eta_lj + (eta x)_l (eta x)_j.
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        inner_prod_mat = self.embedding_metric.inner_product_matrix()
+        lowered_base_point = gs.einsum('ij,nj->ni', inner_prod_mat, base_point)
+
+        projection = (
+            gs.eye(self.dimension + 1)
+            + gs.einsum('ni,nk->nik', base_point, lowered_base_point))
+        lowered_projection = (
+            inner_prod_mat
+            + gs.einsum('nl,nj->nlj', lowered_base_point, lowered_base_point))
+        return projection, lowered_projection
+
     def dist(self, point_a, point_b):
         """
         Geodesic distance between two points.
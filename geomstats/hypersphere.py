@@ -279,6 +279,85 @@ class HypersphereMetric(RiemannianMetric):
 
         return log
 
+    def parallel_transport(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Closed-form parallel transport of tangent_vec_a along the geodesic
+        starting at base_point with initial tangent vector tangent_vec_b.
+
+        Writing tangent_vec_b = angle * u with u a unit vector:
+        P(a) = a - <u, a> ((1 - cos(angle)) u + sin(angle) base_point).
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+
+        angle = self.embedding_metric.norm(tangent_vec_b)
+
+        mask_0 = gs.isclose(angle, 0.)
+        mask_0_float = gs.cast(mask_0, gs.float32)
+        # This avoids division by 0.
+        unit_tangent_vec_b = tangent_vec_b / (angle + mask_0_float)
+
+        coef = gs.sum(
+            unit_tangent_vec_b * tangent_vec_a, axis=1, keepdims=True)
+        transported_tangent_vec = tangent_vec_a - coef * (
+            (1. - gs.cos(angle)) * unit_tangent_vec_b
+            + gs.sin(angle) * base_point)
+
+        return transported_tangent_vec
+
+    def riemannian_curvature(self, base_point):
+        """
+        Riemannian curvature tensor of the hypersphere, of constant
+        sectional curvature 1, in the coordinates of the embedding space:
+        R^i_jkl = P^i_k P_lj - P^i_l P_kj,
+        where P is the orthogonal projection on the tangent space.
+        """
+        projection = self._tangent_projection(base_point)
+        curvature = (
+            gs.einsum('nik,nlj->nijkl', projection, projection)
+            - gs.einsum('nil,nkj->nijkl', projection, projection))
+        return curvature
+
+    def ricci_tensor(self, base_point):
+        """
+        Ricci tensor of the hypersphere, in the coordinates of the
+        embedding space: Ric = (dimension - 1) P.
+        """
+        projection = self._tangent_projection(base_point)
+        return (self.dimension - 1) * projection
+
+    def scalar_curvature(self, base_point):
+        """
+        Scalar curvature of the hypersphere: dimension (dimension - 1).
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_base_points = base_point.shape[0]
+        scalar_curvature = self.dimension * (self.dimension - 1.)
+        return scalar_curvature * gs.ones((n_base_points, 1))
+
+    def sectional_curvature(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Sectional curvature of the hypersphere, which is constant equal to 1.
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        n_samples = max(
+            base_point.shape[0], tangent_vec_a.shape[0],
+            tangent_vec_b.shape[0])
+        return gs.ones((n_samples, 1))
+
+    def _tangent_projection(self, base_point):
+        """
+        Matrices of the orthogonal projections on the tangent spaces.
+        """
+        base_point = gs.to_ndarray(base_point, to_ndim=2)
+        projection = (
+            gs.eye(self.dimension + 1)
+            - gs.einsum('ni,nj->nij', base_point, base_point))
+        return projection
+
     def dist(self, point_a, point_b):
         """
         Geodesic distance between two points.
@@ -0,0 +1,179 @@
+"""
+Integrators of ordinary differential equations dy/dt = force(y),
+vectorized over a batch of initial conditions.
+
+The states have shape (n_samples, ...) and force maps a batch of states
+to the batch of their derivatives. Step sizes are given per sample.
+"""
+
+import geomstats.backend as gs
+
+N_STEPS = 10
+TOLERANCE = 1e-8
+MAX_STEPS = 1000
+
+MIN_STEP_FACTOR = 0.2
+MAX_STEP_FACTOR = 5.
+SAFETY_FACTOR = 0.9
+
+# Butcher tableau of the Dormand-Prince 5(4) method.
+DOPRI_A = [
+    [],
+    [1. / 5.],
+    [3. / 40., 9. / 40.],
+    [44. / 45., - 56. / 15., 32. / 9.],
+    [19372. / 6561., - 25360. / 2187., 64448. / 6561., - 212. / 729.],
+    [9017. / 3168., - 355. / 33., 46732. / 5247., 49. / 176.,
+     - 5103. / 18656.],
+    [35. / 384., 0., 500. / 1113., 125. / 192., - 2187. / 6784.,
+     11. / 84.]]
+DOPRI_B = [35. / 384., 0., 500. / 1113., 125. / 192., - 2187. / 6784.,
+           11. / 84., 0.]
+DOPRI_B_STAR = [5179. / 57600., 0., 7571. / 16695., 393. / 640.,
+                - 92097. / 339200., 187. / 2100., 1. / 40.]
+
+
+def _scale(step_size, state):
+    """
+    Multiply each sample of a batch of states by its step size.
+    """
+    return gs.einsum('n,n...->n...', step_size, state)
+
+
+def euler_step(force, state, step_size):
+    """
+    Explicit Euler step, of order 1.
+    """
+    return state + _scale(step_size, force(state))
+
+
+def rk4_step(force, state, step_size):
+    """
+    Classical Runge-Kutta step, of order 4.
+    """
+    k1 = force(state)
+    k2 = force(state + _scale(step_size / 2., k1))
+    k3 = force(state + _scale(step_size / 2., k2))
+    k4 = force(state + _scale(step_size, k3))
+    return state + _scale(step_size / 6., k1 + 2. * k2 + 2. * k3 + k4)
+
+
+def dormand_prince_step(force, state, step_size):
+    """
+    Dormand-Prince step.
+
+    Return the solution of order 5 and the difference with the embedded
+    solution of order 4, which estimates the local error of the step.
+    """
+    stages = []
+    for coefs in DOPRI_A:
+        stage_state = state
+        for coef, stage in zip(coefs, stages):
+            if coef != 0.:
+                stage_state = stage_state + _scale(coef * step_size, stage)
+        stages.append(force(stage_state))
+
+    new_state = state
+    error = gs.zeros_like(state)
+    for coef, coef_star, stage in zip(DOPRI_B, DOPRI_B_STAR, stages):
+        if coef != 0.:
+            new_state = new_state + _scale(coef * step_size, stage)
+        error = error + _scale((coef - coef_star) * step_size, stage)
+    return new_state, error
+
+
+STEP_FUNCTIONS = {
+    'euler': euler_step,
+    'rk4': rk4_step,
+}
+
+
+def integrate(force, initial_state, end_time=1., n_steps=N_STEPS,
+              step='rk4', tol=TOLERANCE):
+    """
+    Integrate the ODE from time 0 to end_time for a batch of initial
+    states, and return the batch of final states.
+
+    The step can be 'euler' or 'rk4', with n_steps fixed steps,
+    or 'dopri' for the adaptive Dormand-Prince method,
+    starting from n_steps steps.
+    """
+    if step == 'dopri':
+        return integrate_adaptive(
+            force, initial_state, end_time=end_time,
+            initial_step_size=end_time / n_steps, tol=tol)
+
+    assert step in STEP_FUNCTIONS, 'Unknown step: {}'.format(step)
+    step_function = STEP_FUNCTIONS[step]
+
+    state = initial_state
+    step_size = end_time / n_steps * gs.ones(initial_state.shape[0])
+    for i_step in range(n_steps):
+        state = step_function(force, state, step_size)
+    return state
+
+
+def integrate_adaptive(force, initial_state, end_time=1.,
+                       initial_step_size=None, tol=TOLERANCE,
+                       max_steps=MAX_STEPS):
+    """
+    Integrate the ODE from time 0 to end_time for a batch of initial
+    states with the adaptive Dormand-Prince method, and return the batch
+    of final states.
+
+    Each sample has its own time and step size, adapted so that the
+    local error of each step stays below tol, relatively to the size
+    of the state. At each iteration, the force is only evaluated
+    on the samples which have not reached end_time.
+
+    Raise a RuntimeError if some samples have not reached end_time
+    after max_steps iterations, e.g. if the force is not finite.
+    """
+    n_samples = initial_state.shape[0]
+    if initial_step_size is None:
+        initial_step_size = end_time / N_STEPS
+
+    state = gs.copy(initial_state)
+    times = gs.zeros(n_samples)
+    step_sizes = initial_step_size * gs.ones(n_samples)
+
+    for i_step in range(max_steps):
+        active_index = gs.where(times < end_time)[0]
+        if len(active_index) == 0:
+            break
+
+        active_state = state[active_index]
+        remaining_times = end_time - times[active_index]
+        active_step_sizes = gs.minimum(
+            step_sizes[active_index], remaining_times)
+
+        new_state, error = dormand_prince_step(
+            force, active_state, active_step_sizes)
+
+        scale = tol * (1. + gs.maximum(
+            gs.abs(active_state), gs.abs(new_state)))
+        error = gs.reshape(gs.abs(error) / scale, (len(active_index), -1))
+        error = gs.amax(error, axis=1)
+
+        accepted = error <= 1.
+        accepted_index = active_index[accepted]
+        state[accepted_index] = new_state[accepted]
+        times[accepted_index] = gs.where(
+            active_step_sizes[accepted] >= remaining_times[accepted],
+            end_time,
+            times[accepted_index] + active_step_sizes[accepted])
+
+        # This avoids dividing by 0 for exact steps.
+        error = gs.maximum(error, 1e-10)
+        step_factors = gs.clip(
+            SAFETY_FACTOR * error ** (- 1. / 5.),
+            MIN_STEP_FACTOR, MAX_STEP_FACTOR)
+        step_sizes[active_index] = active_step_sizes * step_factors
+
+    n_active = int(gs.sum(times < end_time))
+    if n_active > 0:
+        raise RuntimeError(
+            'The adaptive integration did not reach the end time '
+            'in {} steps for {} of the {} samples.'.format(
+                max_steps, n_active, n_samples))
+    return state
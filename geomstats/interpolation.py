@@ -0,0 +1,127 @@
+"""
+Geodesic interpolation and resampling of time series on manifolds.
+"""
+
+import itertools
+
+import geomstats.backend as gs
+
+
+def _point_ndim(point_type):
+    assert point_type in ('vector', 'matrix')
+    return 1 if point_type == 'vector' else 2
+
+
+def interpolate(metric, times, points, query_times, point_type='vector'):
+    """
+    Interpolate a time series of points along the geodesics of a metric.
+
+    The time series is given by the sorted timestamps times and
+    the points observed at these times. Each query time is located
+    in its segment [times[i], times[i+1]] by a binary search.
+    The logarithms of all the segments are computed in one batch,
+    and all the query times are evaluated with one batched exponential.
+
+    Query times before the first timestamp, resp. after the last
+    timestamp, are clamped to the first, resp. last, point.
+    """
+    point_ndim = _point_ndim(point_type)
+
+    times = gs.to_ndarray(times, to_ndim=1)
+    query_times = gs.to_ndarray(query_times, to_ndim=1)
+    points = gs.to_ndarray(points, to_ndim=point_ndim+1)
+
+    n_times = times.shape[0]
+    n_queries = query_times.shape[0]
+    assert points.shape[0] == n_times
+
+    if n_times == 1:
+        return gs.tile(points, (n_queries,) + (1,) * point_ndim)
+
+    segment_index = gs.searchsorted(times, query_times, side='right') - 1
+    segment_index = gs.clip(segment_index, 0, n_times - 2)
+
+    segment_logs = metric.log(point=points[1:], base_point=points[:-1])
+
+    start_times = gs.gather(times, segment_index)
+    durations = gs.gather(times, segment_index + 1) - start_times
+    # This avoids dividing by 0 for repeated timestamps.
+    mask_0_float = gs.cast(gs.equal(durations, 0.), gs.float32)
+    durations += mask_0_float
+
+    fractions = (query_times - start_times) / durations
+    fractions = gs.clip(fractions, 0., 1.)
+
+    tangent_vecs = gs.einsum(
+        'n,n...->n...',
+        fractions,
+        gs.gather(segment_logs, segment_index))
+    base_points = gs.gather(points, segment_index)
+
+    interpolated = metric.exp(
+        tangent_vec=tangent_vecs, base_point=base_points)
+    return interpolated
+
+
+def interpolate_stream(metric, samples, query_times, point_type='vector'):
+    """
+    Interpolate an unbounded time series along the geodesics of a metric.
+
+    The time series is given by samples, an iterable of chunks
+    (times, points) sorted in time, and query_times is an iterable
+    of sorted query times, which can itself be unbounded.
+
+    For each chunk, yield the pair (chunk_query_times, interpolated_points)
+    of the query times falling before the last timestamp of the chunk.
+    Only the current chunk and the last point of the previous chunk are
+    kept in memory, so that the memory cost is the one of a chunk.
+
+    Once the samples are exhausted, the remaining query times are clamped
+    to the last point, as in interpolate, and yielded in batches of the
+    size of the last chunk until query_times is exhausted.
+    """
+    point_ndim = _point_ndim(point_type)
+
+    query_times = iter(query_times)
+    next_query_time = next(query_times, None)
+
+    previous_time = None
+    previous_point = None
+    for times, points in samples:
+        times = gs.to_ndarray(times, to_ndim=1)
+        points = gs.to_ndarray(points, to_ndim=point_ndim+1)
+
+        if previous_time is not None:
+            times = gs.concatenate([previous_time, times])
+            points = gs.concatenate([previous_point, points])
+
+        last_time = times[-1]
+        chunk_query_times = []
+        while next_query_time is not None and next_query_time <= last_time:
+            chunk_query_times.append(next_query_time)
+            next_query_time = next(query_times, None)
+
+        if len(chunk_query_times) > 0:
+            chunk_query_times = gs.array(chunk_query_times)
+            interpolated = interpolate(
+                metric, times, points, chunk_query_times,
+                point_type=point_type)
+            yield chunk_query_times, interpolated
+
+        previous_time = times[-1:]
+        previous_point = points[-1:]
+
+    if previous_point is None:
+        return
+
+    batch_size = times.shape[0]
+    while next_query_time is not None:
+        chunk_query_times = [next_query_time]
+        chunk_query_times.extend(
+            itertools.islice(query_times, batch_size - 1))
+        next_query_time = next(query_times, None)
+
+        chunk_query_times = gs.array(chunk_query_times)
+        n_queries = chunk_query_times.shape[0]
+        clamped = gs.tile(previous_point, (n_queries,) + (1,) * point_ndim)
+        yield chunk_query_times, clamped
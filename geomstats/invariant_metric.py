@@ -2,7 +2,6 @@
 Left- and right- invariant metrics that exist on Lie groups.
 """
 
-import logging
 
 import geomstats.backend as gs
 
@@ -18,20 +17,32 @@ class InvariantMetric(RiemannianMetric):
 
     Points are parameterized by the Riemannian logarithm
     for the canonical left-invariant metric.
+
+    The inner product matrix at the identity is factored once, from its
+    eigendecomposition, into its square root and inverse square root.
     """
 
     def __init__(self, group,
                  inner_product_mat_at_identity=None,
                  left_or_right='left'):
         if inner_product_mat_at_identity is None:
-            inner_product_mat_at_identity = gs.eye(self.group.dimension)
+            inner_product_mat_at_identity = gs.eye(group.dimension)
         inner_product_mat_at_identity = gs.to_ndarray(
             inner_product_mat_at_identity, to_ndim=3)
         mat_shape = inner_product_mat_at_identity.shape
         assert mat_shape == (1,) + (group.dimension, ) * 2, mat_shape
 
         assert left_or_right in ('left', 'right')
-        eigenvalues = gs.linalg.eigvalsh(inner_product_mat_at_identity)
+
+        mat = inner_product_mat_at_identity[0]
+        eye = gs.eye(group.dimension)
+        diagonal = gs.diagonal(mat)
+        is_diagonal = gs.allclose(mat * (1. - eye), 0.)
+        if is_diagonal:
+            eigenvalues = diagonal
+        else:
+            eigenvalues, eigenvectors = gs.linalg.eigh(mat)
+
         mask_pos_eigval = gs.greater(eigenvalues, 0.)
         n_pos_eigval = gs.sum(gs.cast(mask_pos_eigval, gs.int32))
         mask_neg_eigval = gs.less(eigenvalues, 0.)
@@ -40,20 +51,38 @@ class InvariantMetric(RiemannianMetric):
         n_null_eigval = gs.sum(gs.cast(mask_null_eigval, gs.int32))
 
         self.group = group
-        if inner_product_mat_at_identity is None:
-            inner_product_mat_at_identity = gs.eye(self.group.dimension)
-
         self.inner_product_mat_at_identity = inner_product_mat_at_identity
         self.left_or_right = left_or_right
         self.signature = (n_pos_eigval, n_null_eigval, n_neg_eigval)
 
+        self.is_positive_definite = bool(n_pos_eigval == group.dimension)
+        self.sqrt_diagonal_at_identity = None
+        self.sqrt_inner_product_mat_at_identity = None
+        self.inv_sqrt_inner_product_mat_at_identity = None
+        if self.is_positive_definite:
+            sqrt_eigenvalues = gs.sqrt(eigenvalues)
+            if is_diagonal:
+                self.sqrt_diagonal_at_identity = sqrt_eigenvalues
+                self.sqrt_inner_product_mat_at_identity = (
+                    eye * sqrt_eigenvalues)
+                self.inv_sqrt_inner_product_mat_at_identity = (
+                    eye / sqrt_eigenvalues)
+            else:
+                self.sqrt_inner_product_mat_at_identity = gs.einsum(
+                    'ik,k,jk->ij', eigenvectors, sqrt_eigenvalues,
+                    eigenvectors)
+                self.inv_sqrt_inner_product_mat_at_identity = gs.einsum(
+                    'ik,k,jk->ij', eigenvectors, 1. / sqrt_eigenvalues,
+                    eigenvectors)
+
     def inner_product_at_identity(self, tangent_vec_a, tangent_vec_b):
         """
         Inner product matrix at the tangent space at the identity.
         """
-        assert self.group.default_point_type in ('vector', 'matrix')
+        assert self.group.default_point_type in (
+            'vector', 'matrix', 'quaternion')
 
-        if self.group.default_point_type == 'vector':
+        if self.group.default_point_type in ('vector', 'quaternion'):
             tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
             tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
 
@@ -65,35 +94,59 @@ class InvariantMetric(RiemannianMetric):
                     or n_tangent_vec_b == 1)
 
             if n_tangent_vec_a == 1:
-                tangent_vec_a = gs.array([tangent_vec_a[0]] * n_tangent_vec_b)
+                tangent_vec_a = gs.repeat(
+                    tangent_vec_a, n_tangent_vec_b, axis=0)
 
             if n_tangent_vec_b == 1:
-                tangent_vec_b = gs.array([tangent_vec_b[0]] * n_tangent_vec_a)
+                tangent_vec_b = gs.repeat(
+                    tangent_vec_b, n_tangent_vec_a, axis=0)
 
-            inner_product_mat_at_identity = gs.array(
-                [self.inner_product_mat_at_identity[0]] *
-                max(n_tangent_vec_a, n_tangent_vec_b))
-
-            inner_prod = gs.einsum('ij,ijk,ik->i',
+            inner_prod = gs.einsum('ij,jk,ik->i',
                                    tangent_vec_a,
-                                   inner_product_mat_at_identity,
+                                   self.inner_product_mat_at_identity[0],
                                    tangent_vec_b)
 
             inner_prod = gs.to_ndarray(inner_prod, to_ndim=2, axis=1)
 
         elif self.group.default_point_type == 'matrix':
-            logging.warning(
-                'Only the canonical inner product -Frobenius inner product-'
-                ' is implemented for Lie groups whose elements are represented'
-                ' by matrices.')
-            tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=3)
-            tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
-            aux_prod = gs.matmul(gs.transpose(tangent_vec_a, axes=(0, 2, 1)),
-                                 tangent_vec_b)
-            inner_prod = gs.trace(aux_prod)
+            tangent_vec_a = self.group.vector_from_lie_algebra(tangent_vec_a)
+            tangent_vec_b = self.group.vector_from_lie_algebra(tangent_vec_b)
+            if tangent_vec_a.shape[0] == 1:
+                tangent_vec_a = gs.repeat(
+                    tangent_vec_a, tangent_vec_b.shape[0], axis=0)
+            if tangent_vec_b.shape[0] == 1:
+                tangent_vec_b = gs.repeat(
+                    tangent_vec_b, tangent_vec_a.shape[0], axis=0)
+
+            inner_prod = gs.einsum('ij,jk,ik->i',
+                                   tangent_vec_a,
+                                   self.inner_product_mat_at_identity[0],
+                                   tangent_vec_b)
+            inner_prod = gs.to_ndarray(inner_prod, to_ndim=2, axis=1)
 
         return inner_prod
 
+    def translate_to_identity(self, tangent_vec, base_point):
+        """
+        Translate tangent vectors at base points, represented as matrices,
+        to the identity: g^{-1} X for left-invariant metrics and
+        X g^{-1} for right-invariant metrics, computed by batched solves.
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+        n_tangent_vecs = tangent_vec.shape[0]
+        n_base_points = base_point.shape[0]
+        if n_tangent_vecs == 1:
+            tangent_vec = gs.repeat(tangent_vec, n_base_points, axis=0)
+        if n_base_points == 1:
+            base_point = gs.repeat(base_point, n_tangent_vecs, axis=0)
+
+        if self.left_or_right == 'left':
+            return gs.linalg.solve(base_point, tangent_vec)
+        return gs.transpose(gs.linalg.solve(
+            gs.transpose(base_point, axes=(0, 2, 1)),
+            gs.transpose(tangent_vec, axes=(0, 2, 1))), axes=(0, 2, 1))
+
     def inner_product(self, tangent_vec_a, tangent_vec_b, base_point=None):
         """
         Inner product between two tangent vectors at a base point.
@@ -101,19 +154,16 @@ class InvariantMetric(RiemannianMetric):
         if base_point is None:
             return self.inner_product_at_identity(tangent_vec_a,
                                                   tangent_vec_b)
-        if self.group.default_point_type == 'vector':
+        if self.group.default_point_type in ('vector', 'quaternion'):
                 return super(InvariantMetric, self).inner_product(
                                      tangent_vec_a,
                                      tangent_vec_b,
                                      base_point)
 
-        if self.left_or_right == 'right':
-            raise NotImplementedError(
-                'inner_product not implemented for right invariant metrics.')
-        jacobian = self.group.jacobian_translation(base_point)
-        inv_jacobian = gs.linalg.inv(jacobian)
-        tangent_vec_a_at_id = gs.matmul(inv_jacobian, tangent_vec_a)
-        tangent_vec_b_at_id = gs.matmul(inv_jacobian, tangent_vec_b)
+        tangent_vec_a_at_id = self.translate_to_identity(
+            tangent_vec_a, base_point)
+        tangent_vec_b_at_id = self.translate_to_identity(
+            tangent_vec_b, base_point)
         inner_prod = self.inner_product_at_identity(tangent_vec_a_at_id,
                                                     tangent_vec_b_at_id)
         return inner_prod
@@ -123,28 +173,50 @@ class InvariantMetric(RiemannianMetric):
         Inner product matrix at the tangent space at a base point.
         """
         if self.group.default_point_type == 'matrix':
-            raise NotImplementedError(
-                'inner_product_matrix not implemented for Lie groups'
-                ' whose elements are represented as matrices.')
+            return self.inner_product_matrix_of_matrices(base_point)
 
         if base_point is None:
             base_point = self.group.identity
         base_point = self.group.regularize(base_point)
 
-        jacobian = self.group.jacobian_translation(
+        inv_jacobian = self.group.inverse_jacobian_translation(
                               point=base_point,
                               left_or_right=self.left_or_right)
-        assert gs.ndim(jacobian) == 3
-        inv_jacobian = gs.linalg.inv(jacobian)
+        assert gs.ndim(inv_jacobian) == 3
         inv_jacobian_transposed = gs.transpose(inv_jacobian, axes=(0, 2, 1))
 
-        n_base_points = base_point.shape[0]
-        inner_product_mat_at_id = gs.array(
-            [self.inner_product_mat_at_identity[0]] * n_base_points)
+        metric_mat = gs.einsum(
+            'nij,jk,nkl->nil', inv_jacobian_transposed,
+            self.inner_product_mat_at_identity[0], inv_jacobian)
+        return metric_mat
+
+    def inner_product_matrix_of_matrices(self, base_point=None):
+        """
+        Inner product matrix at a base point of a Lie group whose elements
+        are represented as matrices, in the coordinates of the flattened
+        tangent vectors, from the translations to the identity of the
+        matrices of the canonical basis.
 
-        metric_mat = gs.matmul(inv_jacobian_transposed,
-                               inner_product_mat_at_id)
-        metric_mat = gs.matmul(metric_mat, inv_jacobian)
+        It is positive semi-definite, and vanishes on the normal spaces
+        of the groups embedded in the general linear group.
+        """
+        if base_point is None:
+            base_point = self.group.identity
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+        n_base_points, n, _ = base_point.shape
+
+        basis = gs.reshape(gs.eye(n * n), (1, n * n, n, n))
+        basis = gs.repeat(basis, n_base_points, axis=0)
+        base_point = gs.repeat(
+            gs.expand_dims(base_point, axis=1), n * n, axis=1)
+        basis_at_id = self.translate_to_identity(
+            gs.reshape(basis, (-1, n, n)), gs.reshape(base_point, (-1, n, n)))
+
+        coords = self.group.vector_from_lie_algebra(basis_at_id)
+        coords = gs.reshape(coords, (n_base_points, n * n, -1))
+        metric_mat = gs.einsum(
+            'nki,ij,nlj->nkl', coords,
+            self.inner_product_mat_at_identity[0], coords)
         return metric_mat
 
     def left_exp_from_identity(self, tangent_vec):
@@ -161,19 +233,18 @@ class InvariantMetric(RiemannianMetric):
         tangent_vec = self.group.regularize_tangent_vec_at_identity(
                                         tangent_vec=tangent_vec,
                                         metric=self)
-        sqrt_inner_product_mat = gs.linalg.sqrtm(
-            self.inner_product_mat_at_identity)
-        mat = gs.transpose(sqrt_inner_product_mat, axes=(0, 2, 1))
-
-        n_tangent_vecs, _ = tangent_vec.shape
-        n_mats, _, _ = mat.shape
+        assert self.is_positive_definite, (
+            'The inner product matrix at the identity'
+            ' is not positive definite.')
 
-        if n_mats == 1:
-            mat = gs.tile(mat, (n_tangent_vecs, 1, 1))
-        if n_tangent_vecs == 1:
-            tangent_vec = gs.tile(tangent_vec, (n_mats, 1))
-        exp = gs.einsum('ni,nij->nj', tangent_vec, mat)
+        if self.sqrt_diagonal_at_identity is not None:
+            exp = tangent_vec * self.sqrt_diagonal_at_identity
+        else:
+            exp = gs.matmul(
+                tangent_vec, self.sqrt_inner_product_mat_at_identity)
 
+        if self.group.default_point_type == 'quaternion':
+            exp = self.group.quaternion_from_rotation_vector(exp)
         exp = self.group.regularize(exp)
         return exp
 
@@ -197,6 +268,10 @@ class InvariantMetric(RiemannianMetric):
         """
         Riemannian exponential of a tangent vector wrt to a base point.
         """
+        if self.group.default_point_type == 'matrix':
+            raise NotImplementedError(
+                'exp is only implemented for bi-invariant metrics on Lie'
+                ' groups whose elements are represented as matrices.')
         if base_point is None:
             base_point = self.group.identity
         base_point = self.group.regularize(base_point)
@@ -214,14 +289,11 @@ class InvariantMetric(RiemannianMetric):
         if n_base_points == 1:
             base_point = gs.tile(base_point, (n_tangent_vecs, 1))
 
-        jacobian = self.group.jacobian_translation(
+        inv_jacobian = self.group.inverse_jacobian_translation(
                                  point=base_point,
                                  left_or_right=self.left_or_right)
-        assert gs.ndim(jacobian) == 3
-        inv_jacobian = gs.linalg.inv(jacobian)
+        assert gs.ndim(inv_jacobian) == 3
         inv_jacobian_transposed = gs.transpose(inv_jacobian, axes=(0, 2, 1))
-        #print(tangent_vec)
-        #print(inv_jacobian_transposed)
         tangent_vec_at_id = gs.einsum('ni,nij->nj',
                                       tangent_vec,
                                       inv_jacobian_transposed)
@@ -247,13 +319,17 @@ class InvariantMetric(RiemannianMetric):
         at the identity.
         """
         point = self.group.regularize(point)
-        inner_prod_mat = self.inner_product_mat_at_identity
-        inv_inner_prod_mat = gs.linalg.inv(inner_prod_mat)
-        sqrt_inv_inner_prod_mat = gs.linalg.sqrtm(inv_inner_prod_mat)
-        assert sqrt_inv_inner_prod_mat.shape == ((1,)
-                                                 + (self.group.dimension,) * 2)
-        aux = gs.squeeze(sqrt_inv_inner_prod_mat, axis=0)
-        log = gs.matmul(point, aux)
+        if self.group.default_point_type == 'quaternion':
+            point = self.group.rotation_vector_from_quaternion(point)
+        assert self.is_positive_definite, (
+            'The inner product matrix at the identity'
+            ' is not positive definite.')
+
+        if self.sqrt_diagonal_at_identity is not None:
+            log = point / self.sqrt_diagonal_at_identity
+        else:
+            log = gs.matmul(
+                point, self.inv_sqrt_inner_product_mat_at_identity)
         log = self.group.regularize_tangent_vec_at_identity(
                                              tangent_vec=log,
                                              metric=self)
@@ -280,6 +356,10 @@ class InvariantMetric(RiemannianMetric):
         """
         Riemannian logarithm of a point wrt a base point.
         """
+        if self.group.default_point_type == 'matrix':
+            raise NotImplementedError(
+                'log is only implemented for bi-invariant metrics on Lie'
+                ' groups whose elements are represented as matrices.')
         if base_point is None:
             base_point = self.group.identity
         base_point = self.group.regularize(base_point)
@@ -319,3 +399,103 @@ class InvariantMetric(RiemannianMetric):
                         gs.transpose(jacobian, axes=(0, 2, 1)))
         assert gs.ndim(log) == 2
         return log
+
+
+class BiInvariantMetric(InvariantMetric):
+    """
+    Class for the bi-invariant metric of a compact Lie group,
+    i.e. the canonical invariant metric,
+    which is both left- and right-invariant.
+    """
+
+    def __init__(self, group):
+        super(BiInvariantMetric, self).__init__(
+            group=group,
+            inner_product_mat_at_identity=gs.eye(group.dimension),
+            left_or_right='left')
+
+    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point=None):
+        """
+        Inner product between two tangent vectors at a base point.
+
+        For quaternions, the tangent vectors are left-translated to the
+        identity, where the inner product is computed.
+        """
+        if self.group.default_point_type == 'quaternion':
+            return self.inner_product_at_identity(tangent_vec_a, tangent_vec_b)
+        return super(BiInvariantMetric, self).inner_product(
+            tangent_vec_a, tangent_vec_b, base_point)
+
+    def exp(self, tangent_vec, base_point=None):
+        """
+        Riemannian exponential of a tangent vector wrt to a base point.
+
+        The geodesics of a bi-invariant metric are the one-parameter
+        subgroups and their translations: for quaternions and matrices,
+        the exponential is the group exponential.
+        """
+        if self.group.default_point_type in ('quaternion', 'matrix'):
+            return self.group.group_exp(tangent_vec, base_point=base_point)
+        return super(BiInvariantMetric, self).exp(tangent_vec, base_point)
+
+    def log(self, point, base_point=None):
+        """
+        Riemannian logarithm of a point wrt a base point.
+
+        For quaternions and matrices, the logarithm is the group logarithm.
+        """
+        if self.group.default_point_type in ('quaternion', 'matrix'):
+            return self.group.group_log(point, base_point=base_point)
+        return super(BiInvariantMetric, self).log(point, base_point)
+
+    def parallel_transport(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Closed-form parallel transport of tangent_vec_a along the geodesic
+        starting at base_point with initial tangent vector tangent_vec_b.
+
+        Translated at the identity, the transport along the geodesic
+        of initial tangent vector X is the adjoint map Ad_{exp(-X/2)},
+        computed from the jacobians of the left and right translations.
+        """
+        assert self.group.default_point_type == 'vector'
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=2)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=2)
+        base_point = self.group.regularize(base_point)
+
+        n_vecs = max(
+            tangent_vec_a.shape[0],
+            tangent_vec_b.shape[0],
+            base_point.shape[0])
+        assert tangent_vec_a.shape[0] in (1, n_vecs)
+        assert tangent_vec_b.shape[0] in (1, n_vecs)
+        assert base_point.shape[0] in (1, n_vecs)
+        tangent_vec_a = gs.tile(
+            tangent_vec_a, (n_vecs // tangent_vec_a.shape[0], 1))
+        tangent_vec_b = gs.tile(
+            tangent_vec_b, (n_vecs // tangent_vec_b.shape[0], 1))
+        base_point = gs.tile(base_point, (n_vecs // base_point.shape[0], 1))
+
+        inv_jacobian = self.group.inverse_jacobian_translation(
+            point=base_point, left_or_right='left')
+        tangent_vec_a_at_id = gs.einsum(
+            'nij,nj->ni', inv_jacobian, tangent_vec_a)
+        tangent_vec_b_at_id = gs.einsum(
+            'nij,nj->ni', inv_jacobian, tangent_vec_b)
+
+        end_point = self.group.compose(
+            base_point, self.exp_from_identity(tangent_vec_b_at_id))
+
+        half_point = self.exp_from_identity(- tangent_vec_b_at_id / 2.)
+        left_jacobian = self.group.jacobian_translation(
+            point=half_point, left_or_right='left')
+        inv_right_jacobian = self.group.inverse_jacobian_translation(
+            point=half_point, left_or_right='right')
+        adjoint_mat = gs.matmul(inv_right_jacobian, left_jacobian)
+        transported_at_id = gs.einsum(
+            'nij,nj->ni', adjoint_mat, tangent_vec_a_at_id)
+
+        end_jacobian = self.group.jacobian_translation(
+            point=end_point, left_or_right='left')
+        transported_tangent_vec = gs.einsum(
+            'nij,nj->ni', end_jacobian, transported_at_id)
+        return transported_tangent_vec
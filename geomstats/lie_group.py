@@ -79,6 +79,25 @@ class LieGroup(Manifold):
         raise NotImplementedError(
                'The jacobian of the Lie group translation is not implemented.')
 
+    def vector_from_lie_algebra(self, tangent_vec):
+        """
+        Compute the coordinates of tangent vectors at the identity,
+        represented as matrices, in which the inner product matrices
+        at the identity of the invariant metrics are expressed.
+        """
+        raise NotImplementedError(
+               'The coordinates of the Lie algebra are not implemented.')
+
+    def inverse_jacobian_translation(
+            self, point, left_or_right='left', point_type=None):
+        """
+        Compute the inverse of the jacobian matrix of the differential
+        of the left/right translations from the identity to point.
+        """
+        jacobian = self.jacobian_translation(
+            point=point, left_or_right=left_or_right, point_type=point_type)
+        return gs.linalg.inv(jacobian)
+
     def group_exp_from_identity(self, tangent_vec, point_type=None):
         """
         Compute the group exponential
@@ -88,14 +107,12 @@ class LieGroup(Manifold):
                 'The group exponential from the identity is not implemented.')
 
     def group_exp_not_from_identity(self, tangent_vec, base_point, point_type):
-        jacobian = self.jacobian_translation(
-            point=base_point,
-            left_or_right='left',
-            point_type=point_type)
-
         if point_type == 'vector':
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
-            inv_jacobian = gs.linalg.inv(jacobian)
+            inv_jacobian = self.inverse_jacobian_translation(
+                point=base_point,
+                left_or_right='left',
+                point_type=point_type)
 
             tangent_vec_at_id = gs.einsum('ni,nij->nj',
                                           tangent_vec,
@@ -112,48 +129,99 @@ class LieGroup(Manifold):
 
         elif point_type == 'matrix':
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
-            raise NotImplementedError()
+            tangent_vec_at_id = gs.linalg.solve(base_point, tangent_vec)
+            group_exp_from_identity = self.group_exp_from_identity(
+                                           tangent_vec=tangent_vec_at_id,
+                                           point_type=point_type)
+            group_exp = self.compose(base_point,
+                                     group_exp_from_identity,
+                                     point_type=point_type)
+            return group_exp
 
     def group_exp(self, tangent_vec, base_point=None, point_type=None):
         """
         Compute the group exponential at point base_point
         of tangent vector tangent_vec.
+
+        If base_point is None, it is the identity: the group exponential
+        from the identity is computed directly. Otherwise, only the
+        elements whose base point differs from the identity go through
+        the group exponential from a base point.
         """
         if point_type is None:
             point_type = self.default_point_type
 
+        if point_type == 'matrix':
+            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        else:
+            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
+
+        if base_point is None:
+            return self.group_exp_from_identity(
+                tangent_vec, point_type=point_type)
+
         identity = self.get_identity(point_type=point_type)
         identity = self.regularize(identity, point_type=point_type)
-        if base_point is None:
-            base_point = identity
         base_point = self.regularize(base_point, point_type=point_type)
 
-        if point_type == 'vector':
-            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
-            base_point = gs.to_ndarray(base_point, to_ndim=2)
         if point_type == 'matrix':
-            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
             base_point = gs.to_ndarray(base_point, to_ndim=3)
+        else:
+            base_point = gs.to_ndarray(base_point, to_ndim=2)
+
+        tangent_vec, base_point = self._broadcast_to_base_point(
+            tangent_vec, base_point)
+
+        return self._dispatch_identity(
+            base_point, identity,
+            lambda mask: self.group_exp_from_identity(
+                tangent_vec[mask], point_type=point_type),
+            lambda mask: self.group_exp_not_from_identity(
+                tangent_vec[mask], base_point[mask], point_type))
 
-        n_tangent_vecs = tangent_vec.shape[0]
+    @staticmethod
+    def _broadcast_to_base_point(point, base_point):
+        """
+        Repeat the point or the base point if there is only one of them.
+        """
+        n_points = point.shape[0]
         n_base_points = base_point.shape[0]
 
-        assert (tangent_vec.shape == base_point.shape
-                or n_tangent_vecs == 1
+        assert (n_points == n_base_points
+                or n_points == 1
                 or n_base_points == 1)
 
-        if n_tangent_vecs == 1:
-            tangent_vec = gs.array([tangent_vec[0]] * n_base_points)
+        if n_points == 1:
+            point = gs.repeat(point, n_base_points, axis=0)
 
         if n_base_points == 1:
-            base_point = gs.array([base_point[0]] * n_tangent_vecs)
-
-        result = gs.cond(
-            pred=gs.allclose(base_point, identity),
-            true_fn=lambda: self.group_exp_from_identity(
-                tangent_vec, point_type=point_type),
-            false_fn=lambda: self.group_exp_not_from_identity(
-                tangent_vec, base_point, point_type))
+            base_point = gs.repeat(base_point, n_points, axis=0)
+
+        return point, base_point
+
+    @staticmethod
+    def _dispatch_identity(
+            base_point, identity, from_identity, not_from_identity):
+        """
+        Evaluate from_identity on the elements whose base point is the
+        identity, and not_from_identity on the others, each being called
+        with the mask, or slice, of the elements it computes.
+        """
+        axes = tuple(range(1, gs.ndim(base_point)))
+        mask_identity = gs.all(gs.isclose(base_point, identity), axis=axes)
+
+        if gs.all(mask_identity):
+            return from_identity(slice(None))
+        if not gs.any(mask_identity):
+            return not_from_identity(slice(None))
+
+        result_identity = from_identity(mask_identity)
+        result_not_identity = not_from_identity(~mask_identity)
+
+        result = gs.zeros(
+            (base_point.shape[0],) + result_identity.shape[1:])
+        result[mask_identity] = result_identity
+        result[~mask_identity] = result_not_identity
         return result
 
     def group_log_from_identity(self, point, point_type=None):
@@ -165,15 +233,21 @@ class LieGroup(Manifold):
                 'The group logarithm from the identity is not implemented.')
 
     def group_log_not_from_identity(self, point, base_point, point_type):
-        jacobian = self.jacobian_translation(point=base_point,
-                                             left_or_right='left',
-                                             point_type=point_type)
         point_near_id = self.compose(
-            self.inverse(base_point), point, point_type=point_type)
+            self.inverse(base_point, point_type=point_type),
+            point,
+            point_type=point_type)
         group_log_from_id = self.group_log_from_identity(
                                            point=point_near_id,
                                            point_type=point_type)
 
+        if point_type == 'matrix':
+            return gs.matmul(base_point, group_log_from_id)
+
+        jacobian = self.jacobian_translation(point=base_point,
+                                             left_or_right='left',
+                                             point_type=point_type)
+
         group_log = gs.einsum('ni,nij->nj',
                               group_log_from_id,
                               gs.transpose(jacobian, axes=(0, 2, 1)))
@@ -185,45 +259,99 @@ class LieGroup(Manifold):
         """
         Compute the group logarithm at point base_point
         of the point point.
+
+        If base_point is None, it is the identity: the group logarithm
+        from the identity is computed directly. Otherwise, only the
+        elements whose base point differs from the identity go through
+        the group logarithm from a base point.
         """
         if point_type is None:
             point_type = self.default_point_type
 
-        identity = self.get_identity(point_type=point_type)
+        if point_type == 'matrix':
+            point = gs.to_ndarray(point, to_ndim=3)
+        else:
+            point = gs.to_ndarray(point, to_ndim=2)
+        point = self.regularize(point, point_type=point_type)
+
         if base_point is None:
-            base_point = identity
+            return self.group_log_from_identity(
+                point, point_type=point_type)
+
+        identity = self.get_identity(point_type=point_type)
 
-        if point_type == 'vector':
-            point = gs.to_ndarray(point, to_ndim=2)
-            base_point = gs.to_ndarray(base_point, to_ndim=2)
         if point_type == 'matrix':
-            point = gs.to_ndarray(point, to_ndim=3)
             base_point = gs.to_ndarray(base_point, to_ndim=3)
-
-        point = self.regularize(point, point_type=point_type)
+        else:
+            base_point = gs.to_ndarray(base_point, to_ndim=2)
         base_point = self.regularize(base_point, point_type=point_type)
 
-        n_points = point.shape[0]
-        n_base_points = base_point.shape[0]
+        point, base_point = self._broadcast_to_base_point(point, base_point)
 
-        assert (point.shape == base_point.shape
-                or n_points == 1
-                or n_base_points == 1)
+        return self._dispatch_identity(
+            base_point, identity,
+            lambda mask: self.group_log_from_identity(
+                point[mask], point_type=point_type),
+            lambda mask: self.group_log_not_from_identity(
+                point[mask], base_point[mask], point_type))
 
-        if n_points == 1:
-            point = gs.array([point[0]] * n_base_points)
-
-        if n_base_points == 1:
-            base_point = gs.array([base_point[0]] * n_points)
+    def cumulative_compose(self, points, point_type=None):
+        """
+        Compute the cumulative compositions of the points, i.e.
+        points[0], points[0] . points[1], points[0] . points[1] . points[2],
+        etc.
+
+        This is a work-efficient parallel prefix scan: the points are
+        composed by consecutive pairs, the cumulative compositions of the
+        pairs are computed recursively, and give the remaining cumulative
+        compositions with one more batched composition.
+        Thus, compose is called 2 log(n_points) times on batches.
+        """
+        if point_type is None:
+            point_type = self.default_point_type
 
-        result = gs.cond(
-            pred=gs.allclose(base_point, identity),
-            true_fn=lambda: self.group_log_from_identity(
-                point, point_type=point_type),
-            false_fn=lambda: self.group_log_not_from_identity(
-                point, base_point, point_type))
+        points = self.regularize(points, point_type=point_type)
+        n_points = points.shape[0]
+        if n_points == 1:
+            return points
+
+        n_pairs = n_points // 2
+        pairs = self.compose(
+            points[0:2 * n_pairs:2], points[1::2], point_type=point_type)
+        # The j-th cumulative pair is points[0] . ... . points[2j + 1].
+        odd_cumulative = self.cumulative_compose(
+            pairs, point_type=point_type)
+
+        even_cumulative = points[:1]
+        if n_points > 2:
+            even_cumulative = gs.concatenate([
+                even_cumulative,
+                self.compose(
+                    odd_cumulative[:(n_points - 1) // 2],
+                    points[2::2],
+                    point_type=point_type)], axis=0)
+
+        cumulative = gs.stack(
+            [even_cumulative[:n_pairs], odd_cumulative], axis=1)
+        cumulative = gs.reshape(
+            cumulative, (2 * n_pairs,) + points.shape[1:])
+        return gs.concatenate(
+            [cumulative, even_cumulative[n_pairs:]], axis=0)
+
+    def relative_poses(self, points, point_type=None):
+        """
+        Compute the relative poses points[i]^{-1} . points[i + 1]
+        between consecutive points, in one batched composition.
+        """
+        if point_type is None:
+            point_type = self.default_point_type
 
-        return result
+        points = self.regularize(points, point_type=point_type)
+        assert points.shape[0] > 1
+        return self.compose(
+            self.inverse(points[:-1], point_type=point_type),
+            points[1:],
+            point_type=point_type)
 
     def group_exponential_barycenter(
            self, points, weights=None, point_type=None):
@@ -6,6 +6,7 @@ import math
 
 import geomstats.backend as gs
 
+from geomstats.connection import Connection
 
 EPSILON = 1e-4
 N_CENTERS = 10
@@ -40,7 +41,7 @@ def grad(y_pred, y_true, metric):
     return grad
 
 
-class RiemannianMetric(object):
+class RiemannianMetric(Connection):
     """
     Class for Riemannian and pseudo-Riemannian metrics.
     """
@@ -127,66 +128,6 @@ class RiemannianMetric(object):
         raise NotImplementedError(
                 'The Riemannian logarithm is not implemented.')
 
-    def geodesic(self, initial_point,
-                 end_point=None, initial_tangent_vec=None,
-                 point_type='vector'):
-        """
-        Geodesic curve defined by either:
-        - an initial point and an initial tangent vector,
-        or
-        -an initial point and an end point.
-
-        The geodesic is returned as a function parameterized by t.
-        """
-
-        point_ndim = 1
-        if point_type == 'matrix':
-            point_ndim = 2
-
-        initial_point = gs.to_ndarray(initial_point,
-                                      to_ndim=point_ndim+1)
-
-        if end_point is None and initial_tangent_vec is None:
-            raise ValueError('Specify an end point or an initial tangent '
-                             'vector to define the geodesic.')
-        if end_point is not None:
-            end_point = gs.to_ndarray(end_point,
-                                      to_ndim=point_ndim+1)
-            shooting_tangent_vec = self.log(point=end_point,
-                                            base_point=initial_point)
-            if initial_tangent_vec is not None:
-                assert gs.allclose(shooting_tangent_vec, initial_tangent_vec)
-            initial_tangent_vec = shooting_tangent_vec
-        initial_tangent_vec = gs.array(initial_tangent_vec)
-        initial_tangent_vec = gs.to_ndarray(initial_tangent_vec,
-                                            to_ndim=point_ndim+1)
-
-        def point_on_geodesic(t):
-            t = gs.cast(t, gs.float32)
-            t = gs.to_ndarray(t, to_ndim=1)
-            t = gs.to_ndarray(t, to_ndim=2, axis=1)
-            new_initial_point = gs.to_ndarray(
-                                          initial_point,
-                                          to_ndim=point_ndim+1)
-            new_initial_tangent_vec = gs.to_ndarray(
-                                          initial_tangent_vec,
-                                          to_ndim=point_ndim+1)
-
-            if point_type == 'vector':
-                tangent_vecs = gs.einsum('il,nk->ik',
-                                         t,
-                                         new_initial_tangent_vec)
-            elif point_type == 'matrix':
-                tangent_vecs = gs.einsum('il,nkm->ikm',
-                                         t,
-                                         new_initial_tangent_vec)
-
-            point_at_time_t = self.exp(tangent_vec=tangent_vecs,
-                                       base_point=new_initial_point)
-            return point_at_time_t
-
-        return point_on_geodesic
-
     def squared_dist(self, point_a, point_b):
         """
         Squared geodesic distance between two points.
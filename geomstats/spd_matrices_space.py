@@ -2,6 +2,8 @@
 The manifold of symmetric positive definite (SPD) matrices.
 """
 
+import collections
+
 import geomstats.backend as gs
 
 from geomstats.embedded_manifold import EmbeddedManifold
@@ -12,6 +14,70 @@ EPSILON = 1e-6
 TOLERANCE = 1e-12
 
 
+def _symmetric_function(eigvals, eigvecs, function):
+    """
+    Symmetric matrices V f(D) V^T, from the eigendecompositions V D V^T.
+    """
+    return gs.matmul(
+        eigvecs * gs.expand_dims(function(eigvals), axis=1),
+        gs.transpose(eigvecs, axes=(0, 2, 1)))
+
+
+def _hadamard_in_eigenbasis(mat, eigvecs, coefficients):
+    """
+    Matrices V (C * V^T A V) V^T, where * is the elementwise product
+    of the matrices A expressed in the eigenbasis V with coefficients C.
+    """
+    eigvecs_transposed = gs.transpose(eigvecs, axes=(0, 2, 1))
+    mat_in_eigenbasis = gs.matmul(eigvecs_transposed, gs.matmul(mat, eigvecs))
+    return gs.matmul(
+        eigvecs, gs.matmul(coefficients * mat_in_eigenbasis,
+                           eigvecs_transposed))
+
+
+def _log_divided_differences(eigvals):
+    """
+    First divided differences (log w_i - log w_j) / (w_i - w_j) of the
+    logarithm at positive eigenvalues, equal to 1 / w_i when w_i = w_j.
+
+    Close eigenvalues use log1p, so that the logarithms do not cancel.
+    """
+    eigvals_i = gs.expand_dims(eigvals, axis=2)
+    eigvals_j = gs.expand_dims(eigvals, axis=1)
+    diff = eigvals_i - eigvals_j
+    is_equal = gs.equal(diff, 0.)
+    safe_diff = gs.where(is_equal, gs.ones_like(diff), diff)
+    is_close = gs.less(gs.abs(diff), eigvals_j / 2.)
+
+    far = (gs.log(eigvals_i) - gs.log(eigvals_j)) / safe_diff
+    close = gs.log1p(safe_diff / eigvals_j) / safe_diff
+    divided_differences = gs.where(is_close, close, far)
+    return gs.where(
+        is_equal, 1. / (eigvals_j + gs.zeros_like(diff)),
+        divided_differences)
+
+
+def _diagonal_matrix(vec):
+    """
+    Diagonal matrices whose diagonals are the rows of vec.
+    """
+    _, n = vec.shape
+    return gs.eye(n) * gs.expand_dims(vec, axis=1)
+
+
+def _normalized_weights(n_points, weights):
+    """
+    Weights of a weighted mean as an array of shape (n_points, 1),
+    summing to one.
+    """
+    if isinstance(weights, list):
+        weights = gs.vstack(weights)
+    if weights is None:
+        weights = gs.ones((n_points, 1))
+    weights = gs.to_ndarray(gs.array(weights), to_ndim=2, axis=1)
+    return weights / gs.sum(weights)
+
+
 class SPDMatricesSpace(EmbeddedManifold):
     """
     Class for the manifold of symmetric positive definite (SPD) matrices.
@@ -117,13 +183,59 @@ class SPDMatricesSpace(EmbeddedManifold):
         return tangent_vec
 
 
+class SPDBasePoint(object):
+    """
+    SPD matrices with the factors that the affine-invariant metric uses
+    at a base point P = V D V^T: its eigendecomposition, P^{1/2},
+    P^{-1/2} and P^{-1}, computed from a single batched eigh.
+
+    It can be passed as base_point to the methods of SPDMetric, so that
+    repeated calls at the same base point only cost matrix products.
+    """
+    def __init__(self, point):
+        point = gs.to_ndarray(point, to_ndim=3)
+        self.point = point
+        self.eigvals, self.eigvecs = gs.linalg.eigh(point)
+        self.sqrt = _symmetric_function(self.eigvals, self.eigvecs, gs.sqrt)
+        self.inv_sqrt = _symmetric_function(
+            self.eigvals, self.eigvecs, lambda x: 1. / gs.sqrt(x))
+        self.inv = _symmetric_function(
+            self.eigvals, self.eigvecs, lambda x: 1. / x)
+
+
 class SPDMetric(RiemannianMetric):
+    """
+    Affine-invariant metric on the manifold of SPD matrices.
 
-    def __init__(self, n):
+    If cache_size is positive, the factors of the last cache_size
+    distinct base point arrays are kept, keyed by the identity and the
+    hash of the contents of the arrays, so that repeated calls at the
+    same base points, e.g. in iterative algorithms, reuse them.
+    """
+    def __init__(self, n, cache_size=0):
         super(SPDMetric, self).__init__(
                 dimension=int(n * (n + 1) / 2),
                 signature=(int(n * (n + 1) / 2), 0, 0))
         self.n = n
+        self.cache_size = cache_size
+        self.factors_cache = collections.OrderedDict()
+
+    def base_point_factors(self, base_point):
+        """
+        SPDBasePoint of base_point, from the cache when it is enabled.
+        """
+        if isinstance(base_point, SPDBasePoint):
+            return base_point
+        if self.cache_size <= 0:
+            return SPDBasePoint(base_point)
+
+        key = (id(base_point), hash(gs.array(base_point).tobytes()))
+        if key not in self.factors_cache:
+            self.factors_cache[key] = SPDBasePoint(base_point)
+        self.factors_cache.move_to_end(key)
+        while len(self.factors_cache) > self.cache_size:
+            self.factors_cache.popitem(last=False)
+        return self.factors_cache[key]
 
     def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
         """
@@ -135,8 +247,8 @@ class SPDMetric(RiemannianMetric):
         tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
         n_tangent_vecs_b, _, _ = tangent_vec_b.shape
 
-        base_point = gs.to_ndarray(base_point, to_ndim=3)
-        n_base_points, _, _ = base_point.shape
+        factors = self.base_point_factors(base_point)
+        n_base_points, _, _ = factors.point.shape
 
         assert (n_tangent_vecs_a == n_tangent_vecs_b == n_base_points
                 or n_tangent_vecs_a == n_tangent_vecs_b and n_base_points == 1
@@ -146,25 +258,8 @@ class SPDMetric(RiemannianMetric):
                 or n_base_points == 1 and n_tangent_vecs_a == 1
                 or n_base_points == 1 and n_tangent_vecs_b == 1)
 
-        if n_tangent_vecs_a == 1:
-            tangent_vec_a = gs.tile(
-                tangent_vec_a,
-                (gs.maximum(n_base_points, n_tangent_vecs_b), 1, 1))
-
-        if n_tangent_vecs_b == 1:
-            tangent_vec_b = gs.tile(
-                tangent_vec_b,
-                (gs.maximum(n_base_points, n_tangent_vecs_a), 1, 1))
-
-        if n_base_points == 1:
-            base_point = gs.tile(
-                base_point,
-                (gs.maximum(n_tangent_vecs_a, n_tangent_vecs_b), 1, 1))
-
-        inv_base_point = gs.linalg.inv(base_point)
-
-        aux_a = gs.matmul(inv_base_point, tangent_vec_a)
-        aux_b = gs.matmul(inv_base_point, tangent_vec_b)
+        aux_a = gs.matmul(factors.inv, tangent_vec_a)
+        aux_b = gs.matmul(factors.inv, tangent_vec_b)
         inner_product = gs.trace(gs.matmul(aux_a, aux_b), axis1=1, axis2=2)
         inner_product = gs.to_ndarray(inner_product, to_ndim=2, axis=1)
         return inner_product
@@ -180,30 +275,22 @@ class SPDMetric(RiemannianMetric):
         tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
         n_tangent_vecs, _, _ = tangent_vec.shape
 
-        base_point = gs.to_ndarray(base_point, to_ndim=3)
-        n_base_points, mat_dim, _ = base_point.shape
+        factors = self.base_point_factors(base_point)
+        n_base_points, _, _ = factors.point.shape
 
         assert (n_tangent_vecs == n_base_points
                 or n_tangent_vecs == 1
                 or n_base_points == 1)
 
-        if n_tangent_vecs == 1:
-            tangent_vec = gs.tile(tangent_vec, (n_base_points, 1, 1))
-        if n_base_points == 1:
-            base_point = gs.tile(base_point, (n_tangent_vecs, 1, 1))
-
-        sqrt_base_point = gs.linalg.sqrtm(base_point)
-
-        inv_sqrt_base_point = gs.linalg.inv(sqrt_base_point)
-
-        tangent_vec_at_id = gs.matmul(inv_sqrt_base_point,
+        tangent_vec_at_id = gs.matmul(factors.inv_sqrt,
                                       tangent_vec)
         tangent_vec_at_id = gs.matmul(tangent_vec_at_id,
-                                      inv_sqrt_base_point)
-        exp_from_id = gs.linalg.expm(tangent_vec_at_id)
+                                      factors.inv_sqrt)
+        eigvals, eigvecs = gs.linalg.eigh(tangent_vec_at_id)
+        exp_from_id = _symmetric_function(eigvals, eigvecs, gs.exp)
 
-        exp = gs.matmul(exp_from_id, sqrt_base_point)
-        exp = gs.matmul(sqrt_base_point, exp)
+        exp = gs.matmul(exp_from_id, factors.sqrt)
+        exp = gs.matmul(factors.sqrt, exp)
 
         return exp
 
@@ -217,33 +304,487 @@ class SPDMetric(RiemannianMetric):
         point = gs.to_ndarray(point, to_ndim=3)
         n_points, _, _ = point.shape
 
-        base_point = gs.to_ndarray(base_point, to_ndim=3)
-        n_base_points, mat_dim, _ = base_point.shape
+        factors = self.base_point_factors(base_point)
+        n_base_points, _, _ = factors.point.shape
 
         assert (n_points == n_base_points
                 or n_points == 1
                 or n_base_points == 1)
 
-        if n_points == 1:
-            point = gs.tile(point, (n_base_points, 1, 1))
-        if n_base_points == 1:
-            base_point = gs.tile(base_point, (n_points, 1, 1))
+        point_near_id = gs.matmul(factors.inv_sqrt, point)
+        point_near_id = gs.matmul(point_near_id, factors.inv_sqrt)
+        eigvals, eigvecs = gs.linalg.eigh(point_near_id)
+        log_at_id = _symmetric_function(eigvals, eigvecs, gs.log)
 
-        sqrt_base_point = gs.zeros((n_base_points,) + (mat_dim,) * 2)
-        sqrt_base_point = gs.linalg.sqrtm(base_point)
+        log = gs.matmul(factors.sqrt, log_at_id)
+        log = gs.matmul(log, factors.sqrt)
 
-        inv_sqrt_base_point = gs.linalg.inv(sqrt_base_point)
-        point_near_id = gs.matmul(inv_sqrt_base_point, point)
-        point_near_id = gs.matmul(point_near_id, inv_sqrt_base_point)
-        log_at_id = gs.linalg.logm(point_near_id)
+        return log
 
-        log = gs.matmul(sqrt_base_point, log_at_id)
-        log = gs.matmul(log, sqrt_base_point)
+    def squared_dist(self, point_a, point_b):
+        """
+        Squared geodesic distance between two points, factoring
+        point_a once for the logarithm and the norm.
+        """
+        return super(SPDMetric, self).squared_dist(
+            self.base_point_factors(point_a), point_b)
 
-        return log
+    def parallel_transport(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Closed-form parallel transport of tangent_vec_a along the geodesic
+        starting at base_point with initial tangent vector tangent_vec_b.
+
+        P(A) = E A E^T, where
+        E = S expm(S^{-1} B S^{-1} / 2) S^{-1} and S = sqrtm(base_point).
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=3)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
+        factors = self.base_point_factors(base_point)
+
+        half_tangent_vec_b_at_id = gs.matmul(
+            factors.inv_sqrt,
+            gs.matmul(tangent_vec_b / 2., factors.inv_sqrt))
+        eigvals, eigvecs = gs.linalg.eigh(half_tangent_vec_b_at_id)
+        congruence_mat = gs.matmul(
+            factors.sqrt,
+            gs.matmul(_symmetric_function(eigvals, eigvecs, gs.exp),
+                      factors.inv_sqrt))
+
+        transported_tangent_vec = gs.matmul(
+            congruence_mat,
+            gs.matmul(tangent_vec_a,
+                      gs.transpose(congruence_mat, axes=(0, 2, 1))))
+        return transported_tangent_vec
+
+    def mean(self, points, weights=None,
+             n_max_iterations=32, epsilon=EPSILON):
+        """
+        Frechet mean of (weighted) SPD matrices, by the fixed-point
+        iteration M <- M^{1/2} expm(sum_i w_i logm(M^{-1/2} P_i M^{-1/2}))
+        M^{1/2}, stopped when the norm of the mean of the logarithms
+        at the identity is below epsilon.
+        """
+        points = gs.to_ndarray(points, to_ndim=3)
+        n_points, _, _ = points.shape
+        weights = _normalized_weights(n_points, weights)
+
+        mean = points[:1]
+        for _ in range(n_max_iterations):
+            factors = SPDBasePoint(mean)
+            points_at_id = gs.matmul(
+                factors.inv_sqrt, gs.matmul(points, factors.inv_sqrt))
+            points_eigvals, points_eigvecs = gs.linalg.eigh(points_at_id)
+            logs_at_id = _symmetric_function(
+                points_eigvals, points_eigvecs, gs.log)
+            tangent_mean = gs.einsum('nk,nij->ij', weights, logs_at_id)
+            tangent_mean = gs.to_ndarray(tangent_mean, to_ndim=3)
+
+            tangent_eigvals, tangent_eigvecs = gs.linalg.eigh(tangent_mean)
+            mean = gs.matmul(factors.sqrt, gs.matmul(_symmetric_function(
+                tangent_eigvals, tangent_eigvecs, gs.exp), factors.sqrt))
+
+            if gs.sqrt(gs.sum(tangent_mean ** 2)) <= epsilon:
+                break
+
+        return mean
 
     def geodesic(self, initial_point, initial_tangent_vec):
         return super(SPDMetric, self).geodesic(
                                       initial_point=initial_point,
                                       initial_tangent_vec=initial_tangent_vec,
                                       point_type='matrix')
+
+
+class SPDMetricLogEuclidean(RiemannianMetric):
+    """
+    Log-Euclidean metric on the manifold of SPD matrices: the pullback
+    of the Frobenius inner product by the matrix logarithm.
+
+    The distances and the Frechet mean only require the logarithms
+    of the points, computed by symmetric eigendecompositions.
+    """
+    def __init__(self, n):
+        super(SPDMetricLogEuclidean, self).__init__(
+                dimension=int(n * (n + 1) / 2),
+                signature=(int(n * (n + 1) / 2), 0, 0))
+        self.n = n
+
+    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Frobenius inner product of the differentials of the matrix
+        logarithm at base_point applied to tangent_vec_a and tangent_vec_b.
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=3)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        eigvecs_transposed = gs.transpose(eigvecs, axes=(0, 2, 1))
+        coefficients = _log_divided_differences(eigvals)
+
+        aux_a = gs.matmul(eigvecs_transposed,
+                          gs.matmul(tangent_vec_a, eigvecs))
+        aux_b = gs.matmul(eigvecs_transposed,
+                          gs.matmul(tangent_vec_b, eigvecs))
+        inner_product = gs.sum(
+            coefficients ** 2 * aux_a * aux_b, axis=(1, 2))
+        inner_product = gs.to_ndarray(inner_product, to_ndim=2, axis=1)
+        return inner_product
+
+    def exp(self, tangent_vec, base_point):
+        """
+        Riemannian exponential expm(logm(P) + dlogm_P(X)).
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        log_base_point = _symmetric_function(eigvals, eigvecs, gs.log)
+        log_exp = log_base_point + _hadamard_in_eigenbasis(
+            tangent_vec, eigvecs, _log_divided_differences(eigvals))
+
+        exp_eigvals, exp_eigvecs = gs.linalg.eigh(log_exp)
+        return _symmetric_function(exp_eigvals, exp_eigvecs, gs.exp)
+
+    def log(self, point, base_point):
+        """
+        Riemannian logarithm dexpm_{logm(P)}(logm(Q) - logm(P)).
+
+        The differential of the matrix exponential at logm(P) is the
+        inverse of the differential of the matrix logarithm at P.
+        """
+        point = gs.to_ndarray(point, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        log_base_point = _symmetric_function(eigvals, eigvecs, gs.log)
+        point_eigvals, point_eigvecs = gs.linalg.eigh(point)
+        log_point = _symmetric_function(point_eigvals, point_eigvecs, gs.log)
+
+        return _hadamard_in_eigenbasis(
+            log_point - log_base_point, eigvecs,
+            1. / _log_divided_differences(eigvals))
+
+    def squared_dist(self, point_a, point_b):
+        """
+        Squared distance ||logm(A) - logm(B)||^2 in Frobenius norm.
+        """
+        point_a = gs.to_ndarray(point_a, to_ndim=3)
+        point_b = gs.to_ndarray(point_b, to_ndim=3)
+
+        eigvals_a, eigvecs_a = gs.linalg.eigh(point_a)
+        eigvals_b, eigvecs_b = gs.linalg.eigh(point_b)
+        log_diff = (_symmetric_function(eigvals_a, eigvecs_a, gs.log)
+                    - _symmetric_function(eigvals_b, eigvecs_b, gs.log))
+        sq_dist = gs.sum(log_diff ** 2, axis=(1, 2))
+        sq_dist = gs.to_ndarray(sq_dist, to_ndim=2, axis=1)
+        return sq_dist
+
+    def mean(self, points, weights=None):
+        """
+        Frechet mean of (weighted) points, in closed form as the matrix
+        exponential of the mean of the logarithms.
+        """
+        points = gs.to_ndarray(points, to_ndim=3)
+        n_points, _, _ = points.shape
+        weights = _normalized_weights(n_points, weights)
+
+        eigvals, eigvecs = gs.linalg.eigh(points)
+        logs = _symmetric_function(eigvals, eigvecs, gs.log)
+        log_mean = gs.einsum('nk,nij->ij', weights, logs)
+        log_mean = gs.to_ndarray(log_mean, to_ndim=3)
+
+        mean_eigvals, mean_eigvecs = gs.linalg.eigh(log_mean)
+        return _symmetric_function(mean_eigvals, mean_eigvecs, gs.exp)
+
+    def geodesic(self, initial_point, initial_tangent_vec):
+        return super(SPDMetricLogEuclidean, self).geodesic(
+                                      initial_point=initial_point,
+                                      initial_tangent_vec=initial_tangent_vec,
+                                      point_type='matrix')
+
+
+class SPDMetricBuresWasserstein(RiemannianMetric):
+    """
+    Bures-Wasserstein metric on the manifold of SPD matrices, whose
+    distance is the L2-Wasserstein distance between centered Gaussian
+    distributions with these covariance matrices.
+
+    The inner product at P is 1/2 tr(L_P(X) Y), where L_P(X) solves
+    the Lyapunov equation P L + L P = X.
+    """
+    def __init__(self, n):
+        super(SPDMetricBuresWasserstein, self).__init__(
+                dimension=int(n * (n + 1) / 2),
+                signature=(int(n * (n + 1) / 2), 0, 0))
+        self.n = n
+
+    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Inner product 1/2 tr(L_P(X) Y) of tangent_vec_a and tangent_vec_b
+        at base_point, computed in the eigenbasis of base_point.
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=3)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        eigvecs_transposed = gs.transpose(eigvecs, axes=(0, 2, 1))
+        sum_eigvals = (gs.expand_dims(eigvals, axis=2)
+                       + gs.expand_dims(eigvals, axis=1))
+
+        aux_a = gs.matmul(eigvecs_transposed,
+                          gs.matmul(tangent_vec_a, eigvecs))
+        aux_b = gs.matmul(eigvecs_transposed,
+                          gs.matmul(tangent_vec_b, eigvecs))
+        inner_product = gs.sum(aux_a * aux_b / sum_eigvals, axis=(1, 2)) / 2.
+        inner_product = gs.to_ndarray(inner_product, to_ndim=2, axis=1)
+        return inner_product
+
+    def exp(self, tangent_vec, base_point):
+        """
+        Riemannian exponential P + X + L_P(X) P L_P(X).
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        sum_eigvals = (gs.expand_dims(eigvals, axis=2)
+                       + gs.expand_dims(eigvals, axis=1))
+        lyapunov = _hadamard_in_eigenbasis(
+            tangent_vec, eigvecs, 1. / sum_eigvals)
+
+        return (base_point + tangent_vec
+                + gs.matmul(lyapunov, gs.matmul(base_point, lyapunov)))
+
+    def log(self, point, base_point):
+        """
+        Riemannian logarithm (P Q)^{1/2} + (Q P)^{1/2} - 2 P, with
+        (P Q)^{1/2} = P^{1/2} (P^{1/2} Q P^{1/2})^{1/2} P^{-1/2}.
+        """
+        point = gs.to_ndarray(point, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(base_point)
+        sqrt_base_point = _symmetric_function(eigvals, eigvecs, gs.sqrt)
+        inv_sqrt_base_point = _symmetric_function(
+            eigvals, eigvecs, lambda x: 1. / gs.sqrt(x))
+
+        aux = gs.matmul(sqrt_base_point, gs.matmul(point, sqrt_base_point))
+        aux_eigvals, aux_eigvecs = gs.linalg.eigh(aux)
+        sqrt_aux = _symmetric_function(
+            aux_eigvals, aux_eigvecs, lambda x: gs.sqrt(gs.maximum(x, 0.)))
+
+        sqrt_product = gs.matmul(
+            sqrt_base_point, gs.matmul(sqrt_aux, inv_sqrt_base_point))
+        return (sqrt_product + gs.transpose(sqrt_product, axes=(0, 2, 1))
+                - 2. * base_point)
+
+    def squared_dist(self, point_a, point_b):
+        """
+        Squared distance tr(A) + tr(B) - 2 tr((A^{1/2} B A^{1/2})^{1/2}).
+        """
+        point_a = gs.to_ndarray(point_a, to_ndim=3)
+        point_b = gs.to_ndarray(point_b, to_ndim=3)
+
+        eigvals, eigvecs = gs.linalg.eigh(point_a)
+        sqrt_point_a = _symmetric_function(eigvals, eigvecs, gs.sqrt)
+        aux = gs.matmul(sqrt_point_a, gs.matmul(point_b, sqrt_point_a))
+        aux_eigvals = gs.linalg.eigvalsh(aux)
+
+        sq_dist = (gs.trace(point_a, axis1=1, axis2=2)
+                   + gs.trace(point_b, axis1=1, axis2=2)
+                   - 2. * gs.sum(gs.sqrt(gs.maximum(aux_eigvals, 0.)),
+                                 axis=1))
+        sq_dist = gs.maximum(sq_dist, 0.)
+        sq_dist = gs.to_ndarray(sq_dist, to_ndim=2, axis=1)
+        return sq_dist
+
+    def mean(self, points, weights=None,
+             n_max_iterations=32, epsilon=EPSILON):
+        """
+        Frechet mean of (weighted) points, by the fixed-point iteration
+        M <- M^{-1/2} (sum_i w_i (M^{1/2} P_i M^{1/2})^{1/2})^2 M^{-1/2},
+        stopped when the relative change of M in Frobenius norm is below
+        epsilon.
+        """
+        points = gs.to_ndarray(points, to_ndim=3)
+        n_points, _, _ = points.shape
+        weights = _normalized_weights(n_points, weights)
+
+        mean = gs.einsum('nk,nij->ij', weights, points)
+        mean = gs.to_ndarray(mean, to_ndim=3)
+        for _ in range(n_max_iterations):
+            eigvals, eigvecs = gs.linalg.eigh(mean)
+            sqrt_mean = _symmetric_function(eigvals, eigvecs, gs.sqrt)
+            inv_sqrt_mean = _symmetric_function(
+                eigvals, eigvecs, lambda x: 1. / gs.sqrt(x))
+
+            aux = gs.matmul(sqrt_mean, gs.matmul(points, sqrt_mean))
+            aux_eigvals, aux_eigvecs = gs.linalg.eigh(aux)
+            sqrt_aux = _symmetric_function(
+                aux_eigvals, aux_eigvecs,
+                lambda x: gs.sqrt(gs.maximum(x, 0.)))
+            sqrt_aux_mean = gs.einsum('nk,nij->ij', weights, sqrt_aux)
+            sqrt_aux_mean = gs.to_ndarray(sqrt_aux_mean, to_ndim=3)
+
+            mean_next = gs.matmul(inv_sqrt_mean, gs.matmul(
+                gs.matmul(sqrt_aux_mean, sqrt_aux_mean), inv_sqrt_mean))
+            mean_next = (mean_next
+                         + gs.transpose(mean_next, axes=(0, 2, 1))) / 2.
+
+            change = gs.sqrt(gs.sum((mean_next - mean) ** 2))
+            mean = mean_next
+            if change <= epsilon * gs.sqrt(gs.sum(mean ** 2)):
+                break
+
+        return mean
+
+    def geodesic(self, initial_point, initial_tangent_vec):
+        return super(SPDMetricBuresWasserstein, self).geodesic(
+                                      initial_point=initial_point,
+                                      initial_tangent_vec=initial_tangent_vec,
+                                      point_type='matrix')
+
+
+class SPDMetricLogCholesky(RiemannianMetric):
+    """
+    Log-Cholesky metric on the manifold of SPD matrices, pulled back by
+    the Cholesky factorization P = L L^T from the metric on lower
+    triangular matrices with positive diagonals
+    sum_{i>j} X_ij Y_ij + sum_j X_jj Y_jj / L_jj^2.
+
+    Its geodesics, distances and Frechet mean are in closed form.
+    """
+    def __init__(self, n):
+        super(SPDMetricLogCholesky, self).__init__(
+                dimension=int(n * (n + 1) / 2),
+                signature=(int(n * (n + 1) / 2), 0, 0))
+        self.n = n
+
+    def tangent_vec_to_cholesky(self, tangent_vec, cholesky_factor):
+        """
+        Differential of the Cholesky factorization at P = L L^T applied
+        to tangent_vec: L (L^{-1} X L^{-T})_{1/2}, where (.)_{1/2} keeps
+        the strictly lower triangular part and half the diagonal.
+        """
+        aux = gs.linalg.solve(
+            cholesky_factor,
+            gs.transpose(gs.linalg.solve(cholesky_factor, tangent_vec),
+                         axes=(0, 2, 1)))
+        half_lower = gs.tril(aux, k=-1) + gs.eye(self.n) * aux / 2.
+        return gs.matmul(cholesky_factor, half_lower)
+
+    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
+        """
+        Inner product of tangent_vec_a and tangent_vec_b at base_point,
+        from the metric on the Cholesky factors.
+        """
+        tangent_vec_a = gs.to_ndarray(tangent_vec_a, to_ndim=3)
+        tangent_vec_b = gs.to_ndarray(tangent_vec_b, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        cholesky_factor = gs.linalg.cholesky(base_point)
+        aux_a = self.tangent_vec_to_cholesky(tangent_vec_a, cholesky_factor)
+        aux_b = self.tangent_vec_to_cholesky(tangent_vec_b, cholesky_factor)
+
+        diag_factor = gs.diagonal(cholesky_factor, axis1=1, axis2=2)
+        diag_a = gs.diagonal(aux_a, axis1=1, axis2=2)
+        diag_b = gs.diagonal(aux_b, axis1=1, axis2=2)
+        inner_product = (
+            gs.sum(gs.tril(aux_a, k=-1) * gs.tril(aux_b, k=-1), axis=(1, 2))
+            + gs.sum(diag_a * diag_b / diag_factor ** 2, axis=1))
+        inner_product = gs.to_ndarray(inner_product, to_ndim=2, axis=1)
+        return inner_product
+
+    def exp(self, tangent_vec, base_point):
+        """
+        Riemannian exponential K K^T, where the Cholesky factor
+        K = [L] + [X_L] + D(L) exp(D(X_L) / D(L)) moves the strictly lower
+        triangular part [.] linearly and the diagonal D(.) geometrically.
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        cholesky_factor = gs.linalg.cholesky(base_point)
+        tangent_vec_at_factor = self.tangent_vec_to_cholesky(
+            tangent_vec, cholesky_factor)
+
+        diag_factor = gs.diagonal(cholesky_factor, axis1=1, axis2=2)
+        diag_tangent_vec = gs.diagonal(
+            tangent_vec_at_factor, axis1=1, axis2=2)
+        exp_factor = (
+            gs.tril(cholesky_factor, k=-1)
+            + gs.tril(tangent_vec_at_factor, k=-1)
+            + _diagonal_matrix(
+                diag_factor * gs.exp(diag_tangent_vec / diag_factor)))
+        return gs.matmul(exp_factor, gs.transpose(exp_factor, axes=(0, 2, 1)))
+
+    def log(self, point, base_point):
+        """
+        Riemannian logarithm L Y^T + Y L^T, image of the logarithm
+        Y = [K] - [L] + D(L) log(D(K) / D(L)) between the Cholesky
+        factors L of base_point and K of point.
+        """
+        point = gs.to_ndarray(point, to_ndim=3)
+        base_point = gs.to_ndarray(base_point, to_ndim=3)
+
+        cholesky_factor = gs.linalg.cholesky(base_point)
+        point_factor = gs.linalg.cholesky(point)
+
+        diag_factor = gs.diagonal(cholesky_factor, axis1=1, axis2=2)
+        diag_point_factor = gs.diagonal(point_factor, axis1=1, axis2=2)
+        log_at_factor = (
+            gs.tril(point_factor, k=-1) - gs.tril(cholesky_factor, k=-1)
+            + _diagonal_matrix(
+                diag_factor * gs.log(diag_point_factor / diag_factor)))
+
+        log = gs.matmul(cholesky_factor,
+                        gs.transpose(log_at_factor, axes=(0, 2, 1)))
+        return log + gs.transpose(log, axes=(0, 2, 1))
+
+    def squared_dist(self, point_a, point_b):
+        """
+        Squared distance ||[K] - [L]||^2 + ||log D(K) - log D(L)||^2
+        between the Cholesky factors of the points.
+        """
+        factor_a = gs.linalg.cholesky(gs.to_ndarray(point_a, to_ndim=3))
+        factor_b = gs.linalg.cholesky(gs.to_ndarray(point_b, to_ndim=3))
+
+        diff_lower = gs.tril(factor_a, k=-1) - gs.tril(factor_b, k=-1)
+        diff_log_diag = (
+            gs.log(gs.diagonal(factor_a, axis1=1, axis2=2))
+            - gs.log(gs.diagonal(factor_b, axis1=1, axis2=2)))
+        sq_dist = (gs.sum(diff_lower ** 2, axis=(1, 2))
+                   + gs.sum(diff_log_diag ** 2, axis=1))
+        sq_dist = gs.to_ndarray(sq_dist, to_ndim=2, axis=1)
+        return sq_dist
+
+    def mean(self, points, weights=None):
+        """
+        Frechet mean of (weighted) points, in closed form from the
+        arithmetic mean of the strictly lower triangular parts and the
+        geometric mean of the diagonals of the Cholesky factors.
+        """
+        points = gs.to_ndarray(points, to_ndim=3)
+        n_points, _, _ = points.shape
+        weights = _normalized_weights(n_points, weights)
+
+        factors = gs.linalg.cholesky(points)
+        lower_mean = gs.einsum(
+            'nk,nij->ij', weights, gs.tril(factors, k=-1))
+        log_diag_mean = gs.einsum(
+            'nk,nj->j', weights,
+            gs.log(gs.diagonal(factors, axis1=1, axis2=2)))
+
+        mean_factor = (gs.to_ndarray(lower_mean, to_ndim=3)
+                       + _diagonal_matrix(
+                           gs.to_ndarray(gs.exp(log_diag_mean), to_ndim=2)))
+        return gs.matmul(mean_factor,
+                         gs.transpose(mean_factor, axes=(0, 2, 1)))
+
+    def geodesic(self, initial_point, initial_tangent_vec):
+        return super(SPDMetricLogCholesky, self).geodesic(
+                                      initial_point=initial_point,
+                                      initial_tangent_vec=initial_tangent_vec,
+                                      point_type='matrix')
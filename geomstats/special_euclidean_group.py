@@ -37,6 +37,12 @@ class SpecialEuclideanGroup(LieGroup):
     """
     Class for the special euclidean group SE(n),
     i.e. the Lie group of rigid transformations.
+
+    Points can be represented as vectors concatenating a rotation vector
+    and a translation, in 3D (point_type='vector'), or as homogeneous
+    matrices of size n + 1 (point_type='matrix'). The tangent vectors
+    of the matrix representation are matrices of size n + 1, and are
+    elements of the Lie algebra at the identity.
     """
 
     def __init__(self, n, point_type=None, epsilon=0.):
@@ -56,6 +62,7 @@ class SpecialEuclideanGroup(LieGroup):
 
         self.rotations = SpecialOrthogonalGroup(n=n, epsilon=epsilon)
         self.translations = EuclideanSpace(dimension=n)
+        self.rotation_metrics = {}
 
     def get_identity(self, point_type=None):
         """
@@ -67,8 +74,8 @@ class SpecialEuclideanGroup(LieGroup):
             point_type = self.default_point_type
 
         identity = gs.zeros(self.dimension)
-        if self.default_point_type == 'matrix':
-            identity = gs.eye(self.n)
+        if point_type == 'matrix':
+            identity = gs.eye(self.n + 1)
         return identity
     identity = property(get_identity)
 
@@ -88,10 +95,93 @@ class SpecialEuclideanGroup(LieGroup):
             belongs = gs.tile(belongs, (n_points, 1))
         elif point_type == 'matrix':
             point = gs.to_ndarray(point, to_ndim=3)
-            raise NotImplementedError()
+            n_points, mat_dim_1, mat_dim_2 = point.shape
+            if mat_dim_1 != self.n + 1 or mat_dim_2 != self.n + 1:
+                return gs.zeros((n_points, 1), dtype=bool)
+
+            last_line = gs.concatenate([gs.zeros(self.n), gs.ones(1)])
+            mask_last_line = gs.all(
+                gs.isclose(point[:, self.n, :], last_line), axis=1)
+            mask_last_line = gs.to_ndarray(mask_last_line, to_ndim=2, axis=1)
+            belongs = mask_last_line & self.rotations.belongs(
+                self.rotation_block(point), point_type='matrix')
 
         return belongs
 
+    def rotation_block(self, point):
+        """
+        Return the rotation block of homogeneous matrices,
+        as a view on point.
+        """
+        point = gs.to_ndarray(point, to_ndim=3)
+        return point[:, :self.n, :self.n]
+
+    def translation_column(self, point):
+        """
+        Return the translation column of homogeneous matrices,
+        as a view on point.
+        """
+        point = gs.to_ndarray(point, to_ndim=3)
+        return point[:, :self.n, self.n]
+
+    def homogeneous_matrix(self, rot_mat, translation):
+        """
+        Build homogeneous matrices from rotation matrices
+        and translation vectors.
+        """
+        rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
+        translation = gs.to_ndarray(translation, to_ndim=2)
+        n_points = max(rot_mat.shape[0], translation.shape[0])
+        if rot_mat.shape[0] == 1:
+            rot_mat = gs.tile(rot_mat, (n_points, 1, 1))
+        if translation.shape[0] == 1:
+            translation = gs.tile(translation, (n_points, 1))
+
+        last_line = gs.concatenate([gs.zeros(self.n), gs.ones(1)])
+        last_line = gs.tile(
+            gs.reshape(last_line, (1, 1, self.n + 1)), (n_points, 1, 1))
+        mat = gs.concatenate(
+            [rot_mat, gs.expand_dims(translation, axis=2)], axis=2)
+        return gs.concatenate([mat, last_line], axis=1)
+
+    def matrix_from_vector(self, point):
+        """
+        Convert points of SE(3) from the vector representation
+        to the homogeneous matrix representation.
+        """
+        assert self.n == 3, ('The vector representation is only'
+                             ' implemented for SE(3).')
+        point = self.regularize(point, point_type='vector')
+        dim_rotations = self.rotations.dimension
+        rot_mat = self.rotations.matrix_from_rotation_vector(
+            point[:, :dim_rotations])
+        return self.homogeneous_matrix(rot_mat, point[:, dim_rotations:])
+
+    def vector_from_matrix(self, point):
+        """
+        Convert points of SE(3) from the homogeneous matrix representation
+        to the vector representation.
+        """
+        assert self.n == 3, ('The vector representation is only'
+                             ' implemented for SE(3).')
+        point = gs.to_ndarray(point, to_ndim=3)
+        rot_vec = self.rotations.rotation_vector_from_matrix(
+            self.rotation_block(point))
+        vector = gs.concatenate(
+            [rot_vec, self.translation_column(point)], axis=1)
+        return self.regularize(vector, point_type='vector')
+
+    def vector_from_lie_algebra(self, tangent_vec):
+        """
+        Compute the coordinates of the rotation blocks, followed by the
+        translation columns, of matrices of the Lie algebra se(n).
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        rot_vec = self.rotations.vector_from_lie_algebra(
+            self.rotation_block(tangent_vec))
+        return gs.concatenate(
+            [rot_vec, self.translation_column(tangent_vec)], axis=1)
+
     def regularize(self, point, point_type=None):
         """
         Regularize a point to the canonical representation
@@ -147,12 +237,7 @@ class SpecialEuclideanGroup(LieGroup):
             rot_tangent_vec = tangent_vec[:, :dim_rotations]
             rot_base_point = base_point[:, :dim_rotations]
 
-            metric_mat = metric.inner_product_mat_at_identity
-            rot_metric_mat = metric_mat[:, :dim_rotations, :dim_rotations]
-            rot_metric = InvariantMetric(
-                               group=rotations,
-                               inner_product_mat_at_identity=rot_metric_mat,
-                               left_or_right=metric.left_or_right)
+            rot_metric = self.rotation_metric(metric)
 
             regularized_vec = gs.zeros_like(tangent_vec)
             rotations_vec = rotations.regularize_tangent_vec(
@@ -169,6 +254,21 @@ class SpecialEuclideanGroup(LieGroup):
 
         return regularized_vec
 
+    def rotation_metric(self, metric):
+        """
+        Restriction of an invariant metric to the rotations, which is
+        only created, and factored, once for each metric.
+        """
+        if metric not in self.rotation_metrics:
+            dim_rotations = self.rotations.dimension
+            metric_mat = metric.inner_product_mat_at_identity
+            rot_metric_mat = metric_mat[:, :dim_rotations, :dim_rotations]
+            self.rotation_metrics[metric] = InvariantMetric(
+                group=self.rotations,
+                inner_product_mat_at_identity=rot_metric_mat,
+                left_or_right=metric.left_or_right)
+        return self.rotation_metrics[metric]
+
     def compose(self, point_1, point_2, point_type=None):
         """
         Compose two elements of SE(n).
@@ -206,14 +306,12 @@ class SpecialEuclideanGroup(LieGroup):
             rot_mat_1 = rotations.matrix_from_rotation_vector(rot_vec_1)
 
             rot_vec_2 = point_2[:, :dim_rotations]
-            rot_mat_2 = rotations.matrix_from_rotation_vector(rot_vec_2)
 
             translation_1 = point_1[:, dim_rotations:]
             translation_2 = point_2[:, dim_rotations:]
 
-            composition_rot_mat = gs.matmul(rot_mat_1, rot_mat_2)
-            composition_rot_vec = rotations.rotation_vector_from_matrix(
-                                                          composition_rot_mat)
+            composition_rot_vec = rotations.compose(
+                rot_vec_1, rot_vec_2, point_type=point_type)
 
             composition_translation = gs.einsum('ij,ikj->ik', translation_2,
                                                 rot_mat_1) + translation_1
@@ -222,7 +320,7 @@ class SpecialEuclideanGroup(LieGroup):
                                           composition_translation), axis=1)
 
         elif point_type == 'matrix':
-            raise NotImplementedError()
+            composition = gs.matmul(point_1, point_2)
 
         composition = self.regularize(composition, point_type=point_type)
         return composition
@@ -240,7 +338,7 @@ class SpecialEuclideanGroup(LieGroup):
         rotations = self.rotations
         dim_rotations = rotations.dimension
 
-        point = self.regularize(point)
+        point = self.regularize(point, point_type=point_type)
 
         if point_type == 'vector':
             n_points, _ = point.shape
@@ -263,7 +361,12 @@ class SpecialEuclideanGroup(LieGroup):
                 [inverse_rotation, inverse_translation], axis=1)
 
         elif point_type == 'matrix':
-            raise NotImplementedError()
+            inv_rot_mat = gs.transpose(
+                self.rotation_block(point), axes=(0, 2, 1))
+            inverse_translation = - gs.einsum(
+                'nij,nj->ni', inv_rot_mat, self.translation_column(point))
+            inverse_point = self.homogeneous_matrix(
+                inv_rot_mat, inverse_translation)
 
         inverse_point = self.regularize(inverse_point, point_type=point_type)
         return inverse_point
@@ -329,6 +432,62 @@ class SpecialEuclideanGroup(LieGroup):
 
         return jacobian
 
+    def inverse_jacobian_translation(
+            self, point, left_or_right='left', point_type=None):
+        """
+        Compute the inverse of the jacobian matrix of the differential
+        of the left/right translations from the identity to point in SE(n).
+
+        The inverse is block triangular, with the inverse jacobian of SO(n)
+        as rotation block and, as translation block, the transposed
+        rotation matrix for the left translation or the identity for the
+        right translation, whose lower-left block is then the product of
+        the skew-symmetric matrix of the rotation vector with the former.
+        """
+        if point_type is None:
+            point_type = self.default_point_type
+
+        assert left_or_right in ('left', 'right')
+
+        if point_type == 'matrix':
+            raise NotImplementedError()
+
+        rotations = self.rotations
+        dim_rotations = rotations.dimension
+        dim_translations = self.translations.dimension
+
+        point = self.regularize(point, point_type=point_type)
+        n_points, _ = point.shape
+        rot_vec = point[:, :dim_rotations]
+
+        inv_jacobian_rot = rotations.inverse_jacobian_translation(
+            point=rot_vec,
+            left_or_right=left_or_right,
+            point_type=point_type)
+        block_zeros_1 = gs.zeros(
+            (n_points, dim_rotations, dim_translations))
+        inv_jacobian_block_line_1 = gs.concatenate(
+            [inv_jacobian_rot, block_zeros_1], axis=2)
+
+        if left_or_right == 'left':
+            rot_mat = rotations.matrix_from_rotation_vector(rot_vec)
+            block_zeros_2 = gs.zeros(
+                (n_points, dim_translations, dim_rotations))
+            inv_jacobian_block_line_2 = gs.concatenate(
+                [block_zeros_2, gs.transpose(rot_mat, axes=(0, 2, 1))],
+                axis=2)
+
+        else:
+            skew_mat = rotations.skew_matrix_from_vector(rot_vec)
+            eye = gs.tile(
+                gs.to_ndarray(gs.eye(self.n), to_ndim=3), [n_points, 1, 1])
+            inv_jacobian_block_line_2 = gs.concatenate(
+                [gs.matmul(skew_mat, inv_jacobian_rot), eye], axis=2)
+
+        inv_jacobian = gs.concatenate(
+            [inv_jacobian_block_line_1, inv_jacobian_block_line_2], axis=1)
+        return inv_jacobian
+
     def group_exp_from_identity(self, tangent_vec, point_type=None):
         """
         Compute the group exponential of the tangent vector at the identity.
@@ -382,25 +541,57 @@ class SpecialEuclideanGroup(LieGroup):
             coef_1 += mask_else_float * ((1. - gs.cos(angle)) / angle ** 2)
             coef_2 += mask_else_float * ((angle - gs.sin(angle)) / angle ** 3)
 
-            n_tangent_vecs, _ = tangent_vec.shape
-            group_exp_translation = gs.zeros((n_tangent_vecs, self.n))
-            for i in range(n_tangent_vecs):
-                translation_i = translation[i]
-                term_1_i = coef_1[i] * gs.dot(translation_i,
-                                              gs.transpose(skew_mat[i]))
-                term_2_i = coef_2[i] * gs.dot(translation_i,
-                                              gs.transpose(sq_skew_mat[i]))
-                mask_i_float = gs.get_mask_i_float(i, n_tangent_vecs)
-                group_exp_translation += mask_i_float * (
-                    translation_i + term_1_i + term_2_i)
+            group_exp_translation = (
+                translation
+                + coef_1 * gs.einsum('nij,nj->ni', skew_mat, translation)
+                + coef_2 * gs.einsum('nij,nj->ni', sq_skew_mat, translation))
 
             group_exp = gs.concatenate(
                 [rot_vec, group_exp_translation], axis=1)
 
             group_exp = self.regularize(group_exp, point_type=point_type)
             return group_exp
+
         elif point_type == 'matrix':
-            raise NotImplementedError()
+            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+            if self.n != 3:
+                return gs.linalg.expm(tangent_vec)
+
+            rotations = self.rotations
+            skew_mat = self.rotation_block(tangent_vec)
+            translation = self.translation_column(tangent_vec)
+            rot_vec = rotations.vector_from_skew_matrix(skew_mat)
+            sq_skew_mat = gs.matmul(skew_mat, skew_mat)
+
+            # The rotation vector is not regularized, so that this is
+            # the matrix exponential for all angles.
+            angle = gs.linalg.norm(rot_vec, axis=1)
+            mask_close_0 = gs.isclose(angle, 0.)
+            # This avoids dividing by 0.
+            safe_angle = gs.where(mask_close_0, gs.ones_like(angle), angle)
+            coef_1 = gs.where(
+                mask_close_0,
+                TAYLOR_COEFFS_1_AT_0[0]
+                + TAYLOR_COEFFS_1_AT_0[2] * angle ** 2
+                + TAYLOR_COEFFS_1_AT_0[4] * angle ** 4
+                + TAYLOR_COEFFS_1_AT_0[6] * angle ** 6,
+                (1. - gs.cos(safe_angle)) / safe_angle ** 2)
+            coef_2 = gs.where(
+                mask_close_0,
+                TAYLOR_COEFFS_2_AT_0[0]
+                + TAYLOR_COEFFS_2_AT_0[2] * angle ** 2
+                + TAYLOR_COEFFS_2_AT_0[4] * angle ** 4
+                + TAYLOR_COEFFS_2_AT_0[6] * angle ** 6,
+                (safe_angle - gs.sin(safe_angle)) / safe_angle ** 3)
+
+            rot_mat = rotations.matrix_from_rotation_vector(rot_vec)
+            group_exp_translation = (
+                translation
+                + gs.einsum(
+                    'n,nij,nj->ni', coef_1, skew_mat, translation)
+                + gs.einsum(
+                    'n,nij,nj->ni', coef_2, sq_skew_mat, translation))
+            return self.homogeneous_matrix(rot_mat, group_exp_translation)
 
     def group_log_from_identity(self, point, point_type=None):
         """
@@ -462,17 +653,11 @@ class SpecialEuclideanGroup(LieGroup):
             psi = 0.5 * angle * gs.sin(angle) / (1 - gs.cos(angle))
             coef_2 += mask_else_float * (1 - psi) / (angle ** 2)
 
-            n_points, _ = point.shape
-            group_log_translation = gs.zeros((n_points, self.n))
-            for i in range(n_points):
-                translation_i = translation[i]
-                term_1_i = coef_1[i] * gs.dot(translation_i,
-                                              gs.transpose(skew_rot_vec[i]))
-                term_2_i = coef_2[i] * gs.dot(translation_i,
-                                              gs.transpose(sq_skew_rot_vec[i]))
-                mask_i_float = gs.get_mask_i_float(i, n_points)
-                group_log_translation += mask_i_float * (
-                    translation_i + term_1_i + term_2_i)
+            group_log_translation = (
+                translation
+                + coef_1 * gs.einsum('nij,nj->ni', skew_rot_vec, translation)
+                + coef_2 * gs.einsum(
+                    'nij,nj->ni', sq_skew_rot_vec, translation))
 
             group_log = gs.concatenate(
                 [rot_vec, group_log_translation], axis=1)
@@ -480,28 +665,50 @@ class SpecialEuclideanGroup(LieGroup):
             assert gs.ndim(group_log) == 2
 
         elif point_type == 'matrix':
-            raise NotImplementedError()
+            if self.n != 3:
+                return gs.linalg.logm(point)
+
+            vector_log = self.group_log_from_identity(
+                self.vector_from_matrix(point), point_type='vector')
+            skew_mat = rotations.skew_matrix_from_vector(
+                vector_log[:, :dim_rotations])
+            translation = gs.expand_dims(
+                vector_log[:, dim_rotations:], axis=2)
+            n_points, _ = vector_log.shape
+            last_line = gs.zeros((n_points, 1, self.n + 1))
+            group_log = gs.concatenate(
+                [gs.concatenate([skew_mat, translation], axis=2),
+                 last_line], axis=1)
 
         return group_log
 
-    def random_uniform(self, n_samples=1, point_type=None):
+    def random_uniform(self, n_samples=1, point_type=None, rng=None):
         """
-        Sample in SE(n) with the uniform distribution.
+        Sample in SE(n), with the Haar measure on the rotations
+        and the uniform distribution on the cube [-1, 1]^n
+        for the translations.
+
+        The random numbers are drawn from the random generator rng if it is
+        given, and from the global random state otherwise.
         """
         if point_type is None:
             point_type = self.default_point_type
 
-        random_rot_vec = self.rotations.random_uniform(
-            n_samples, point_type=point_type)
-        random_translation = self.translations.random_uniform(n_samples)
+        random_rotation = self.rotations.random_uniform(
+            n_samples, point_type=point_type, rng=rng)
+        if rng is None:
+            random_translation = self.translations.random_uniform(n_samples)
+        else:
+            random_translation = 2. * rng.random((n_samples, self.n)) - 1.
 
         if point_type == 'vector':
             random_transfo = gs.concatenate(
-                [random_rot_vec, random_translation],
+                [random_rotation, random_translation],
                 axis=1)
 
         elif point_type == 'matrix':
-            raise NotImplementedError()
+            random_transfo = self.homogeneous_matrix(
+                random_rotation, random_translation)
 
         random_transfo = self.regularize(random_transfo, point_type=point_type)
         return random_transfo
@@ -512,7 +719,6 @@ class SpecialEuclideanGroup(LieGroup):
         """
 
         rot_vec = self.rotations.regularize(rot_vec)
-        n_rot_vecs, _ = rot_vec.shape
 
         angle = gs.linalg.norm(rot_vec, axis=1)
         angle = gs.to_ndarray(angle, to_ndim=2, axis=1)
@@ -531,7 +737,7 @@ class SpecialEuclideanGroup(LieGroup):
         coef_1[mask_close_to_0] = (1. / 2.
                                    - angle[mask_close_to_0] ** 2 / 24.)
         coef_2[mask_close_to_0] = (1. / 6.
-                                   - angle[mask_close_to_0] ** 3 / 120.)
+                                   - angle[mask_close_to_0] ** 2 / 120.)
 
         # TODO(nina): Check if the discountinuity at 0 is expected.
         coef_1[mask_0] = 0
@@ -543,12 +749,10 @@ class SpecialEuclideanGroup(LieGroup):
                              * (1. - (gs.sin(angle[mask_else])
                                       / angle[mask_else])))
 
-        term_1 = gs.zeros((n_rot_vecs, self.n, self.n))
-        term_2 = gs.zeros_like(term_1)
-
-        for i in range(n_rot_vecs):
-            term_1[i] = gs.eye(self.n) + skew_rot_vec[i] * coef_1[i]
-            term_2[i] = gs.matmul(skew_rot_vec[i], skew_rot_vec[i]) * coef_2[i]
+        sq_skew_rot_vec = gs.matmul(skew_rot_vec, skew_rot_vec)
+        term_1 = gs.eye(self.n) + gs.einsum(
+            'n,nij->nij', coef_1[:, 0], skew_rot_vec)
+        term_2 = gs.einsum('n,nij->nij', coef_2[:, 0], sq_skew_rot_vec)
 
         exponential_mat = term_1 + term_2
         assert exponential_mat.ndim == 3
@@ -589,9 +793,6 @@ class SpecialEuclideanGroup(LieGroup):
             mean_rotation_mat = rotations.matrix_from_rotation_vector(
                         mean_rotation)
 
-            matrix = gs.zeros((1,) + (self.n,) * 2)
-            translation_aux = gs.zeros((1, self.n))
-
             inv_rot_mats = rotations.matrix_from_rotation_vector(
                     -rotation_vectors)
             matrix_aux = gs.matmul(mean_rotation_mat, inv_rot_mats)
@@ -601,12 +802,12 @@ class SpecialEuclideanGroup(LieGroup):
             matrix_aux = self.exponential_matrix(vec_aux)
             matrix_aux = gs.linalg.inv(matrix_aux)
 
-            for i in range(n_points):
-                matrix += weights[i] * matrix_aux[i]
-                translation_aux += weights[i] * gs.dot(gs.matmul(
-                                                            matrix_aux[i],
-                                                            inv_rot_mats[i]),
-                                                       translations[i])
+            matrix = gs.einsum('n,nij->ij', weights[:, 0], matrix_aux)
+            matrix = gs.to_ndarray(matrix, to_ndim=3)
+            translation_aux = gs.einsum(
+                'n,nij,njk,nk->i',
+                weights[:, 0], matrix_aux, inv_rot_mats, translations)
+            translation_aux = gs.to_ndarray(translation_aux, to_ndim=2)
 
             mean_translation = gs.dot(translation_aux,
                                       gs.transpose(gs.linalg.inv(matrix),
@@ -617,8 +818,8 @@ class SpecialEuclideanGroup(LieGroup):
             exp_bar[0, dim_rotations:dim] = mean_translation
 
         elif point_type == 'matrix':
-            vector_points = self.rotation_vector_from_matrix(points)
+            vector_points = self.vector_from_matrix(points)
             vector_exp_bar = self.group_exponential_barycenter(
                 vector_points, weights, point_type='vector')
-            exp_bar = self.matrix_from_rotation_vector(vector_exp_bar)
+            exp_bar = self.matrix_from_vector(vector_exp_bar)
         return exp_bar
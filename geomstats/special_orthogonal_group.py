@@ -7,9 +7,22 @@ import geomstats.backend as gs
 
 from geomstats.embedded_manifold import EmbeddedManifold
 from geomstats.general_linear_group import GeneralLinearGroup
+from geomstats.invariant_metric import BiInvariantMetric
 from geomstats.lie_group import LieGroup
 
 ATOL = 1e-5
+ANGLE_0_THRESHOLD = 1e-4
+ANGLE_PI_THRESHOLD = gs.pi / 2.
+N_MAX_ITERATIONS = 32
+EPSILON = 1e-10
+# Phase of the hermitian matrix diagonalizing rotation matrices in their
+# logarithm, chosen to separate the eigenvalues 1 and -1 from the others.
+LOG_PHASE = 0.5
+LOG_TOLERANCE = 1e-8
+# Dimension above which scipy's Pade approximation of the exponential
+# is faster than the complex eigendecomposition of skew-symmetric matrices.
+EXP_EIGH_MAX_N = 10
+PROJECTION_TOLERANCE = 1e-12
 
 TAYLOR_COEFFS_1_AT_0 = [1., 0.,
                         - 1. / 12., 0.,
@@ -25,18 +38,150 @@ TAYLOR_COEFFS_1_AT_PI = [0., - gs.pi / 4.,
                          - 1. / 480.]
 
 
+def _normal(size, rng=None):
+    """
+    Draw standard gaussian samples from the random generator rng,
+    or from the global random state if rng is None.
+    """
+    if rng is None:
+        return gs.random.normal(size=size)
+    return rng.standard_normal(size)
+
+
+def _expm_skew_matrix(skew_mat):
+    """
+    Compute the exponential of skew-symmetric matrices A,
+    from the eigendecomposition of the hermitian matrices
+    i A = V diag(lambda) V^H, as exp(A) = V diag(exp(-i lambda)) V^H.
+    """
+    eigvals, eigvecs = gs.linalg.eigh(1j * skew_mat)
+    exp_mat = gs.matmul(
+        eigvecs * gs.expand_dims(gs.exp(-1j * eigvals), axis=1),
+        gs.conj(gs.transpose(eigvecs, axes=(0, 2, 1))))
+    return gs.real(exp_mat)
+
+
+def _logm_rotation_matrix(rot_mat):
+    """
+    Compute the skew-symmetric logarithm of rotation matrices R.
+
+    The eigenvectors V of R are those of the hermitian matrices
+    cos(phase) (R + R^T) / 2 - i sin(phase) (R - R^T) / 2,
+    whose eigenvalues cos(angle - phase) separate the eigenvalues
+    exp(i angle) of R, so that log(R) = V diag(i angle) V^H.
+
+    The logarithm is not unique for rotations with an eigenvalue -1:
+    these, and the rotations whose eigenvalues are not separated,
+    are detected with the reconstruction of R and computed from
+    their real Schur decompositions.
+    """
+    rot_mat_transpose = gs.transpose(rot_mat, axes=(0, 2, 1))
+    herm_mat = (
+        gs.cos(LOG_PHASE) * (rot_mat + rot_mat_transpose) / 2.
+        - 1j * gs.sin(LOG_PHASE) * (rot_mat - rot_mat_transpose) / 2.)
+    _, eigvecs = gs.linalg.eigh(herm_mat)
+    conj_eigvecs = gs.conj(eigvecs)
+    adjoint_eigvecs = gs.transpose(conj_eigvecs, axes=(0, 2, 1))
+
+    eigvals = gs.sum(conj_eigvecs * gs.matmul(rot_mat, eigvecs), axis=1)
+    angle = gs.arctan2(gs.imag(eigvals), gs.real(eigvals))
+    log_mat = gs.matmul(
+        eigvecs * gs.expand_dims(1j * angle, axis=1), adjoint_eigvecs)
+
+    reconstruction = gs.matmul(
+        eigvecs * gs.expand_dims(eigvals, axis=1), adjoint_eigvecs)
+    error = gs.maximum(
+        gs.amax(gs.abs(reconstruction - rot_mat), axis=(1, 2)),
+        gs.amax(gs.abs(gs.imag(log_mat)), axis=(1, 2)))
+    log_mat = gs.real(log_mat)
+
+    index_fallback = gs.where(error > LOG_TOLERANCE)[0]
+    for i in index_fallback:
+        log_mat[i] = _logm_rotation_matrix_schur(rot_mat[i])
+
+    return (log_mat - gs.transpose(log_mat, axes=(0, 2, 1))) / 2.
+
+
+def _logm_rotation_matrix_schur(rot_mat):
+    """
+    Compute a skew-symmetric logarithm of a rotation matrix R from its
+    real Schur decomposition R = Z T Z^T, where T is block-diagonal with
+    2x2 rotation blocks and 1x1 blocks equal to 1 or -1.
+    The eigenvalues -1 come in pairs, whose logarithms are rotations of pi.
+    """
+    mat_t, mat_z = gs.linalg.schur(rot_mat, output='real')
+    n = rot_mat.shape[0]
+    log_mat_t = gs.zeros((n, n))
+
+    index_minus_one = []
+    k = 0
+    while k < n:
+        if k < n - 1 and mat_t[k + 1, k] != 0.:
+            angle = gs.arctan2(mat_t[k + 1, k], mat_t[k, k])
+            log_mat_t[k + 1, k] = angle
+            log_mat_t[k, k + 1] = - angle
+            k += 2
+        else:
+            if mat_t[k, k] < 0.:
+                index_minus_one.append(k)
+            k += 1
+
+    for k, l in zip(index_minus_one[::2], index_minus_one[1::2]):
+        log_mat_t[l, k] = gs.pi
+        log_mat_t[k, l] = - gs.pi
+
+    return gs.matmul(mat_z, gs.matmul(log_mat_t, gs.transpose(mat_z)))
+
+
+def _projection_svd(mat):
+    """
+    Compute the rotation matrices closest to matrices M = U S V^T,
+    i.e. U V^T where the last singular vector of U is flipped
+    when det(U V^T) = -1.
+    """
+    mat_unitary_u, _, mat_unitary_v = gs.linalg.svd(mat)
+    det = gs.linalg.det(mat_unitary_u) * gs.linalg.det(mat_unitary_v)
+    mat_unitary_u[:, :, -1] *= gs.expand_dims(gs.sign(det), axis=1)
+    return gs.matmul(mat_unitary_u, mat_unitary_v)
+
+
+def _projection_newton_schulz(mat, n_iterations, tolerance):
+    """
+    Compute the orthogonal polar factors of matrices M with the
+    Newton-Schulz iterations X <- X (3 I - X^T X) / 2, starting at X = M.
+    The iterations converge quadratically when |M^T M - I| < 1.
+    """
+    identity = gs.eye(mat.shape[-1])
+    rot_mat = mat
+    for _ in range(n_iterations):
+        error = gs.matmul(gs.transpose(rot_mat, axes=(0, 2, 1)), rot_mat)
+        error -= identity
+        if gs.amax(gs.abs(error)) < tolerance:
+            break
+        rot_mat = rot_mat - gs.matmul(rot_mat, error) / 2.
+    return rot_mat
+
+
 class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
     """
     Class for the special orthogonal group SO(n),
     i.e. the Lie group of rotations.
+
+    In 3D, points can be represented as rotation vectors
+    (point_type='vector'), rotation matrices (point_type='matrix')
+    or unit quaternions (w, x, y, z) (point_type='quaternion').
+    The tangent vectors of the quaternion representation are
+    rotation vectors, left-translated to the identity.
     """
 
     def __init__(self, n, point_type=None, epsilon=0.):
 
         assert isinstance(n, int) and n > 1
+        assert point_type != 'quaternion' or n == 3
 
         self.n = n
         self.dimension = int((n * (n - 1)) / 2)
+        self.triu_indices = gs.triu_indices(n, k=1)
 
         self.epsilon = epsilon
 
@@ -49,7 +194,7 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         EmbeddedManifold.__init__(self,
                                   dimension=self.dimension,
                                   embedding_manifold=GeneralLinearGroup(n=n))
-        self.bi_invariant_metric = self.left_canonical_metric
+        self.bi_invariant_metric = BiInvariantMetric(group=self)
 
     def get_identity(self, point_type=None):
         """
@@ -63,6 +208,8 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         identity = gs.zeros(self.dimension)
         if point_type == 'matrix':
             identity = gs.eye(self.n)
+        elif point_type == 'quaternion':
+            identity = gs.array([1., 0., 0., 0.])
         return identity
     identity = property(get_identity)
 
@@ -94,6 +241,13 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
             mask = gs.to_ndarray(mask, to_ndim=2, axis=1)
             return mask
 
+        elif point_type == 'quaternion':
+            point = gs.to_ndarray(point, to_ndim=2)
+            norm = gs.linalg.norm(point, axis=1)
+            mask = gs.isclose(norm, 1.) & (point.shape[1] == 4)
+            mask = gs.to_ndarray(mask, to_ndim=2, axis=1)
+            return mask
+
     def regularize(self, point, point_type=None):
         """
         In 3D, regularize the norm of the rotation vector,
@@ -103,6 +257,9 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         If the angle angle is between pi and 2pi,
         the function computes its complementary in 2pi and
         inverts the direction of the rotation axis.
+
+        Quaternions are normalized, and chosen with a nonnegative
+        real part among the two quaternions representing each rotation.
         """
         if point_type is None:
             point_type = self.default_point_type
@@ -146,6 +303,12 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
             point = gs.to_ndarray(point, to_ndim=3)
             regularized_point = gs.to_ndarray(point, to_ndim=3)
 
+        elif point_type == 'quaternion':
+            point = gs.to_ndarray(point, to_ndim=2)
+            norm = gs.linalg.norm(point, axis=1)
+            sign = gs.where(point[:, 0] < 0., -1., 1.)
+            regularized_point = gs.einsum('n,ni->ni', sign / norm, point)
+
         return regularized_point
 
     def regularize_tangent_vec_at_identity(
@@ -153,11 +316,14 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         """
         In 3D, regularize a tangent_vector by getting its norm at the identity,
         determined by the metric, to be less than pi.
+
+        The tangent vectors of quaternions are rotation vectors,
+        which are regularized as for the vector point type.
         """
         if point_type is None:
             point_type = self.default_point_type
 
-        if point_type == 'vector':
+        if point_type in ('vector', 'quaternion'):
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
 
             if self.n == 3:
@@ -191,7 +357,7 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                         tangent_vec_metric_norm
                         / tangent_vec_canonical_norm)
                 regularized_vec += mask_else_float * self.regularize(
-                        coef * tangent_vec)
+                        coef * tangent_vec, point_type='vector')
                 coef += mask_0_float
                 regularized_vec = mask_else_float * (
                         regularized_vec / coef)
@@ -215,7 +381,7 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         if point_type is None:
             point_type = self.default_point_type
 
-        if point_type == 'vector':
+        if point_type in ('vector', 'quaternion'):
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
 
             if self.n == 3:
@@ -223,13 +389,17 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                     metric = self.left_canonical_metric
                 base_point = self.regularize(base_point, point_type)
                 n_vecs = tangent_vec.shape[0]
+                if base_point.shape[0] == 1:
+                    base_point = gs.repeat(base_point, n_vecs, axis=0)
 
                 jacobian = self.jacobian_translation(
                               point=base_point,
                               left_or_right=metric.left_or_right,
                               point_type=point_type)
-                jacobian = gs.array([jacobian[0]] * n_vecs)
-                inv_jacobian = gs.linalg.inv(jacobian)
+                inv_jacobian = self.inverse_jacobian_translation(
+                              point=base_point,
+                              left_or_right=metric.left_or_right,
+                              point_type=point_type)
                 tangent_vec_at_id = gs.einsum(
                         'ni,nij->nj',
                         tangent_vec,
@@ -254,44 +424,48 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
 
         return regularized_tangent_vec
 
-    def projection(self, mat):
+    def projection(self, mat, method='svd',
+                   n_iterations=N_MAX_ITERATIONS,
+                   tolerance=PROJECTION_TOLERANCE):
         """
         Project a matrix on SO(n), using the Frobenius norm.
+
+        The projection is computed from the singular value decomposition
+        (method='svd'), or with Newton-Schulz iterations for nearly
+        orthogonal matrices (method='newton_schulz'). The matrices for
+        which the iterations do not converge to a rotation are
+        projected with their singular value decompositions.
         """
         mat = gs.to_ndarray(mat, to_ndim=3)
 
         n_mats, mat_dim_1, mat_dim_2 = mat.shape
         assert mat_dim_1 == mat_dim_2 == self.n
 
-        if self.n == 3:
-            mat_unitary_u, diag_s, mat_unitary_v = gs.linalg.svd(mat)
-            rot_mat = gs.einsum('nij,njk->nik', mat_unitary_u, mat_unitary_v)
-            mask = gs.less(gs.linalg.det(rot_mat), 0.)
-            mask_float = gs.cast(mask, gs.float32) + self.epsilon
-            diag = gs.array([[1., 1., -1.]])
-            diag = gs.to_ndarray(gs.diag(diag), to_ndim=3) + self.epsilon
-            new_mat_diag_s = gs.tile(diag, [n_mats, 1, 1])
-
-            aux_mat = gs.einsum(
-                    'nij,njk->nik',
-                    mat_unitary_u,
-                    new_mat_diag_s)
-            rot_mat += gs.einsum(
-                    'n,njk->njk',
-                    mask_float,
-                    gs.einsum(
-                        'nij,njk->nik',
-                        aux_mat,
-                        mat_unitary_v))
-        else:
-            aux_mat = gs.matmul(gs.transpose(mat, axes=(0, 2, 1)), mat)
+        if method == 'svd':
+            return _projection_svd(mat)
 
-            inv_sqrt_mat = gs.linalg.inv(
-                    gs.linalg.sqrtm(aux_mat))
+        if method != 'newton_schulz':
+            raise ValueError('method should be \'svd\''
+                             ' or \'newton_schulz\'.')
 
-            rot_mat = gs.matmul(mat, inv_sqrt_mat)
+        identity = gs.eye(self.n)
+        error = gs.matmul(gs.transpose(mat, axes=(0, 2, 1)), mat) - identity
+        converges = (
+            (gs.linalg.norm(error, axis=(1, 2)) < 1.)
+            & (gs.linalg.det(mat) > 0.))
+
+        rot_mat = gs.copy(mat)
+        if gs.any(converges):
+            rot_mat[converges] = _projection_newton_schulz(
+                mat[converges], n_iterations, tolerance)
+
+        error = gs.matmul(
+            gs.transpose(rot_mat, axes=(0, 2, 1)), rot_mat) - identity
+        fallback = (
+            ~converges | (gs.amax(gs.abs(error), axis=(1, 2)) > tolerance))
+        if gs.any(fallback):
+            rot_mat[fallback] = _projection_svd(mat[fallback])
 
-        assert gs.ndim(rot_mat) == 3
         return rot_mat
 
     def skew_matrix_from_vector(self, vec):
@@ -314,7 +488,7 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
 
         elif self.n == 3:  # SO(3)
             # This avois dividing by 0.
-            levi_civita_symbol = gs.array([[
+            levi_civita_symbol = gs.array([
                 [[0., 0., 0.],
                  [0., 0., 1.],
                  [0., -1., 0.]],
@@ -324,42 +498,18 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                 [[0., 1., 0.],
                  [-1., 0., 0.],
                  [0., 0., 0.]]
-                ]] * n_vecs) + self.epsilon
+                ]) + self.epsilon
 
-            # This avois dividing by 0.
-            basis_vec_1 = gs.array([[1., 0., 0.]] * n_vecs) + self.epsilon
-            basis_vec_2 = gs.array([[0., 1., 0.]] * n_vecs) + self.epsilon
-            basis_vec_3 = gs.array([[0., 0., 1.]] * n_vecs) + self.epsilon
-            cross_prod_1 = gs.einsum(
-                'nijk,ni,nj->nk',
-                levi_civita_symbol,
-                basis_vec_1,
-                vec)
-            cross_prod_2 = gs.einsum(
-                'nijk,ni,nj->nk',
-                levi_civita_symbol,
-                basis_vec_2,
-                vec)
-            cross_prod_3 = gs.einsum(
-                'nijk,ni,nj->nk',
-                levi_civita_symbol,
-                basis_vec_3,
-                vec)
-
-            cross_prod_1 = gs.to_ndarray(cross_prod_1, to_ndim=3, axis=1)
-            cross_prod_2 = gs.to_ndarray(cross_prod_2, to_ndim=3, axis=1)
-            cross_prod_3 = gs.to_ndarray(cross_prod_3, to_ndim=3, axis=1)
-            skew_mat = gs.concatenate(
-                [cross_prod_1, cross_prod_2, cross_prod_3], axis=1)
+            # The i-th row is the cross product of the i-th basis vector
+            # with vec.
+            skew_mat = gs.einsum('ijk,nj->nik', levi_civita_symbol, vec)
 
         else:  # SO(n)
-            mat_dim = gs.cast(
-                ((1. + gs.sqrt(1. + 8. * vec_dim)) / 2.), gs.int32)
+            assert vec_dim == self.dimension
+            rows, cols = self.triu_indices
             skew_mat = gs.zeros((n_vecs,) + (self.n,) * 2)
-            upper_triangle_indices = gs.triu_indices(mat_dim, k=1)
-            for i in range(n_vecs):
-                skew_mat[i][upper_triangle_indices] = vec[i]
-                skew_mat[i] = skew_mat[i] - skew_mat[i].transpose()
+            skew_mat[:, rows, cols] = vec
+            skew_mat = skew_mat - gs.transpose(skew_mat, axes=(0, 2, 1))
         assert gs.ndim(skew_mat) == 3
         return skew_mat
 
@@ -369,16 +519,13 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         associated to the skew-symmetric matrix skew mat.
 
         In nD, fill a vector by reading the values
-        of the upper triangle of skew_mat.
+        of the upper triangle of skew_mat, row by row.
         """
         skew_mat = gs.to_ndarray(skew_mat, to_ndim=3)
         n_skew_mats, mat_dim_1, mat_dim_2 = skew_mat.shape
 
         assert mat_dim_1 == mat_dim_2 == self.n
 
-        vec_dim = self.dimension
-        vec = gs.zeros((n_skew_mats, vec_dim))
-
         if self.n == 2:  # SO(2)
             vec = gs.expand_dims(skew_mat[:, 0, 1], axis=1)
 
@@ -389,15 +536,22 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
             vec = gs.concatenate([vec_1, vec_2, vec_3], axis=1)
 
         else:  # SO(n)
-            idx = 0
-            for j in range(mat_dim_1):
-                for i in range(j):
-                    vec[:, idx] = skew_mat[:, i, j]
-                    idx += 1
+            rows, cols = self.triu_indices
+            vec = skew_mat[:, rows, cols]
 
         assert gs.ndim(vec) == 2
         return vec
 
+    def vector_from_lie_algebra(self, tangent_vec):
+        """
+        Compute the rotation vector coordinates of the skew-symmetric
+        part of matrices, which are those of the elements of the
+        Lie algebra so(n).
+        """
+        tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+        skew_mat = (tangent_vec - gs.transpose(tangent_vec, axes=(0, 2, 1)))
+        return self.vector_from_skew_matrix(skew_mat / 2.)
+
     def rotation_vector_from_matrix(self, rot_mat):
         """
         In 3D, convert rotation matrix to rotation vector
@@ -406,164 +560,87 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         Get the angle through the trace of the rotation matrix:
         The eigenvalues are:
         1, cos(angle) + i sin(angle), cos(angle) - i sin(angle)
-        so that: trace = 1 + 2 cos(angle), -1 <= trace <= 3
+        so that: trace = 1 + 2 cos(angle), -1 <= trace <= 3,
+        and through the skew-symmetric part of the rotation matrix:
+        (R - R^T) / 2 = sin(angle) S_u, with u the unit rotation axis.
 
         Get the rotation vector through the formula:
         S_r = angle / ( 2 * sin(angle) ) (R - R^T)
+        with a Taylor expansion for angles close to 0.
+
+        For angles larger than pi / 2, where sin(angle) can vanish,
+        the axis is read on the symmetric part of the rotation matrix:
+        (R + R^T) / 2 = cos(angle) I + (1 - cos(angle)) u u^T.
 
-        For the edge case where the angle is close to pi,
-        the formulation is derived by going from rotation matrix to unit
-        quaternion to axis-angle:
-         r = angle * v / |v|, where (w, v) is a unit quaternion.
+        The batch is partitioned into these three regimes, and each
+        regime is only computed on its own rotation matrices.
 
         In nD, the rotation vector stores the n(n-1)/2 values of the
-        skew-symmetric matrix representing the rotation.
+        skew-symmetric matrix representing the rotation, i.e. of its
+        logarithm, computed from the eigendecomposition of the rotation.
         """
         rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
         n_rot_mats, mat_dim_1, mat_dim_2 = rot_mat.shape
         assert mat_dim_1 == mat_dim_2 == self.n
 
         if self.n == 3:
-            trace = gs.trace(rot_mat, axis1=1, axis2=2)
-            trace = gs.to_ndarray(trace, to_ndim=2, axis=1)
-            assert trace.shape == (n_rot_mats, 1), trace.shape
-
-            cos_angle = .5 * (trace - 1)
-            cos_angle = gs.clip(cos_angle, -1, 1)
-            angle = gs.arccos(cos_angle)
-
             rot_mat_transpose = gs.transpose(rot_mat, axes=(0, 2, 1))
-            rot_vec = self.vector_from_skew_matrix(rot_mat - rot_mat_transpose)
-
-            # This avois dividing by 0.
-            mask_0 = gs.isclose(angle, 0.)
-            mask_0_float = gs.cast(mask_0, gs.float32) + self.epsilon
-
-            rot_vec *= (1. + mask_0_float * (.5 - (trace - 3.) / 12. - 1.))
-
-            # This avois dividing by 0.
-            mask_pi = gs.isclose(angle, gs.pi)
-            mask_pi_float = gs.cast(mask_pi, gs.float32) + self.epsilon
-
-            # This avois dividing by 0.
-            mask_else = ~mask_0 & ~mask_pi
-            mask_else_float = gs.cast(mask_else, gs.float32) + self.epsilon
-
-            mask_pi = gs.squeeze(mask_pi, axis=1)
-
-            # choose the largest diagonal element
-            # to avoid a square root of a negative number
-            rot_mat_pi = gs.einsum(
-                        'ni,njk->njk',
-                        mask_pi_float,
-                        rot_mat)
-            a = gs.array(0)
-            rot_mat_pi_00 = gs.to_ndarray(
-                rot_mat_pi[:, 0, 0], to_ndim=2, axis=1)
-            rot_mat_pi_11 = gs.to_ndarray(
-                rot_mat_pi[:, 1, 1], to_ndim=2, axis=1)
-            rot_mat_pi_22 = gs.to_ndarray(
-                rot_mat_pi[:, 2, 2], to_ndim=2, axis=1)
-            rot_mat_pi_diagonal = gs.hstack(
-                    [rot_mat_pi_00,
-                     rot_mat_pi_11,
-                     rot_mat_pi_22])
-            a = gs.argmax(rot_mat_pi_diagonal, axis=1)[0]
-            b = (a + 1) % 3
-            c = (a + 2) % 3
-
-            # compute the axis vector
-            sq_root = gs.zeros((n_rot_mats, 1))
-
-            aux = gs.sqrt(
-                mask_pi_float * (
-                    rot_mat[:, a, a]
-                    - rot_mat[:, b, b]
-                    - rot_mat[:, c, c]) + 1.)
-            sq_root_pi = gs.einsum(
-                    'ni,nk->ni',
-                    mask_pi_float,
-                    aux)
-
-            sq_root += sq_root_pi
-
-            rot_vec_pi = gs.zeros((n_rot_mats, self.dimension))
-
-            # This avois dividing by 0.
-            mask_a_float = gs.get_mask_i_float(a, 3) + self.epsilon
-            mask_b_float = gs.get_mask_i_float(b, 3) + self.epsilon
-            mask_c_float = gs.get_mask_i_float(c, 3) + self.epsilon
-
-            mask_a_float = gs.to_ndarray(mask_a_float, to_ndim=2, axis=1)
-            mask_b_float = gs.to_ndarray(mask_b_float, to_ndim=2, axis=1)
-            mask_c_float = gs.to_ndarray(mask_c_float, to_ndim=2, axis=1)
-
-            mask_a_float = gs.transpose(mask_a_float)
-            mask_b_float = gs.transpose(mask_b_float)
-            mask_c_float = gs.transpose(mask_c_float)
-
-            mask_a_float = gs.tile(mask_a_float, (n_rot_mats, 1))
-            mask_b_float = gs.tile(mask_b_float, (n_rot_mats, 1))
-            mask_c_float = gs.tile(mask_c_float, (n_rot_mats, 1))
-
-            rot_vec_pi += mask_pi_float * mask_a_float * sq_root / 2.
-
-            sq_root += mask_0_float
-            sq_root += mask_else_float
-
-            rot_vec_pi_b = gs.zeros_like(rot_vec_pi)
-            rot_vec_pi_c = gs.zeros_like(rot_vec_pi)
-
-            rot_vec_pi_b += gs.einsum(
-                    'nk,ni->nk',
-                    mask_b_float,
-                    ((rot_mat[:, b, a]
-                     + rot_mat[:, a, b])
-                     / (2. * sq_root)))
-            rot_vec_pi += mask_pi_float * gs.einsum(
-                     'ni,nk->nk',
-                     mask_pi_float,
-                     rot_vec_pi_b)
-
-            rot_vec_pi_c += gs.einsum(
-                    'nk,ni->nk',
-                    mask_c_float,
-                    ((rot_mat[:, c, a]
-                     + rot_mat[:, a, c])
-                     / (2. * sq_root)))
-
-            rot_vec_pi += mask_pi_float * gs.einsum(
-                     'ni,nk->nk',
-                     mask_pi_float,
-                     rot_vec_pi_c)
-
-            norm_rot_vec_pi = gs.linalg.norm(rot_vec_pi, axis=1)
-            norm_rot_vec_pi += gs.squeeze(mask_0_float, axis=1)
-            norm_rot_vec_pi += gs.squeeze(mask_else_float, axis=1)
-
-            rot_vec += mask_pi_float * (
-                    gs.einsum(
-                        'nk,n->nk',
-                        angle * rot_vec_pi,
-                        1. / norm_rot_vec_pi))
-
-            angle += mask_0_float
-            angle = gs.to_ndarray(angle, to_ndim=2, axis=1)
-            fact = gs.einsum(
-                'ni,ni->ni',
-                mask_else_float,
-                (angle / (2. * gs.sin(angle)) - 1.))
-
-            rot_vec *= (1. + fact)
-        else:
-            skew_mat = self.embedding_manifold.group_log_from_identity(rot_mat)
-            rot_vec = self.vector_from_skew_matrix(skew_mat)
+            # skew_vec = sin(angle) * axis
+            skew_vec = .5 * self.vector_from_skew_matrix(
+                rot_mat - rot_mat_transpose)
+            sin_angle = gs.linalg.norm(skew_vec, axis=1)
+            cos_angle = .5 * (gs.trace(rot_mat, axis1=1, axis2=2) - 1.)
+            angle = gs.arctan2(sin_angle, cos_angle)
+
+            rot_vec = gs.zeros((n_rot_mats, self.dimension))
+
+            index_0 = gs.where(angle < ANGLE_0_THRESHOLD)[0]
+            index_pi = gs.where(angle > ANGLE_PI_THRESHOLD)[0]
+            index_else = gs.where(
+                (angle >= ANGLE_0_THRESHOLD)
+                & (angle <= ANGLE_PI_THRESHOLD))[0]
+
+            angle_0 = angle[index_0]
+            rot_vec[index_0] = gs.einsum(
+                'n,ni->ni', 1. + angle_0 ** 2 / 6., skew_vec[index_0])
+
+            angle_else = angle[index_else]
+            rot_vec[index_else] = gs.einsum(
+                'n,ni->ni',
+                angle_else / sin_angle[index_else],
+                skew_vec[index_else])
+
+            # The symmetric part of the rotation matrix is
+            # cos(angle) I + (1 - cos(angle)) axis axis^T: the axis is
+            # read on the column of its largest diagonal element,
+            # chosen for each sample, and oriented by skew_vec.
+            sym_mat_pi = .5 * (rot_mat[index_pi] + rot_mat_transpose[index_pi])
+            cos_angle_pi = cos_angle[index_pi]
+            col_index = gs.argmax(
+                gs.diagonal(sym_mat_pi, axis1=1, axis2=2), axis=1)
+            axis_pi = sym_mat_pi[gs.arange(len(index_pi)), :, col_index]
+            axis_pi -= gs.einsum(
+                'n,ni->ni', cos_angle_pi, gs.eye(3)[col_index])
+            axis_pi /= gs.linalg.norm(axis_pi, axis=1, keepdims=True)
+            orientation = gs.sign(gs.sum(axis_pi * skew_vec[index_pi], axis=1))
+            orientation = gs.where(orientation == 0., 1., orientation)
+            rot_vec[index_pi] = gs.einsum(
+                'n,ni->ni', orientation * angle[index_pi], axis_pi)
+            # The angles are already in [0, pi]: no regularization.
+            return rot_vec
+
+        skew_mat = _logm_rotation_matrix(rot_mat)
+        rot_vec = self.vector_from_skew_matrix(skew_mat)
 
         return self.regularize(rot_vec, point_type='vector')
 
     def matrix_from_rotation_vector(self, rot_vec):
         """
         Convert rotation vector to rotation matrix.
+
+        In nD, the rotation matrix is the exponential of the
+        skew-symmetric matrix of the rotation vector, computed
+        from its eigendecomposition in small dimensions.
         """
         rot_vec = self.regularize(rot_vec, point_type='vector')
         n_rot_vecs, _ = rot_vec.shape
@@ -608,22 +685,48 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
 
         else:
             skew_mat = self.skew_matrix_from_vector(rot_vec)
-            rot_mat = self.embedding_manifold.group_exp_from_identity(skew_mat)
+            if self.n <= EXP_EIGH_MAX_N:
+                rot_mat = _expm_skew_matrix(skew_mat)
+            else:
+                rot_mat = gs.linalg.expm(skew_mat)
 
         return rot_mat
 
     def quaternion_from_matrix(self, rot_mat):
         """
         Convert a rotation matrix into a unit quaternion.
+
+        Each of the four rows of the symmetric matrix K below is the
+        quaternion scaled by four times one of its components: the row
+        with the largest diagonal term is normalized, for stability.
         """
         assert self.n == 3, ('The quaternion representation does not exist'
                              ' for rotations in %d dimensions.' % self.n)
         rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
-
-        rot_vec = self.rotation_vector_from_matrix(rot_mat)
-        quaternion = self.quaternion_from_rotation_vector(rot_vec)
-
-        assert gs.ndim(quaternion) == 2
+        n_rot_mats, _, _ = rot_mat.shape
+
+        trace = gs.trace(rot_mat, axis1=1, axis2=2)
+        diag = [rot_mat[:, i, i] for i in range(3)]
+        sums = [rot_mat[:, 2, 1] + rot_mat[:, 1, 2],
+                rot_mat[:, 0, 2] + rot_mat[:, 2, 0],
+                rot_mat[:, 1, 0] + rot_mat[:, 0, 1]]
+        diffs = [rot_mat[:, 2, 1] - rot_mat[:, 1, 2],
+                 rot_mat[:, 0, 2] - rot_mat[:, 2, 0],
+                 rot_mat[:, 1, 0] - rot_mat[:, 0, 1]]
+
+        sym_mat = gs.stack([
+            gs.stack([1. + trace, diffs[0], diffs[1], diffs[2]], axis=1),
+            gs.stack([diffs[0], 1. + 2. * diag[0] - trace,
+                      sums[2], sums[1]], axis=1),
+            gs.stack([diffs[1], sums[2],
+                      1. + 2. * diag[1] - trace, sums[0]], axis=1),
+            gs.stack([diffs[2], sums[1], sums[0],
+                      1. + 2. * diag[2] - trace], axis=1)], axis=1)
+
+        index = gs.argmax(gs.diagonal(sym_mat, axis1=1, axis2=2), axis=1)
+        quaternion = sym_mat[gs.arange(n_rot_mats), index]
+
+        quaternion = self.regularize(quaternion, point_type='quaternion')
         return quaternion
 
     def quaternion_from_rotation_vector(self, rot_vec):
@@ -633,22 +736,20 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         assert self.n == 3, ('The quaternion representation does not exist'
                              ' for rotations in %d dimensions.' % self.n)
         rot_vec = self.regularize(rot_vec, point_type='vector')
-        n_rot_vecs, _ = rot_vec.shape
 
         angle = gs.linalg.norm(rot_vec, axis=1)
         angle = gs.to_ndarray(angle, to_ndim=2, axis=1)
 
-        mask_0 = gs.isclose(angle, 0.)
-        mask_not_0 = ~mask_0
-
-        rotation_axis = gs.divide(rot_vec,
-                                  angle *
-                                  gs.cast(mask_not_0, gs.float32) +
-                                  gs.cast(mask_0, gs.float32))
+        mask_0 = angle < ANGLE_0_THRESHOLD
+        # This avoids dividing by 0.
+        safe_angle = gs.where(mask_0, gs.ones_like(angle), angle)
+        coef = gs.where(
+            mask_0,
+            1. / 2. - angle ** 2 / 48.,
+            gs.sin(safe_angle / 2) / safe_angle)
 
         quaternion = gs.concatenate(
-            (gs.cos(angle / 2),
-             gs.sin(angle / 2) * rotation_axis[:]),
+            (gs.cos(angle / 2), coef * rot_vec),
             axis=1)
 
         return quaternion
@@ -659,63 +760,48 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         """
         assert self.n == 3, ('The quaternion representation does not exist'
                              ' for rotations in %d dimensions.' % self.n)
-        quaternion = gs.to_ndarray(quaternion, to_ndim=2)
-        n_quaternions, _ = quaternion.shape
+        quaternion = self.regularize(quaternion, point_type='quaternion')
 
-        cos_half_angle = quaternion[:, 0]
-        cos_half_angle = gs.clip(cos_half_angle, -1, 1)
-        half_angle = gs.arccos(cos_half_angle)
+        # The imaginary part is sin(half_angle) * rotation_axis.
+        sin_half_angle = gs.linalg.norm(quaternion[:, 1:], axis=1)
+        half_angle = gs.arctan2(sin_half_angle, quaternion[:, 0])
 
-        half_angle = gs.to_ndarray(half_angle, to_ndim=2, axis=1)
-        assert half_angle.shape == (n_quaternions, 1)
-
-        mask_0 = gs.isclose(half_angle, 0.)
-        mask_not_0 = ~mask_0
-
-        rotation_axis = gs.divide(quaternion[:, 1:],
-                                  gs.sin(half_angle) *
-                                  gs.cast(mask_not_0, gs.float32) +
-                                  gs.cast(mask_0, gs.float32))
-        rot_vec = gs.array(2 * half_angle *
-                           rotation_axis *
-                           gs.cast(mask_not_0, gs.float32))
+        mask_0 = gs.isclose(sin_half_angle, 0.)
+        mask_0_float = gs.cast(mask_0, gs.float32)
+        # This avoids dividing by 0.
+        coef = gs.where(
+            mask_0,
+            2. * (1. + half_angle ** 2 / 6.),
+            2. * half_angle / (sin_half_angle + mask_0_float))
+        rot_vec = gs.einsum('n,ni->ni', coef, quaternion[:, 1:])
 
         rot_vec = self.regularize(rot_vec, point_type='vector')
         return rot_vec
 
     def matrix_from_quaternion(self, quaternion):
         """
-        Convert a unit quaternion into a rotation vector.
+        Convert a unit quaternion into a rotation matrix.
         """
         assert self.n == 3, ('The quaternion representation does not exist'
                              ' for rotations in %d dimensions.' % self.n)
         quaternion = gs.to_ndarray(quaternion, to_ndim=2)
         n_quaternions, _ = quaternion.shape
 
-        w, x, y, z = gs.hsplit(quaternion, 4)
-
-        rot_mat = gs.zeros((n_quaternions,) + (self.n,) * 2)
-
-        for i in range(n_quaternions):
-            # TODO(nina): Vectorize by applying the composition of
-            # quaternions to the identity matrix
-            column_1 = [w[i] ** 2 + x[i] ** 2 - y[i] ** 2 - z[i] ** 2,
-                        2 * x[i] * y[i] - 2 * w[i] * z[i],
-                        2 * x[i] * z[i] + 2 * w[i] * y[i]]
+        w, x, y, z = [quaternion[:, i] for i in range(4)]
 
-            column_2 = [2 * x[i] * y[i] + 2 * w[i] * z[i],
-                        w[i] ** 2 - x[i] ** 2 + y[i] ** 2 - z[i] ** 2,
-                        2 * y[i] * z[i] - 2 * w[i] * x[i]]
+        rot_mat = gs.stack([
+            w ** 2 + x ** 2 - y ** 2 - z ** 2,
+            2 * x * y - 2 * w * z,
+            2 * x * z + 2 * w * y,
 
-            column_3 = [2 * x[i] * z[i] - 2 * w[i] * y[i],
-                        2 * y[i] * z[i] + 2 * w[i] * x[i],
-                        w[i] ** 2 - x[i] ** 2 - y[i] ** 2 + z[i] ** 2]
+            2 * x * y + 2 * w * z,
+            w ** 2 - x ** 2 + y ** 2 - z ** 2,
+            2 * y * z - 2 * w * x,
 
-            mask_i = gs.get_mask_i_float(i, n_quaternions)
-            rot_mat_i = gs.transpose(
-                gs.hstack([column_1, column_2, column_3]))
-            rot_mat_i = gs.to_ndarray(rot_mat_i, to_ndim=3)
-            rot_mat += gs.einsum('n,nij->nij', mask_i, rot_mat_i)
+            2 * x * z - 2 * w * y,
+            2 * y * z + 2 * w * x,
+            w ** 2 - x ** 2 - y ** 2 + z ** 2], axis=1)
+        rot_mat = gs.reshape(rot_mat, (n_quaternions, 3, 3))
 
         assert gs.ndim(rot_mat) == 3
         return rot_mat
@@ -739,34 +825,28 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         tait_bryan_angles = gs.to_ndarray(tait_bryan_angles, to_ndim=2)
         n_tait_bryan_angles, _ = tait_bryan_angles.shape
 
-        rot_mat = gs.zeros((n_tait_bryan_angles,) + (self.n,) * 2)
-        angle_1 = tait_bryan_angles[:, 0]
-        angle_2 = tait_bryan_angles[:, 1]
-        angle_3 = tait_bryan_angles[:, 2]
-
-        for i in range(n_tait_bryan_angles):
-            cos_angle_1 = gs.cos(angle_1[i])
-            sin_angle_1 = gs.sin(angle_1[i])
-            cos_angle_2 = gs.cos(angle_2[i])
-            sin_angle_2 = gs.sin(angle_2[i])
-            cos_angle_3 = gs.cos(angle_3[i])
-            sin_angle_3 = gs.sin(angle_3[i])
-
-            column_1 = [[cos_angle_1 * cos_angle_2],
-                        [cos_angle_2 * sin_angle_1],
-                        [- sin_angle_2]]
-            column_2 = [[(cos_angle_1 * sin_angle_2 * sin_angle_3
-                          - cos_angle_3 * sin_angle_1)],
-                        [(cos_angle_1 * cos_angle_3
-                          + sin_angle_1 * sin_angle_2 * sin_angle_3)],
-                        [cos_angle_2 * sin_angle_3]]
-            column_3 = [[(sin_angle_1 * sin_angle_3
-                          + cos_angle_1 * cos_angle_3 * sin_angle_2)],
-                        [(cos_angle_3 * sin_angle_1 * sin_angle_2
-                          - cos_angle_1 * sin_angle_3)],
-                        [cos_angle_2 * cos_angle_3]]
-
-            rot_mat[i] = gs.hstack((column_1, column_2, column_3))
+        cos_angle_1, cos_angle_2, cos_angle_3 = [
+            gs.cos(tait_bryan_angles[:, i]) for i in range(3)]
+        sin_angle_1, sin_angle_2, sin_angle_3 = [
+            gs.sin(tait_bryan_angles[:, i]) for i in range(3)]
+
+        rot_mat = gs.stack([
+            cos_angle_1 * cos_angle_2,
+            (cos_angle_1 * sin_angle_2 * sin_angle_3
+             - cos_angle_3 * sin_angle_1),
+            (sin_angle_1 * sin_angle_3
+             + cos_angle_1 * cos_angle_3 * sin_angle_2),
+
+            cos_angle_2 * sin_angle_1,
+            (cos_angle_1 * cos_angle_3
+             + sin_angle_1 * sin_angle_2 * sin_angle_3),
+            (cos_angle_3 * sin_angle_1 * sin_angle_2
+             - cos_angle_1 * sin_angle_3),
+
+            - sin_angle_2,
+            cos_angle_2 * sin_angle_3,
+            cos_angle_2 * cos_angle_3], axis=1)
+        rot_mat = gs.reshape(rot_mat, (n_tait_bryan_angles, 3, 3))
         return rot_mat
 
     def matrix_from_tait_bryan_angles_extrinsic_zyx(self, tait_bryan_angles):
@@ -787,35 +867,28 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         tait_bryan_angles = gs.to_ndarray(tait_bryan_angles, to_ndim=2)
         n_tait_bryan_angles, _ = tait_bryan_angles.shape
 
-        rot_mat = gs.zeros((n_tait_bryan_angles,) + (self.n,) * 2)
-        angle_1 = tait_bryan_angles[:, 0]
-        angle_2 = tait_bryan_angles[:, 1]
-        angle_3 = tait_bryan_angles[:, 2]
-
-        for i in range(n_tait_bryan_angles):
-            cos_angle_1 = gs.cos(angle_1[i])
-            sin_angle_1 = gs.sin(angle_1[i])
-            cos_angle_2 = gs.cos(angle_2[i])
-            sin_angle_2 = gs.sin(angle_2[i])
-            cos_angle_3 = gs.cos(angle_3[i])
-            sin_angle_3 = gs.sin(angle_3[i])
-
-            column_1 = [[cos_angle_2 * cos_angle_3],
-                        [(cos_angle_1 * sin_angle_3
-                          + cos_angle_3 * sin_angle_1 * sin_angle_2)],
-                        [(sin_angle_1 * sin_angle_3
-                          - cos_angle_1 * cos_angle_3 * sin_angle_2)]]
-
-            column_2 = [[- cos_angle_2 * sin_angle_3],
-                        [(cos_angle_1 * cos_angle_3
-                          - sin_angle_1 * sin_angle_2 * sin_angle_3)],
-                        [(cos_angle_3 * sin_angle_1
-                          + cos_angle_1 * sin_angle_2 * sin_angle_3)]]
-
-            column_3 = [[sin_angle_2],
-                        [- cos_angle_2 * sin_angle_1],
-                        [cos_angle_1 * cos_angle_2]]
-            rot_mat[i] = gs.hstack((column_1, column_2, column_3))
+        cos_angle_1, cos_angle_2, cos_angle_3 = [
+            gs.cos(tait_bryan_angles[:, i]) for i in range(3)]
+        sin_angle_1, sin_angle_2, sin_angle_3 = [
+            gs.sin(tait_bryan_angles[:, i]) for i in range(3)]
+
+        rot_mat = gs.stack([
+            cos_angle_2 * cos_angle_3,
+            - cos_angle_2 * sin_angle_3,
+            sin_angle_2,
+
+            (cos_angle_1 * sin_angle_3
+             + cos_angle_3 * sin_angle_1 * sin_angle_2),
+            (cos_angle_1 * cos_angle_3
+             - sin_angle_1 * sin_angle_2 * sin_angle_3),
+            - cos_angle_2 * sin_angle_1,
+
+            (sin_angle_1 * sin_angle_3
+             - cos_angle_1 * cos_angle_3 * sin_angle_2),
+            (cos_angle_3 * sin_angle_1
+             + cos_angle_1 * sin_angle_2 * sin_angle_3),
+            cos_angle_1 * cos_angle_2], axis=1)
+        rot_mat = gs.reshape(rot_mat, (n_tait_bryan_angles, 3, 3))
         return rot_mat
 
     def matrix_from_tait_bryan_angles(self, tait_bryan_angles,
@@ -878,6 +951,62 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
 
         return rot_mat
 
+    def tait_bryan_angles_from_matrix_extrinsic_xyz(self, rot_mat):
+        """
+        Convert a rotation matrix rot_mat into the tait bryan angles,
+        [angle_1, angle_2, angle_3] in extrinsic (fixed) coordinate frame,
+        for the order xyz, i.e. rot_mat = Z(angle_1).Y(angle_2).X(angle_3).
+
+        In gimbal lock, i.e. if cos(angle_2) = 0, angle_1 is set to 0.
+        """
+        assert self.n == 3, ('The Tait-Bryan angles representation'
+                             ' does not exist'
+                             ' for rotations in %d dimensions.' % self.n)
+        rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
+
+        cos_angle_2 = gs.sqrt(rot_mat[:, 2, 1] ** 2 + rot_mat[:, 2, 2] ** 2)
+        mask_lock = cos_angle_2 < EPSILON
+
+        angle_1 = gs.where(
+            mask_lock, gs.zeros_like(cos_angle_2),
+            gs.arctan2(rot_mat[:, 1, 0], rot_mat[:, 0, 0]))
+        angle_2 = gs.arcsin(gs.clip(- rot_mat[:, 2, 0], -1., 1.))
+        angle_3 = gs.where(
+            mask_lock,
+            gs.arctan2(- rot_mat[:, 1, 2], rot_mat[:, 1, 1]),
+            gs.arctan2(rot_mat[:, 2, 1], rot_mat[:, 2, 2]))
+
+        tait_bryan_angles = gs.stack([angle_1, angle_2, angle_3], axis=1)
+        return tait_bryan_angles
+
+    def tait_bryan_angles_from_matrix_extrinsic_zyx(self, rot_mat):
+        """
+        Convert a rotation matrix rot_mat into the tait bryan angles,
+        [angle_1, angle_2, angle_3] in extrinsic (fixed) coordinate frame,
+        for the order zyx, i.e. rot_mat = X(angle_1).Y(angle_2).Z(angle_3).
+
+        In gimbal lock, i.e. if cos(angle_2) = 0, angle_1 is set to 0.
+        """
+        assert self.n == 3, ('The Tait-Bryan angles representation'
+                             ' does not exist'
+                             ' for rotations in %d dimensions.' % self.n)
+        rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
+
+        cos_angle_2 = gs.sqrt(rot_mat[:, 0, 0] ** 2 + rot_mat[:, 0, 1] ** 2)
+        mask_lock = cos_angle_2 < EPSILON
+
+        angle_1 = gs.where(
+            mask_lock, gs.zeros_like(cos_angle_2),
+            gs.arctan2(- rot_mat[:, 1, 2], rot_mat[:, 2, 2]))
+        angle_2 = gs.arcsin(gs.clip(rot_mat[:, 0, 2], -1., 1.))
+        angle_3 = gs.where(
+            mask_lock,
+            gs.arctan2(rot_mat[:, 1, 0], rot_mat[:, 1, 1]),
+            gs.arctan2(- rot_mat[:, 0, 1], rot_mat[:, 0, 0]))
+
+        tait_bryan_angles = gs.stack([angle_1, angle_2, angle_3], axis=1)
+        return tait_bryan_angles
+
     def tait_bryan_angles_from_matrix(self, rot_mat,
                                       extrinsic_or_intrinsic='extrinsic',
                                       order='zyx'):
@@ -895,18 +1024,71 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         assert order in ('xyz', 'zyx')
 
         rot_mat = gs.to_ndarray(rot_mat, to_ndim=3)
-        quaternion = self.quaternion_from_matrix(rot_mat)
-        tait_bryan_angles = self.tait_bryan_angles_from_quaternion(
-            quaternion,
-            extrinsic_or_intrinsic=extrinsic_or_intrinsic,
-            order=order)
+
+        extrinsic_zyx = (extrinsic_or_intrinsic == 'extrinsic'
+                         and order == 'zyx')
+        intrinsic_xyz = (extrinsic_or_intrinsic == 'intrinsic'
+                         and order == 'xyz')
+
+        extrinsic_xyz = (extrinsic_or_intrinsic == 'extrinsic'
+                         and order == 'xyz')
+        intrinsic_zyx = (extrinsic_or_intrinsic == 'intrinsic'
+                         and order == 'zyx')
+
+        if extrinsic_zyx:
+            tait_bryan_angles = (
+                self.tait_bryan_angles_from_matrix_extrinsic_zyx(rot_mat))
+        elif intrinsic_xyz:
+            tait_bryan_angles = gs.flip(
+                self.tait_bryan_angles_from_matrix_extrinsic_zyx(rot_mat),
+                axis=1)
+
+        elif extrinsic_xyz:
+            tait_bryan_angles = (
+                self.tait_bryan_angles_from_matrix_extrinsic_xyz(rot_mat))
+        elif intrinsic_zyx:
+            tait_bryan_angles = gs.flip(
+                self.tait_bryan_angles_from_matrix_extrinsic_xyz(rot_mat),
+                axis=1)
+
+        else:
+            raise ValueError('extrinsic_or_intrinsic should be'
+                             ' \'extrinsic\' or \'intrinsic\''
+                             ' and order should be \'xyz\' or \'zyx\'.')
 
         return tait_bryan_angles
 
+    def quaternion_from_elementary_rotations(self, angles, axes):
+        """
+        Convert the composition of the rotations of angles[:, i]
+        around the axes[i], for i = 0, 1, 2, into a unit quaternion.
+        """
+        assert self.n == 3, ('The quaternion representation does not exist'
+                             ' for rotations in %d dimensions.' % self.n)
+        angles = gs.to_ndarray(angles, to_ndim=2)
+        cos_half_angles = gs.cos(angles / 2.)
+        sin_half_angles = gs.sin(angles / 2.)
+        zeros = gs.zeros_like(cos_half_angles[:, 0])
+
+        quaternion = None
+        for i, axis in enumerate(axes):
+            elementary_quaternion = gs.stack(
+                [cos_half_angles[:, i]]
+                + [sin_half_angles[:, i] if k == axis else zeros
+                   for k in range(3)], axis=1)
+            if quaternion is None:
+                quaternion = elementary_quaternion
+            else:
+                quaternion = self.quaternion_product(
+                    quaternion, elementary_quaternion)
+
+        quaternion = self.regularize(quaternion, point_type='quaternion')
+        return quaternion
+
     def quaternion_from_tait_bryan_angles_intrinsic_xyz(
             self, tait_bryan_angles):
         """
-        Convert a rotation given by Tait-Bryan angles in extrinsic
+        Convert a rotation given by Tait-Bryan angles in intrinsic
         coordinate systems and order xyz into a unit quaternion.
         """
         assert self.n == 3, ('The quaternion representation'
@@ -914,14 +1096,9 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                              ' do not exist'
                              ' for rotations in %d dimensions.' % self.n)
         tait_bryan_angles = gs.to_ndarray(tait_bryan_angles, to_ndim=2)
-        n_tait_bryan_angles, _ = tait_bryan_angles.shape
-        quaternion = gs.zeros((n_tait_bryan_angles, 4))
 
-        matrix = self.matrix_from_tait_bryan_angles(
-                tait_bryan_angles,
-                extrinsic_or_intrinsic='intrinsic',
-                order='xyz')
-        quaternion = self.quaternion_from_matrix(matrix)
+        quaternion = self.quaternion_from_elementary_rotations(
+            gs.flip(tait_bryan_angles, axis=1), axes=(0, 1, 2))
         return quaternion
 
     def quaternion_from_tait_bryan_angles(self, tait_bryan_angles,
@@ -939,7 +1116,6 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                              ' do not exist'
                              ' for rotations in %d dimensions.' % self.n)
         tait_bryan_angles = gs.to_ndarray(tait_bryan_angles, to_ndim=2)
-        n_tait_bryan_angles, _ = tait_bryan_angles.shape
 
         extrinsic_zyx = (extrinsic_or_intrinsic == 'extrinsic'
                          and order == 'zyx')
@@ -952,24 +1128,20 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                          and order == 'zyx')
 
         if extrinsic_zyx:
-            tait_bryan_angles_reversed = gs.flip(tait_bryan_angles, axis=1)
-            quat = self.quaternion_from_tait_bryan_angles_intrinsic_xyz(
-                tait_bryan_angles_reversed)
+            quat = self.quaternion_from_elementary_rotations(
+                tait_bryan_angles, axes=(0, 1, 2))
 
         elif intrinsic_xyz:
             quat = self.quaternion_from_tait_bryan_angles_intrinsic_xyz(
                 tait_bryan_angles)
 
         elif extrinsic_xyz:
-            rot_mat = self.matrix_from_tait_bryan_angles_extrinsic_xyz(
-                tait_bryan_angles)
-            quat = self.quaternion_from_matrix(rot_mat)
+            quat = self.quaternion_from_elementary_rotations(
+                tait_bryan_angles, axes=(2, 1, 0))
 
         elif intrinsic_zyx:
-            tait_bryan_angles_reversed = gs.flip(tait_bryan_angles, axis=1)
-            rot_mat = self.matrix_from_tait_bryan_angles_extrinsic_xyz(
-                tait_bryan_angles_reversed)
-            quat = self.quaternion_from_matrix(rot_mat)
+            quat = self.quaternion_from_elementary_rotations(
+                gs.flip(tait_bryan_angles, axis=1), axes=(2, 1, 0))
         else:
             raise ValueError('extrinsic_or_intrinsic should be'
                              ' \'extrinsic\' or \'intrinsic\''
@@ -1107,9 +1279,29 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
 
         return tait_bryan_angles
 
+    def quaternion_product(self, quaternion_1, quaternion_2):
+        """
+        Hamilton product of quaternions (w, x, y, z), such that the
+        composition of rotations corresponds to the product of quaternions.
+        """
+        quaternion_1 = gs.to_ndarray(quaternion_1, to_ndim=2)
+        quaternion_2 = gs.to_ndarray(quaternion_2, to_ndim=2)
+        w_1, x_1, y_1, z_1 = [quaternion_1[:, i] for i in range(4)]
+        w_2, x_2, y_2, z_2 = [quaternion_2[:, i] for i in range(4)]
+
+        product = gs.stack([
+            w_1 * w_2 - x_1 * x_2 - y_1 * y_2 - z_1 * z_2,
+            w_1 * x_2 + x_1 * w_2 + y_1 * z_2 - z_1 * y_2,
+            w_1 * y_2 - x_1 * z_2 + y_1 * w_2 + z_1 * x_2,
+            w_1 * z_2 + x_1 * y_2 - y_1 * x_2 + z_1 * w_2], axis=1)
+        return product
+
     def compose(self, point_1, point_2, point_type=None):
         """
         Compose two elements of SO(n).
+
+        In 3D, rotation vectors are composed directly with Rodrigues'
+        composition formula, without converting them to matrices.
         """
         if point_type is None:
             point_type = self.default_point_type
@@ -1117,6 +1309,18 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         point_1 = self.regularize(point_1, point_type=point_type)
         point_2 = self.regularize(point_2, point_type=point_type)
 
+        if point_type == 'quaternion':
+            point_prod = self.quaternion_product(point_1, point_2)
+            return self.regularize(point_prod, point_type=point_type)
+
+        if point_type == 'vector' and self.n == 3:
+            # Rodrigues' composition formula, in terms of the
+            # Euler-Rodrigues parameters of the rotations.
+            point_prod = self.quaternion_product(
+                self.quaternion_from_rotation_vector(point_1),
+                self.quaternion_from_rotation_vector(point_2))
+            return self.rotation_vector_from_quaternion(point_prod)
+
         if point_type == 'vector':
             point_1 = self.matrix_from_rotation_vector(point_1)
             point_2 = self.matrix_from_rotation_vector(point_2)
@@ -1151,6 +1355,10 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         if point_type is None:
             point_type = self.default_point_type
 
+        if point_type == 'quaternion':
+            inv_point = self.regularize(point, point_type=point_type)
+            return inv_point * gs.array([1., -1., -1., -1.])
+
         if point_type == 'vector':
             if self.n == 3:
                 inv_point = -self.regularize(point, point_type=point_type)
@@ -1170,6 +1378,11 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         """
         Compute the jacobian matrix of the differential
         of the left/right translations from the identity to point in SO(n).
+
+        The tangent vectors of quaternions are left-translated to the
+        identity, so that the jacobian is the identity for the left
+        translation and the transpose of the rotation matrix of point
+        for the right translation.
         """
         assert left_or_right in ('left', 'right')
 
@@ -1232,28 +1445,13 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                         (angle / 2) / gs.tan(angle / 2))
                 coef_2 += mask_else_float * (
                         (1 - coef_1) / angle ** 2)
-                jacobian = gs.zeros((n_points, self.dimension, self.dimension))
-                n_points_tensor = gs.array(n_points)
-                for i in range(n_points):
-                    # This avois dividing by 0.
-                    mask_i_float = (
-                        gs.get_mask_i_float(i, n_points_tensor)
-                        + self.epsilon)
-
-                    sign = - 1
-                    if left_or_right == 'left':
-                        sign = + 1
-
-                    jacobian_i = (
-                        coef_1[i] * gs.eye(self.dimension)
-                        + coef_2[i] * gs.outer(point[i], point[i])
-                        + sign * self.skew_matrix_from_vector(point[i]) / 2)
-                    jacobian_i = gs.squeeze(jacobian_i, axis=0)
-
-                    jacobian += gs.einsum(
-                        'n,ij->nij',
-                        mask_i_float,
-                        jacobian_i)
+                sign = + 1 if left_or_right == 'left' else - 1
+
+                jacobian = (
+                    gs.einsum(
+                        'n,ij->nij', coef_1[:, 0], gs.eye(self.dimension))
+                    + gs.einsum('n,ni,nj->nij', coef_2[:, 0], point, point)
+                    + sign * self.skew_matrix_from_vector(point) / 2.)
 
             else:
                 if left_or_right == 'right':
@@ -1262,26 +1460,132 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                         ' is not implemented.')
                 jacobian = self.matrix_from_rotation_vector(point)
 
+        elif point_type == 'quaternion':
+            jacobian = self._quaternion_jacobian_translation(
+                point, left_or_right, inverse=False)
+
         elif point_type == 'matrix':
             raise NotImplementedError()
 
         return jacobian
 
-    def random_uniform(self, n_samples=1, point_type=None):
+    def _quaternion_jacobian_translation(
+            self, point, left_or_right, inverse):
+        """
+        Jacobian of the left/right translations, or its inverse, for
+        quaternions whose tangent vectors are left-translated to the
+        identity.
         """
-        Sample in SO(n) with the uniform distribution.
+        point = self.regularize(point, point_type='quaternion')
+        n_points, _ = point.shape
+        if left_or_right == 'left':
+            return gs.repeat(
+                gs.expand_dims(gs.eye(self.dimension), axis=0),
+                n_points, axis=0)
+
+        rot_mat = self.matrix_from_quaternion(point)
+        if inverse:
+            return rot_mat
+        return gs.transpose(rot_mat, axes=(0, 2, 1))
+
+    def inverse_jacobian_translation(
+            self, point, left_or_right='left', point_type=None):
         """
+        Compute the inverse of the jacobian matrix of the differential
+        of the left/right translations from the identity to point in SO(n).
+
+        In 3D, the inverse is computed in closed form: for a rotation vector
+        of angle theta, it is the linear combination of the identity,
+        the outer product of the rotation vector with itself and
+        its skew-symmetric matrix, with coefficients
+        sin(theta) / theta, (1 - sin(theta) / theta) / theta ** 2
+        and -+ (1 - cos(theta)) / theta ** 2.
+        """
+        assert left_or_right in ('left', 'right')
+
         if point_type is None:
             point_type = self.default_point_type
 
-        if point_type == 'vector':
-            random_point = gs.random.rand(n_samples, self.dimension) * 2 - 1
+        if point_type == 'quaternion':
+            return self._quaternion_jacobian_translation(
+                point, left_or_right, inverse=True)
+
+        if point_type != 'vector' or self.n != 3:
+            return LieGroup.inverse_jacobian_translation(
+                self, point, left_or_right=left_or_right,
+                point_type=point_type)
+
+        point = self.regularize(point, point_type=point_type)
+        angle = gs.linalg.norm(point, axis=1)
+
+        mask_0 = angle < ANGLE_0_THRESHOLD
+        # This avoids dividing by 0.
+        safe_angle = gs.where(mask_0, gs.ones_like(angle), angle)
+
+        angle_2 = angle ** 2
+        coef_1 = gs.where(
+            mask_0,
+            1. - angle_2 / 6. + angle_2 ** 2 / 120.,
+            gs.sin(safe_angle) / safe_angle)
+        coef_2 = gs.where(
+            mask_0,
+            1. / 6. - angle_2 / 120. + angle_2 ** 2 / 5040.,
+            (1. - coef_1) / safe_angle ** 2)
+        coef_3 = gs.where(
+            mask_0,
+            1. / 2. - angle_2 / 24. + angle_2 ** 2 / 720.,
+            (1. - gs.cos(safe_angle)) / safe_angle ** 2)
+
+        sign = + 1 if left_or_right == 'left' else - 1
+
+        inv_jacobian = (
+            gs.einsum('n,ij->nij', coef_1, gs.eye(self.dimension))
+            + gs.einsum('n,ni,nj->nij', coef_2, point, point)
+            - sign * gs.einsum(
+                'n,nij->nij', coef_3, self.skew_matrix_from_vector(point)))
+        return inv_jacobian
+
+    def random_uniform(self, n_samples=1, point_type=None, rng=None):
+        """
+        Sample in SO(n) with the uniform distribution, i.e. the Haar measure.
+
+        In 3D, rotation vectors and quaternions are sampled from normalized
+        gaussian quaternions. Rotation matrices are sampled as the
+        orthogonal factors of the QR decompositions of gaussian matrices,
+        with the signs of the diagonal of the triangular factors
+        and of the determinant corrected (Mezzadri, 2007).
+
+        The random numbers are drawn from the random generator rng if it is
+        given, e.g. from gs.random.default_rng or gs.random.spawn_rngs for
+        parallel streams, and from the global random state otherwise.
+        """
+        if point_type is None:
+            point_type = self.default_point_type
+
+        if self.n == 3 and point_type != 'matrix':
+            random_quaternion = _normal((n_samples, 4), rng)
             random_point = self.regularize(
-                random_point, point_type=point_type)
-        elif point_type == 'matrix':
-            random_matrix = gs.random.rand(n_samples, self.n, self.n)
-            random_point = self.projection(random_matrix)
+                random_quaternion, point_type='quaternion')
+            if point_type == 'vector':
+                random_point = self.rotation_vector_from_quaternion(
+                    random_point)
+            return random_point
+
+        random_matrix = _normal((n_samples, self.n, self.n), rng)
+        mat_q, mat_r = gs.linalg.qr(random_matrix)
+        sign = gs.sign(gs.diagonal(mat_r, axis1=1, axis2=2))
+        mat_q = gs.einsum('nij,nj->nij', mat_q, sign)
+
+        # This maps the orthogonal matrices with determinant -1 to SO(n),
+        # which preserves the Haar measure.
+        det_sign = gs.sign(gs.linalg.det(mat_q))
+        first_column_sign = gs.concatenate(
+            [gs.expand_dims(det_sign, axis=1),
+             gs.ones((n_samples, self.n - 1))], axis=1)
+        random_point = gs.einsum('nij,nj->nij', mat_q, first_column_sign)
 
+        if point_type == 'vector':
+            random_point = self.rotation_vector_from_matrix(random_point)
         return random_point
 
     def group_exp_from_identity(self, tangent_vec, point_type=None):
@@ -1297,6 +1601,8 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
             tangent_vec = self.vector_from_skew_matrix(tangent_vec)
             point = self.matrix_from_rotation_vector(tangent_vec)
+        elif point_type == 'quaternion':
+            point = self.quaternion_from_rotation_vector(tangent_vec)
 
         return point
 
@@ -1313,17 +1619,63 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         elif point_type == 'matrix':
             point = self.rotation_vector_from_matrix(point)
             tangent_vec = self.skew_matrix_from_vector(point)
+        elif point_type == 'quaternion':
+            tangent_vec = self.rotation_vector_from_quaternion(point)
         return tangent_vec
 
+    def group_exp_not_from_identity(self, tangent_vec, base_point, point_type):
+        """
+        For quaternions, the tangent vectors are left-translated to the
+        identity, so that the group exponential is the composition
+        of base_point with the group exponential from the identity.
+        """
+        if point_type != 'quaternion':
+            return LieGroup.group_exp_not_from_identity(
+                self, tangent_vec, base_point, point_type)
+        group_exp_from_identity = self.group_exp_from_identity(
+            tangent_vec, point_type=point_type)
+        return self.compose(
+            base_point, group_exp_from_identity, point_type=point_type)
+
+    def group_log_not_from_identity(self, point, base_point, point_type):
+        """
+        For quaternions, the group logarithm is returned left-translated
+        to the identity.
+        """
+        if point_type != 'quaternion':
+            return LieGroup.group_log_not_from_identity(
+                self, point, base_point, point_type)
+        point_near_id = self.compose(
+            self.inverse(base_point, point_type=point_type),
+            point,
+            point_type=point_type)
+        return self.group_log_from_identity(
+            point_near_id, point_type=point_type)
+
     def group_exponential_barycenter(
-            self, points, weights=None, point_type=None):
+            self, points, weights=None, point_type=None,
+            method='frechet', n_iterations=0, return_deviation=False):
         """
         Compute the group exponential barycenter in SO(n), which is the
         Frechet mean of the canonical bi-invariant metric on SO(n).
+
+        In 3D, method='quaternion_eig' estimates it in a single pass,
+        as the top eigenvector of the weighted sum of the outer products
+        of the unit quaternions, refined with n_iterations Frechet
+        iterations. If return_deviation is True, the bi-invariant distance
+        between this estimate and the Frechet mean is returned with it.
         """
         if point_type is None:
             point_type = self.default_point_type
 
+        if method == 'quaternion_eig':
+            return self._quaternion_eig_barycenter(
+                points, weights, point_type, n_iterations, return_deviation)
+
+        if method != 'frechet':
+            raise ValueError('method should be \'frechet\''
+                             ' or \'quaternion_eig\'.')
+
         if point_type == 'vector':
             n_points = points.shape[0]
             assert n_points > 0
@@ -1345,4 +1697,90 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
                 points, weights, point_type='vector')
             exp_bar = self.matrix_from_rotation_vector(exp_bar)
 
+        elif point_type == 'quaternion':
+            points = self.regularize(points, point_type=point_type)
+            exp_bar = self._quaternion_barycenter_iterations(
+                points, weights, points[:1], N_MAX_ITERATIONS)
+
+        return exp_bar
+
+    def _quaternion_barycenter_iterations(
+            self, quaternions, weights, exp_bar, n_iterations):
+        """
+        Refine an estimate of the group exponential barycenter
+        of unit quaternions with Frechet iterations.
+        """
+        n_points = quaternions.shape[0]
+        if weights is None:
+            weights = gs.ones((n_points, 1))
+        weights = gs.to_ndarray(weights, to_ndim=2, axis=1)
+
+        for i_iteration in range(n_iterations):
+            logs = self.group_log(
+                quaternions, base_point=exp_bar, point_type='quaternion')
+            tangent_mean = gs.einsum(
+                'nk,nj->j', weights, logs) / gs.sum(weights)
+            exp_bar = self.group_exp(
+                tangent_mean, base_point=exp_bar, point_type='quaternion')
+            if gs.linalg.norm(tangent_mean) < EPSILON:
+                break
+
         return exp_bar
+
+    def _quaternion_eig_barycenter(
+            self, points, weights, point_type,
+            n_iterations, return_deviation):
+        """
+        Estimate the group exponential barycenter in SO(3) from the
+        top eigenvector of the weighted quaternion outer products.
+        """
+        if self.n != 3:
+            raise NotImplementedError(
+                'The quaternion barycenter is only implemented in 3D.')
+
+        if point_type == 'vector':
+            quaternions = self.quaternion_from_rotation_vector(points)
+        elif point_type == 'matrix':
+            quaternions = self.quaternion_from_matrix(points)
+        elif point_type == 'quaternion':
+            quaternions = gs.to_ndarray(points, to_ndim=2)
+
+        n_points = quaternions.shape[0]
+        assert n_points > 0
+        if weights is None:
+            weights = gs.ones((n_points, 1))
+        weights = gs.to_ndarray(weights, to_ndim=2, axis=1)
+        assert weights.shape[0] == n_points
+
+        outer_products = gs.einsum(
+            'nk,ni,nj->ij', weights, quaternions, quaternions)
+        _, eigvecs = gs.linalg.eigh(outer_products)
+        quaternion_bar = self.regularize(
+            gs.to_ndarray(eigvecs[:, -1], to_ndim=2),
+            point_type='quaternion')
+        quaternion_bar = self._quaternion_barycenter_iterations(
+            quaternions, weights, quaternion_bar, n_iterations)
+
+        if point_type == 'vector':
+            exp_bar = self.rotation_vector_from_quaternion(quaternion_bar)
+        elif point_type == 'matrix':
+            exp_bar = self.matrix_from_quaternion(quaternion_bar)
+        elif point_type == 'quaternion':
+            exp_bar = quaternion_bar
+
+        if not return_deviation:
+            return exp_bar
+
+        frechet_mean = self._quaternion_barycenter_iterations(
+            quaternions, weights, quaternion_bar, N_MAX_ITERATIONS)
+        # Angle of the relative rotation, whatever the point type, from
+        # the chord |q_bar - q_frechet| = 2 sin(angle / 4), which stays
+        # accurate for small angles.
+        sign = gs.where(
+            gs.sum(quaternion_bar * frechet_mean, axis=1) < 0., -1., 1.)
+        chord = gs.linalg.norm(
+            quaternion_bar - gs.einsum('n,ni->ni', sign, frechet_mean),
+            axis=1)
+        deviation = 4. * gs.arcsin(gs.clip(chord / 2., 0., 1.))
+        deviation = gs.to_ndarray(deviation, to_ndim=2, axis=1)
+        return exp_bar, deviation
@@ -0,0 +1,180 @@
+"""
+Bezier splines on manifolds, computed with the de Casteljau algorithm.
+"""
+
+import geomstats.backend as gs
+
+BATCH_SIZE = 100000
+
+
+def _point_ndim(point_type):
+    assert point_type in ('vector', 'matrix')
+    return 1 if point_type == 'vector' else 2
+
+
+def _batch_log(metric, points, base_points):
+    """
+    Riemannian logarithms between stacks of points of shape
+    (n_samples, n_points, ...), computed in one call of the metric.
+    """
+    n_samples, n_points = points.shape[:2]
+    point_shape = points.shape[2:]
+    log = metric.log(
+        point=gs.reshape(points, (-1,) + point_shape),
+        base_point=gs.reshape(base_points, (-1,) + point_shape))
+    return gs.reshape(log, (n_samples, n_points) + point_shape)
+
+
+def _batch_exp(metric, tangent_vecs, base_points):
+    """
+    Riemannian exponentials of stacks of tangent vectors of shape
+    (n_samples, n_points, ...), computed in one call of the metric.
+    """
+    n_samples, n_points = tangent_vecs.shape[:2]
+    point_shape = tangent_vecs.shape[2:]
+    exp = metric.exp(
+        tangent_vec=gs.reshape(tangent_vecs, (-1,) + point_shape),
+        base_point=gs.reshape(base_points, (-1,) + point_shape))
+    return gs.reshape(exp, (n_samples, n_points) + point_shape)
+
+
+def de_casteljau(metric, control_points, times, control_logs=None):
+    """
+    Evaluate Bezier curves with the de Casteljau algorithm.
+
+    Each sample has its own control polygon and its own time:
+    control_points has shape (n_samples, degree + 1, ...)
+    and times has shape (n_samples,).
+
+    Each level of the algorithm is computed for all the samples and all
+    the points of the control polygons with one batched log and one
+    batched exp, so that a curve of degree d costs d calls to exp and
+    d - 1 calls to log, whatever the number of samples.
+    The logs between consecutive control points, of shape
+    (n_samples, degree, ...), can be given by control_logs.
+    """
+    times = gs.to_ndarray(times, to_ndim=1)
+    n_samples, n_control_points = control_points.shape[:2]
+    point_shape = control_points.shape[2:]
+    degree = n_control_points - 1
+
+    if control_logs is None and degree > 0:
+        control_logs = _batch_log(
+            metric, control_points[:, 1:], control_points[:, :-1])
+
+    times = gs.reshape(times, (n_samples, 1) + (1,) * len(point_shape))
+
+    points = control_points
+    logs = control_logs
+    for level in range(degree):
+        if level > 0:
+            logs = _batch_log(metric, points[:, 1:], points[:, :-1])
+        points = _batch_exp(metric, times * logs, points[:, :-1])
+
+    return points[:, 0]
+
+
+def _naive_de_casteljau(metric, control_points, time):
+    """
+    De Casteljau algorithm for one sample, with one exp and one log
+    per pair of points and per level.
+    """
+    points = [control_points[i] for i in range(control_points.shape[0])]
+    while len(points) > 1:
+        next_points = []
+        for point, next_point in zip(points[:-1], points[1:]):
+            log = metric.log(point=next_point, base_point=point)
+            next_points.append(
+                metric.exp(tangent_vec=time * log, base_point=point)[0])
+        points = next_points
+    return points[0]
+
+
+def _naive_evaluate(spline, times):
+    """
+    Evaluate a spline sample per sample with the naive de Casteljau
+    algorithm, as a reference for BezierSpline.evaluate.
+    """
+    segment_index, local_times = spline.segment_times(times)
+    return gs.array([
+        _naive_de_casteljau(
+            spline.metric, spline.control_points[index], local_time)
+        for index, local_time in zip(segment_index, local_times)])
+
+
+class BezierSpline(object):
+    """
+    Class for piecewise Bezier curves on a manifold equipped with a metric.
+
+    The segment i has the control points control_points[i] and is
+    parameterized on [knots[i], knots[i + 1]].
+    The logs between consecutive control points do not depend on the
+    time and are computed once, at the construction of the spline.
+    """
+
+    def __init__(self, metric, control_points, knots=None,
+                 point_type='vector'):
+        point_ndim = _point_ndim(point_type)
+
+        control_points = gs.to_ndarray(control_points, to_ndim=point_ndim+2)
+        n_segments, n_control_points = control_points.shape[:2]
+
+        if knots is None:
+            knots = gs.arange(n_segments + 1)
+        knots = gs.cast(gs.to_ndarray(knots, to_ndim=1), gs.float64)
+        assert knots.shape == (n_segments + 1,)
+
+        self.metric = metric
+        self.point_type = point_type
+        self.control_points = control_points
+        self.knots = knots
+        self.degree = n_control_points - 1
+
+        self.control_logs = None
+        if self.degree > 0:
+            self.control_logs = _batch_log(
+                metric, control_points[:, 1:], control_points[:, :-1])
+
+    def segment_times(self, times):
+        """
+        Index of the segment and time in [0, 1] along the segment
+        for each time.
+        """
+        times = gs.to_ndarray(times, to_ndim=1)
+        n_segments = self.control_points.shape[0]
+
+        segment_index = gs.searchsorted(self.knots, times, side='right') - 1
+        segment_index = gs.clip(segment_index, 0, n_segments - 1)
+
+        start_times = gs.gather(self.knots, segment_index)
+        durations = gs.gather(self.knots, segment_index + 1) - start_times
+        local_times = gs.clip((times - start_times) / durations, 0., 1.)
+        return segment_index, local_times
+
+    def evaluate(self, times, batch_size=BATCH_SIZE):
+        """
+        Evaluate the spline at the given times.
+
+        The times are processed by batches of batch_size samples,
+        which bounds the memory used by the de Casteljau levels.
+        """
+        times = gs.to_ndarray(times, to_ndim=1)
+        n_times = times.shape[0]
+        segment_index, local_times = self.segment_times(times)
+
+        points = []
+        for start in range(0, n_times, batch_size):
+            batch_index = segment_index[start:start + batch_size]
+            control_logs = None
+            if self.control_logs is not None:
+                control_logs = gs.gather(self.control_logs, batch_index)
+            points.append(de_casteljau(
+                self.metric,
+                gs.gather(self.control_points, batch_index),
+                local_times[start:start + batch_size],
+                control_logs=control_logs))
+
+        return gs.concatenate(points, axis=0)
+
+    def __call__(self, times):
+        return self.evaluate(times)
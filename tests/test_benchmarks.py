@@ -0,0 +1,113 @@
+"""
+Unit tests for the benchmarks.
+"""
+
+import os
+import sys
+
+import benchmarks.bench_christoffel as bench_christoffel
+import benchmarks.bench_cumulative_compose as bench_cumulative_compose
+import benchmarks.bench_geodesic_shooting as bench_geodesic_shooting
+import benchmarks.bench_group_exp_log as bench_group_exp_log
+import benchmarks.bench_invariant_inner_product as \
+    bench_invariant_inner_product
+import benchmarks.bench_parallel_transport as bench_parallel_transport
+import benchmarks.bench_se3_exp_log as bench_se3_exp_log
+import benchmarks.bench_so3_barycenter as bench_so3_barycenter
+import benchmarks.bench_so3_compose as bench_so3_compose
+import benchmarks.bench_so3_conversions as bench_so3_conversions
+import benchmarks.bench_so3_jacobian as bench_so3_jacobian
+import benchmarks.bench_so3_rotation_vector as bench_so3_rotation_vector
+import benchmarks.bench_son_exp_log as bench_son_exp_log
+import benchmarks.bench_son_projection as bench_son_projection
+import benchmarks.bench_spd_base_point as bench_spd_base_point
+import benchmarks.bench_spd_metrics as bench_spd_metrics
+import benchmarks.bench_splines as bench_splines
+import geomstats.tests
+
+
+class TestBenchmarks(geomstats.tests.TestCase):
+    _multiprocess_can_split_ = True
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stdout = sys.stdout
+        cls.devnull = open(os.devnull, 'w')
+        sys.stdout = cls.devnull
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.stdout = cls.stdout
+        cls.devnull.close()
+
+    @geomstats.tests.np_only
+    def test_bench_splines(self):
+        bench_splines.main(n_samples_list=[10], n_naive_samples=2)
+
+    @geomstats.tests.np_only
+    def test_bench_parallel_transport(self):
+        bench_parallel_transport.main(n_samples=5, n_rungs_list=[1])
+
+    @geomstats.tests.np_only
+    def test_bench_geodesic_shooting(self):
+        bench_geodesic_shooting.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_christoffel(self):
+        bench_christoffel.main(n_points_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_so3_rotation_vector(self):
+        bench_so3_rotation_vector.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_so3_compose(self):
+        bench_so3_compose.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_so3_jacobian(self):
+        bench_so3_jacobian.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_se3_exp_log(self):
+        bench_se3_exp_log.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_cumulative_compose(self):
+        bench_cumulative_compose.main(n_points_list=[5], n_loop_points=5)
+
+    @geomstats.tests.np_only
+    def test_bench_son_exp_log(self):
+        bench_son_exp_log.main(n_list=[4], n_samples=5)
+
+    @geomstats.tests.np_only
+    def test_bench_son_projection(self):
+        bench_son_projection.main(n_list=[4], n_samples=5)
+
+    @geomstats.tests.np_only
+    def test_bench_so3_barycenter(self):
+        bench_so3_barycenter.main(n_samples_list=[5], n_iterations=1)
+
+    @geomstats.tests.np_only
+    def test_bench_so3_conversions(self):
+        bench_so3_conversions.main(n_samples=5)
+
+    @geomstats.tests.np_only
+    def test_bench_group_exp_log(self):
+        bench_group_exp_log.main(n_samples=5, fractions=[0.4])
+
+    @geomstats.tests.np_only
+    def test_bench_invariant_inner_product(self):
+        bench_invariant_inner_product.main(n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_spd_metrics(self):
+        bench_spd_metrics.main(n=3, n_samples_list=[5])
+
+    @geomstats.tests.np_only
+    def test_bench_spd_base_point(self):
+        bench_spd_base_point.main(n=3, n_samples_list=[5], n_calls=2)
+
+
+if __name__ == '__main__':
+        geomstats.tests.main()
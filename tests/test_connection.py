@@ -2,11 +2,44 @@
 Unit tests for the affine connections.
 """
 
+import autograd.numpy
+
 import geomstats.backend as gs
 import geomstats.tests
 
 from geomstats.connection import LeviCivitaConnection
 from geomstats.euclidean_space import EuclideanMetric
+from geomstats.riemannian_metric import RiemannianMetric
+
+
+class HalfPlaneMetric(RiemannianMetric):
+    """
+    Hyperbolic metric of the upper half-plane, written with autograd
+    so that it can be differentiated.
+    """
+    def __init__(self):
+        super(HalfPlaneMetric, self).__init__(dimension=2)
+
+    def inner_product_matrix(self, base_point=None):
+        return autograd.numpy.einsum(
+            'n,ij->nij', 1. / base_point[:, 1] ** 2, autograd.numpy.eye(2))
+
+
+class SphericalCoordinatesMetric(RiemannianMetric):
+    """
+    Metric of the 2-sphere in spherical coordinates (theta, phi),
+    written with autograd so that it can be differentiated.
+    """
+    def __init__(self):
+        super(SphericalCoordinatesMetric, self).__init__(dimension=2)
+
+    def inner_product_matrix(self, base_point=None):
+        sin_theta = autograd.numpy.sin(base_point[:, 0])
+        ones = autograd.numpy.ones_like(sin_theta)
+        zeros = autograd.numpy.zeros_like(sin_theta)
+        return autograd.numpy.stack([
+            autograd.numpy.stack([ones, zeros], axis=1),
+            autograd.numpy.stack([zeros, sin_theta ** 2], axis=1)], axis=1)
 
 
 class TestConnectionMethods(geomstats.tests.TestCase):
@@ -16,6 +49,7 @@ class TestConnectionMethods(geomstats.tests.TestCase):
         self.dimension = 4
         self.metric = EuclideanMetric(dimension=self.dimension)
         self.connection = LeviCivitaConnection(self.metric)
+        self.half_plane_connection = LeviCivitaConnection(HalfPlaneMetric())
 
     def test_metric_matrix(self):
         base_point = gs.array([0., 1., 0., 0.])
@@ -53,6 +87,176 @@ class TestConnectionMethods(geomstats.tests.TestCase):
 
         gs.testing.assert_allclose(result, expected)
 
+    def test_parallel_transport(self):
+        """
+        Test that the pole ladder of the Euclidean metric
+        is the identity, for any number of rungs.
+        """
+        base_point = gs.array([[0., 1., 0., 0.], [1., 2., 3., 4.]])
+        tangent_vec_a = gs.array([[1., 0., 2., 0.], [0., 1., 1., 0.]])
+        tangent_vec_b = gs.array([[0., 3., 1., 1.], [2., 0., 0., 1.]])
+
+        for n_rungs in [1, 3]:
+            result = self.metric.parallel_transport(
+                tangent_vec_a, tangent_vec_b, base_point, n_rungs=n_rungs)
+            expected = tangent_vec_a
+
+            with self.session():
+                self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_christoffel_symbols_half_plane(self):
+        base_point = gs.array([[0., 1.], [1., 2.]])
+
+        result = self.half_plane_connection.christoffel_symbols(base_point)
+        expected = gs.zeros((2, 2, 2, 2))
+        for i_point, y in enumerate(base_point[:, 1]):
+            expected[i_point, 0, 0, 1] = - 1. / y
+            expected[i_point, 0, 1, 0] = - 1. / y
+            expected[i_point, 1, 0, 0] = 1. / y
+            expected[i_point, 1, 1, 1] = - 1. / y
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_exp_half_plane(self):
+        """
+        Test the numerical exponential of the hyperbolic half-plane
+        along vertical geodesics, where it is known in closed form,
+        and that it preserves the length of generic tangent vectors.
+        """
+        base_point = gs.array([[0., 1.], [1., 2.], [-1., .5]])
+        tangent_vec = gs.array([[0., 1.], [0., -1.], [0., .3]])
+
+        result = self.half_plane_connection.exp(
+            tangent_vec, base_point, n_steps=20)
+        expected = gs.stack([
+            base_point[:, 0],
+            base_point[:, 1] * gs.exp(tangent_vec[:, 1] / base_point[:, 1])],
+            axis=1)
+        self.assertAllClose(result, expected, atol=1e-6)
+
+        tangent_vec = gs.array([[1., .5], [-2., 1.], [.1, -.2]])
+        for step in ['rk4', 'dopri']:
+            end_point = self.half_plane_connection.exp(
+                tangent_vec, base_point, n_steps=50, step=step)
+            result = gs.arccosh(1. + gs.sum(
+                (end_point - base_point) ** 2, axis=1) / (
+                2. * end_point[:, 1] * base_point[:, 1]))
+            expected = gs.linalg.norm(tangent_vec, axis=1) / base_point[:, 1]
+            self.assertAllClose(result, expected, atol=1e-6)
+
+    @geomstats.tests.np_only
+    def test_exp_euclidean(self):
+        base_point = gs.array([[0., 1., 0., 0.], [1., 2., 3., 4.]])
+        tangent_vec = gs.array([[1., 0., 2., 0.], [0., 1., 1., 0.]])
+
+        result = LeviCivitaConnection(self.metric).exp(
+            tangent_vec, base_point)
+        expected = base_point + tangent_vec
+
+        self.assertAllClose(result, expected)
+
+        base_points = gs.concatenate([base_point, base_point[:1]])
+        self.assertRaises(
+            AssertionError, LeviCivitaConnection(self.metric).exp,
+            tangent_vec, base_points)
+
+    @geomstats.tests.np_only
+    def test_log_half_plane(self):
+        base_point = gs.array([[0., 1.], [1., 2.], [-1., .5], [0., 1.]])
+        expected = gs.array([[1., .5], [-2., 1.], [.1, -.2], [0., 1.]])
+        point = self.half_plane_connection.exp(expected, base_point)
+
+        result, info = self.half_plane_connection.log(
+            point, base_point, return_info=True)
+
+        self.assertAllClose(result, expected, atol=1e-5)
+        self.assertTrue(gs.all(info['converged']))
+        self.assertAllClose(
+            point[-1], gs.array([0., gs.exp(1.)]), atol=1e-5)
+
+        self.assertRaises(
+            AssertionError, self.half_plane_connection.log,
+            point[:3], base_point[:2])
+
+    @geomstats.tests.np_only
+    def test_log_half_plane_warm_start(self):
+        base_point = gs.array([[0., 1.], [1., 2.]])
+        expected = gs.array([[1., .5], [-2., 1.]])
+        point = self.half_plane_connection.exp(expected, base_point)
+
+        _, info = self.half_plane_connection.log(
+            point, base_point, return_info=True)
+        result, warm_info = self.half_plane_connection.log(
+            point, base_point, initial_tangent_vec=expected + 1e-3,
+            return_info=True)
+
+        self.assertAllClose(result, expected, atol=1e-5)
+        self.assertTrue(gs.all(
+            warm_info['n_iterations'] < info['n_iterations']))
+
+        self.assertRaises(
+            AssertionError, self.half_plane_connection.log,
+            point, base_point, initial_tangent_vec=gs.zeros((3, 2)))
+
+    @geomstats.tests.np_only
+    def test_christoffel_symbols_cache(self):
+        connection = LeviCivitaConnection(HalfPlaneMetric(), cache_size=3)
+        base_point = gs.array([[0., 1.], [1., 2.], [0., 1.]])
+
+        result = connection.christoffel_symbols(base_point)
+        expected = self.half_plane_connection.christoffel_symbols(base_point)
+        self.assertAllClose(result, expected)
+        self.assertEqual(len(connection.christoffel_cache), 2)
+
+        base_point = gs.array([[1., 2.], [3., 4.], [5., 6.]])
+        result = connection.christoffel_symbols(base_point)
+        expected = self.half_plane_connection.christoffel_symbols(base_point)
+        self.assertAllClose(result, expected)
+        self.assertEqual(len(connection.christoffel_cache), 3)
+
+    @geomstats.tests.np_only
+    def test_curvature_half_plane(self):
+        base_point = gs.array([[0., 1.], [1., 2.], [-1., .5]])
+        tangent_vec_a = gs.array([[1., 0.], [1., 2.], [.3, -1.]])
+        tangent_vec_b = gs.array([[0., 1.], [-1., 1.], [2., 0.]])
+        metric_matrix = self.half_plane_connection.metric_matrix(base_point)
+
+        curvature = self.half_plane_connection.riemannian_curvature(
+            base_point)
+        result = gs.einsum('nim,nmjkl->nijkl', metric_matrix, curvature)
+        expected = - (
+            gs.einsum('nik,njl->nijkl', metric_matrix, metric_matrix)
+            - gs.einsum('nil,njk->nijkl', metric_matrix, metric_matrix))
+        self.assertAllClose(result, expected)
+
+        result = self.half_plane_connection.ricci_tensor(base_point)
+        self.assertAllClose(result, - metric_matrix)
+
+        result = self.half_plane_connection.scalar_curvature(base_point)
+        self.assertAllClose(result, - 2. * gs.ones((3, 1)))
+
+        result = self.half_plane_connection.sectional_curvature(
+            tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(result, - gs.ones((3, 1)))
+
+        self.assertRaises(
+            AssertionError, self.half_plane_connection.sectional_curvature,
+            tangent_vec_a[:2], tangent_vec_b, base_point)
+
+    @geomstats.tests.np_only
+    def test_curvature_spherical_coordinates(self):
+        connection = LeviCivitaConnection(SphericalCoordinatesMetric())
+        base_point = gs.array([[.5, 0.], [1., 2.], [2., -1.]])
+
+        result = connection.scalar_curvature(base_point)
+        self.assertAllClose(result, 2. * gs.ones((3, 1)))
+
+        result = connection.sectional_curvature(
+            gs.array([1., 2.]), gs.array([-1., 1.]), base_point)
+        self.assertAllClose(result, gs.ones((3, 1)))
+
 
 if __name__ == '__main__':
         geomstats.tests.main()
@@ -160,6 +160,22 @@ class TestGeneralLinearGroupMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    @geomstats.tests.np_only
+    def test_cumulative_compose_and_relative_poses(self):
+        n_points = 7
+        points = (gs.eye(self.n)
+                  + 0.1 * gs.random.rand(n_points, self.n, self.n))
+
+        result = self.group.cumulative_compose(points)
+        expected = [points[0]]
+        for point in points[1:]:
+            expected.append(gs.matmul(expected[-1], point))
+        expected = gs.stack(expected)
+        self.assertAllClose(result, expected)
+
+        result = self.group.relative_poses(expected)
+        self.assertAllClose(result, points[1:])
+
 
 if __name__ == '__main__':
         geomstats.tests.main()
@@ -407,6 +407,69 @@ class TestHyperbolicSpaceMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    @geomstats.tests.np_only
+    def test_parallel_transport(self):
+        """
+        Test that the closed-form parallel transport is an isometry
+        onto the tangent space at the end point, which agrees
+        with the pole ladder.
+        """
+        n_samples = self.n_samples
+        base_point = self.space.random_uniform(n_samples=n_samples)
+        tangent_vec_a = self.space.projection_to_tangent_space(
+            vector=gs.random.rand(n_samples, self.dimension + 1),
+            base_point=base_point)
+        tangent_vec_b = self.space.projection_to_tangent_space(
+            vector=gs.random.rand(n_samples, self.dimension + 1),
+            base_point=base_point)
+
+        result = self.metric.parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        end_point = self.metric.exp(tangent_vec_b, base_point)
+
+        self.assertAllClose(
+            self.metric.inner_product(result, end_point),
+            gs.zeros((n_samples, 1)))
+        self.assertAllClose(
+            self.metric.squared_norm(result),
+            self.metric.squared_norm(tangent_vec_a))
+
+        expected = super(type(self.metric), self.metric).parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_curvature(self):
+        base_point = self.space.random_uniform(n_samples=3)
+        tangent_vec_a = self.space.projection_to_tangent_space(
+            vector=gs.random.rand(3, self.dimension + 1),
+            base_point=base_point)
+        tangent_vec_b = self.space.projection_to_tangent_space(
+            vector=gs.random.rand(3, self.dimension + 1),
+            base_point=base_point)
+
+        curvature = self.metric.riemannian_curvature(base_point)
+        curvature_a_b_b = gs.einsum(
+            'nijkl,nj,nk,nl->ni',
+            curvature, tangent_vec_b, tangent_vec_a, tangent_vec_b)
+        sq_norm_a = self.metric.squared_norm(tangent_vec_a)
+        sq_norm_b = self.metric.squared_norm(tangent_vec_b)
+        inner_prod = self.metric.inner_product(tangent_vec_a, tangent_vec_b)
+        result = self.metric.inner_product(curvature_a_b_b, tangent_vec_a) / (
+            sq_norm_a * sq_norm_b - inner_prod ** 2)
+        expected = self.metric.sectional_curvature(
+            tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(result, expected)
+
+        result = gs.einsum('nijil->njl', curvature)
+        expected = self.metric.ricci_tensor(base_point)
+        self.assertAllClose(result, expected)
+
+        result = self.metric.scalar_curvature(base_point)
+        expected = - self.dimension * (self.dimension - 1) * gs.ones(
+            (3, 1))
+        self.assertAllClose(result, expected)
+
 
 if __name__ == '__main__':
     geomstats.tests.main()
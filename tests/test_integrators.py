@@ -0,0 +1,91 @@
+"""
+Unit tests for the integrators of ordinary differential equations.
+"""
+
+import geomstats.backend as gs
+import geomstats.integrators as integrators
+import geomstats.tests
+
+
+def harmonic_oscillator(state):
+    """
+    Force of the harmonic oscillators y'' = - y,
+    on states (y, y') of shape (n_samples, 2).
+    """
+    return gs.stack([state[:, 1], - state[:, 0]], axis=1)
+
+
+class TestIntegratorsMethods(geomstats.tests.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.initial_state = gs.array([[1., 0.], [0., 2.], [-1., 1.]])
+        self.end_time = 2.
+
+    def expected_state(self):
+        position, velocity = self.initial_state[:, 0], self.initial_state[:, 1]
+        cos, sin = gs.cos(self.end_time), gs.sin(self.end_time)
+        return gs.stack([
+            cos * position + sin * velocity,
+            - sin * position + cos * velocity], axis=1)
+
+    @geomstats.tests.np_only
+    def test_integrate(self):
+        expected = self.expected_state()
+        for step, n_steps, atol in [('euler', 10000, 1e-3), ('rk4', 50, 1e-6)]:
+            result = integrators.integrate(
+                harmonic_oscillator, self.initial_state,
+                end_time=self.end_time, n_steps=n_steps, step=step)
+
+            self.assertAllClose(result, expected, atol=atol)
+
+    @geomstats.tests.np_only
+    def test_integrate_adaptive(self):
+        result = integrators.integrate(
+            harmonic_oscillator, self.initial_state,
+            end_time=self.end_time, step='dopri')
+        expected = self.expected_state()
+
+        self.assertAllClose(result, expected, atol=1e-6)
+
+    @geomstats.tests.np_only
+    def test_integrate_adaptive_per_sample(self):
+        """
+        Test that samples with different stiffness are integrated
+        with their own step sizes, by counting the evaluations of the force.
+        """
+        n_evaluated = []
+
+        def force(state):
+            n_evaluated.append(state.shape[0])
+            stiffness = state[:, 1]
+            return gs.stack(
+                [- stiffness * state[:, 0], gs.zeros_like(stiffness)], axis=1)
+
+        initial_state = gs.array([[1., 1.], [1., 100.]])
+        result = integrators.integrate_adaptive(force, initial_state)
+        expected = gs.exp(- initial_state[:, 1])
+
+        self.assertAllClose(result[:, 0], expected, atol=1e-6)
+
+        self.assertTrue(n_evaluated[-1] < n_evaluated[0])
+
+    @geomstats.tests.np_only
+    def test_integrate_adaptive_max_steps(self):
+        self.assertRaises(
+            RuntimeError, integrators.integrate_adaptive,
+            harmonic_oscillator, self.initial_state,
+            end_time=self.end_time, max_steps=2)
+
+    @geomstats.tests.np_only
+    def test_integrate_adaptive_not_finite(self):
+        def force(state):
+            return float('nan') * state
+
+        self.assertRaises(
+            RuntimeError, integrators.integrate_adaptive,
+            force, self.initial_state, end_time=self.end_time)
+
+
+if __name__ == '__main__':
+        geomstats.tests.main()
@@ -0,0 +1,144 @@
+"""
+Unit tests for the geodesic interpolation of time series.
+"""
+
+import geomstats.backend as gs
+import geomstats.interpolation as interpolation
+import geomstats.tests
+
+from geomstats.hypersphere import Hypersphere
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+from geomstats.spd_matrices_space import SPDMatricesSpace
+
+
+class TestInterpolationMethods(geomstats.tests.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        gs.random.seed(1234)
+
+        self.sphere = Hypersphere(dimension=2)
+        self.so3_group = SpecialOrthogonalGroup(n=3)
+        self.se3_group = SpecialEuclideanGroup(n=3)
+        self.spd_space = SPDMatricesSpace(n=3)
+
+        self.times = gs.array([0., 1., 1.5, 3.])
+        self.query_times = gs.array([-1., 0., .25, 1., 1.2, 2.9, 3., 4.])
+
+    def expected_interpolation(self, metric, points):
+        expected = []
+        for query_time in self.query_times:
+            index = gs.searchsorted(self.times, query_time, side='right') - 1
+            index = min(max(index, 0), len(self.times) - 2)
+            start_time = self.times[index]
+            end_time = self.times[index + 1]
+            fraction = (query_time - start_time) / (end_time - start_time)
+            fraction = min(max(fraction, 0.), 1.)
+            log = metric.log(
+                point=points[index + 1], base_point=points[index])
+            point = metric.exp(
+                tangent_vec=fraction * log, base_point=points[index])
+            expected.append(point[0])
+        return gs.array(expected)
+
+    @geomstats.tests.np_only
+    def test_interpolate_hypersphere(self):
+        points = self.sphere.random_uniform(n_samples=4)
+        metric = self.sphere.metric
+
+        result = interpolation.interpolate(
+            metric, self.times, points, self.query_times)
+        expected = self.expected_interpolation(metric, points)
+
+        self.assertAllClose(result, expected)
+        self.assertAllClose(result[1], points[0])
+        self.assertAllClose(result[-2], points[-1])
+
+    @geomstats.tests.np_only
+    def test_interpolate_so3(self):
+        points = self.so3_group.random_uniform(n_samples=4)
+        metric = self.so3_group.bi_invariant_metric
+
+        result = interpolation.interpolate(
+            metric, self.times, points, self.query_times)
+        expected = self.expected_interpolation(metric, points)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_interpolate_se3(self):
+        points = self.se3_group.random_uniform(n_samples=4)
+        metric = self.se3_group.left_canonical_metric
+
+        result = interpolation.interpolate(
+            metric, self.times, points, self.query_times)
+        expected = self.expected_interpolation(metric, points)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_interpolate_spd(self):
+        points = self.spd_space.random_uniform(n_samples=4)
+        metric = self.spd_space.metric
+
+        result = interpolation.interpolate(
+            metric, self.times, points, self.query_times,
+            point_type='matrix')
+        expected = self.expected_interpolation(metric, points)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_interpolate_repeated_timestamps(self):
+        points = self.sphere.random_uniform(n_samples=3)
+        times = gs.array([0., 1., 1.])
+
+        result = interpolation.interpolate(
+            self.sphere.metric, times, points, gs.array([1., 2.]))
+
+        self.assertTrue(gs.all(self.sphere.belongs(result)))
+
+    @geomstats.tests.np_only
+    def test_interpolate_stream(self):
+        points = self.sphere.random_uniform(n_samples=10)
+        times = gs.linspace(0., 9., 10)
+        query_times = gs.linspace(0., 9., 37)
+        metric = self.sphere.metric
+
+        samples = ((times[i:i + 3], points[i:i + 3])
+                   for i in range(0, 10, 3))
+        chunks = list(interpolation.interpolate_stream(
+            metric, samples, iter(query_times)))
+
+        result_times = gs.concatenate([chunk[0] for chunk in chunks])
+        result = gs.concatenate([chunk[1] for chunk in chunks])
+        expected = interpolation.interpolate(
+            metric, times, points, query_times)
+
+        self.assertAllClose(result_times, query_times)
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_interpolate_stream_after_last_time(self):
+        points = self.sphere.random_uniform(n_samples=4)
+        times = gs.linspace(0., 3., 4)
+        query_times = gs.array([0.5, 2.5, 3.5, 4., 5., 6., 7.])
+        metric = self.sphere.metric
+
+        samples = ((times[i:i + 2], points[i:i + 2])
+                   for i in range(0, 4, 2))
+        chunks = list(interpolation.interpolate_stream(
+            metric, samples, iter(query_times)))
+
+        result_times = gs.concatenate([chunk[0] for chunk in chunks])
+        result = gs.concatenate([chunk[1] for chunk in chunks])
+        expected = interpolation.interpolate(
+            metric, times, points, query_times)
+
+        self.assertAllClose(result_times, query_times)
+        self.assertAllClose(result, expected)
+
+
+if __name__ == '__main__':
+        geomstats.tests.main()
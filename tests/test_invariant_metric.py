@@ -8,8 +8,11 @@ import geomstats.backend as gs
 import geomstats.tests
 import tests.helper as helper
 
+from geomstats.general_linear_group import GeneralLinearGroup
+from geomstats.invariant_metric import BiInvariantMetric
 from geomstats.invariant_metric import InvariantMetric
 from geomstats.special_euclidean_group import SpecialEuclideanGroup
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
 
 
 class TestInvariantMetricMethods(geomstats.tests.TestCase):
@@ -438,6 +441,123 @@ class TestInvariantMetricMethods(geomstats.tests.TestCase):
                                              base_point=self.point_1)
         self.assertAllClose(result, expected)
 
+    @geomstats.tests.np_only
+    def test_inner_product_mat_at_identity_factorization(self):
+        group = self.group
+        mat = gs.random.rand(group.dimension, group.dimension)
+        mat = gs.matmul(mat, gs.transpose(mat)) + gs.eye(group.dimension)
+        diag_mat = gs.diag(gs.array([1., 2., 3., 4., 5., 6.]))
+
+        for inner_prod_mat in [mat, diag_mat]:
+            metric = InvariantMetric(
+                group=group, inner_product_mat_at_identity=inner_prod_mat)
+            self.assertEqual(metric.signature, (group.dimension, 0, 0))
+
+            result = metric.sqrt_inner_product_mat_at_identity
+            expected = gs.linalg.sqrtm(inner_prod_mat)
+            self.assertAllClose(result, expected)
+
+            result = metric.inv_sqrt_inner_product_mat_at_identity
+            expected = gs.linalg.inv(expected)
+            self.assertAllClose(result, expected)
+
+        metric = InvariantMetric(
+            group=group, inner_product_mat_at_identity=diag_mat)
+        tangent_vec = gs.array([[0.1, -0.2, 0.3, 1., 2., 3.]])
+        result = metric.left_exp_from_identity(tangent_vec)
+        expected = group.regularize(
+            tangent_vec * gs.sqrt(gs.array([1., 2., 3., 4., 5., 6.])))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_inner_product_matrix_group(self):
+        group = GeneralLinearGroup(n=3)
+        inner_product_mat = gs.diag(gs.arange(1., 10.))
+        base_point = gs.eye(3) + 0.1 * gs.random.rand(2, 3, 3)
+        tangent_vec_a = gs.random.rand(2, 3, 3)
+        tangent_vec_b = gs.random.rand(2, 3, 3)
+
+        for left_or_right in ['left', 'right']:
+            metric = InvariantMetric(
+                group=group,
+                inner_product_mat_at_identity=inner_product_mat,
+                left_or_right=left_or_right)
+            inv_base_point = gs.linalg.inv(base_point)
+            if left_or_right == 'left':
+                vec_a_at_id = gs.matmul(inv_base_point, tangent_vec_a)
+                vec_b_at_id = gs.matmul(inv_base_point, tangent_vec_b)
+            else:
+                vec_a_at_id = gs.matmul(tangent_vec_a, inv_base_point)
+                vec_b_at_id = gs.matmul(tangent_vec_b, inv_base_point)
+            expected = gs.einsum(
+                'ni,ij,nj->n',
+                gs.reshape(vec_a_at_id, (2, 9)),
+                metric.inner_product_mat_at_identity[0],
+                gs.reshape(vec_b_at_id, (2, 9)))
+            expected = gs.to_ndarray(expected, to_ndim=2, axis=1)
+
+            result = metric.inner_product(
+                tangent_vec_a, tangent_vec_b, base_point)
+            self.assertAllClose(result, expected)
+
+            metric_mat = metric.inner_product_matrix(base_point)
+            result = gs.einsum(
+                'ni,nij,nj->n',
+                gs.reshape(tangent_vec_a, (2, 9)),
+                metric_mat,
+                gs.reshape(tangent_vec_b, (2, 9)))
+            result = gs.to_ndarray(result, to_ndim=2, axis=1)
+            self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_inner_product_so_matrix(self):
+        group = SpecialOrthogonalGroup(n=3, point_type='matrix')
+        inner_product_mat = gs.diag(gs.array([1., 2., 3.]))
+        metric = InvariantMetric(
+            group=group,
+            inner_product_mat_at_identity=inner_product_mat)
+        rot_vec = gs.array([[0.1, -0.3, 0.2], [-1., 0.5, 2.]])
+        vec_a = gs.array([[0.2, 0.1, -0.5]])
+        vec_b = gs.array([[-0.4, 1., 0.3]])
+        base_point = group.matrix_from_rotation_vector(rot_vec)
+        tangent_vec_a = gs.matmul(
+            base_point, group.skew_matrix_from_vector(vec_a))
+        tangent_vec_b = gs.matmul(
+            base_point, group.skew_matrix_from_vector(vec_b))
+
+        result = metric.inner_product(
+            tangent_vec_a, tangent_vec_b, base_point)
+        expected = gs.einsum(
+            'ij,jk,ik->i',
+            vec_a, metric.inner_product_mat_at_identity[0], vec_b)
+        expected = gs.array([expected, expected])
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_exp_and_log_bi_invariant_so_matrix(self):
+        group = SpecialOrthogonalGroup(n=3, point_type='matrix')
+        metric = BiInvariantMetric(group=group)
+        base_point = group.matrix_from_rotation_vector(
+            gs.array([[0.1, -0.3, 0.2], [-1., 0.5, 2.]]))
+        tangent_vec = gs.matmul(
+            base_point,
+            group.skew_matrix_from_vector(gs.array([[0.2, 0.1, -0.5]])))
+
+        point = metric.exp(tangent_vec, base_point)
+        self.assertAllClose(
+            gs.matmul(gs.transpose(point, axes=(0, 2, 1)), point),
+            gs.array([gs.eye(3)] * 2))
+        result = metric.log(point, base_point)
+        self.assertAllClose(result, tangent_vec)
+
+    def test_exp_and_log_matrix_not_bi_invariant(self):
+        group = SpecialEuclideanGroup(n=3, point_type='matrix')
+        metric = group.left_canonical_metric
+        point = group.identity
+
+        self.assertRaises(NotImplementedError, metric.exp, point, point)
+        self.assertRaises(NotImplementedError, metric.log, point, point)
+
 
 if __name__ == '__main__':
         geomstats.tests.main()
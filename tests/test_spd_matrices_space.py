@@ -8,7 +8,12 @@ import geomstats.backend as gs
 import geomstats.tests
 import tests.helper as helper
 
+from geomstats.spd_matrices_space import SPDBasePoint
 from geomstats.spd_matrices_space import SPDMatricesSpace
+from geomstats.spd_matrices_space import SPDMetric
+from geomstats.spd_matrices_space import SPDMetricBuresWasserstein
+from geomstats.spd_matrices_space import SPDMetricLogCholesky
+from geomstats.spd_matrices_space import SPDMetricLogEuclidean
 
 
 class TestSPDMatricesSpaceMethods(geomstats.tests.TestCase):
@@ -232,6 +237,161 @@ class TestSPDMatricesSpaceMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(gs.shape(result), (1, 1))
 
+    @geomstats.tests.np_only
+    def test_parallel_transport(self):
+        """
+        Test that the closed-form parallel transport is an isometry,
+        which agrees with the pole ladder.
+        """
+        n_samples = self.n_samples
+        base_point = self.space.random_uniform(n_samples=n_samples)
+        tangent_vec_a = self.space.random_tangent_vec_uniform(
+            n_samples=n_samples, base_point=base_point)
+        tangent_vec_b = self.space.random_tangent_vec_uniform(
+            n_samples=n_samples, base_point=base_point)
+
+        result = self.metric.parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        end_point = self.metric.exp(tangent_vec_b, base_point)
+
+        self.assertAllClose(
+            self.metric.inner_product(result, result, end_point),
+            self.metric.inner_product(
+                tangent_vec_a, tangent_vec_a, base_point))
+
+        expected = super(type(self.metric), self.metric).parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_mean_affine_invariant(self):
+        points = self.space.random_uniform(n_samples=self.n_samples)
+        mean = self.metric.mean(points, epsilon=1e-10)
+
+        result = gs.sum(self.metric.log(points, mean), axis=0)
+        expected = gs.zeros((self.n, self.n))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_log_euclidean_metric(self):
+        metric = SPDMetricLogEuclidean(n=self.n)
+        point_a = self.space.random_uniform(n_samples=self.n_samples)
+        point_b = self.space.random_uniform(n_samples=self.n_samples)
+
+        log = metric.log(point_b, point_a)
+        self.assertAllClose(metric.exp(log, point_a), point_b)
+
+        result = metric.squared_dist(point_a, point_b)
+        log_diff = gs.linalg.logm(point_a) - gs.linalg.logm(point_b)
+        expected = gs.to_ndarray(
+            gs.sum(log_diff ** 2, axis=(1, 2)), to_ndim=2, axis=1)
+        self.assertAllClose(result, expected)
+        self.assertAllClose(metric.squared_norm(log, point_a), expected)
+
+        result = metric.mean(point_a)
+        expected = gs.linalg.expm(gs.to_ndarray(
+            gs.mean(gs.linalg.logm(point_a), axis=0), to_ndim=3))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_log_euclidean_metric_close_eigenvalues(self):
+        metric = SPDMetricLogEuclidean(n=self.n)
+        base_point = gs.array([[[1., 0., 0.],
+                                [0., 1. + 1e-9, 0.],
+                                [0., 0., 2.]]])
+        tangent_vec = gs.array([[[1., 2., 0.],
+                                 [2., -1., 3.],
+                                 [0., 3., 0.5]]])
+
+        result = metric.log(metric.exp(tangent_vec, base_point), base_point)
+        self.assertAllClose(result, tangent_vec)
+
+    @geomstats.tests.np_only
+    def test_bures_wasserstein_metric(self):
+        metric = SPDMetricBuresWasserstein(n=self.n)
+        point_a = self.space.random_uniform(n_samples=self.n_samples)
+        point_b = self.space.random_uniform(n_samples=self.n_samples)
+
+        log = metric.log(point_b, point_a)
+        self.assertAllClose(metric.exp(log, point_a), point_b)
+
+        sqrt_a = gs.linalg.sqrtm(point_a)
+        aux = gs.linalg.sqrtm(gs.matmul(sqrt_a, gs.matmul(point_b, sqrt_a)))
+        expected = (gs.trace(point_a, axis1=1, axis2=2)
+                    + gs.trace(point_b, axis1=1, axis2=2)
+                    - 2. * gs.trace(aux, axis1=1, axis2=2))
+        expected = gs.to_ndarray(expected, to_ndim=2, axis=1)
+        self.assertAllClose(metric.squared_dist(point_a, point_b), expected)
+        self.assertAllClose(metric.squared_norm(log, point_a), expected)
+
+        mean = metric.mean(point_a, epsilon=1e-12, n_max_iterations=100)
+        result = gs.sum(metric.log(point_a, mean), axis=0)
+        expected = gs.zeros((self.n, self.n))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_log_cholesky_metric(self):
+        metric = SPDMetricLogCholesky(n=self.n)
+        point_a = self.space.random_uniform(n_samples=self.n_samples)
+        point_b = self.space.random_uniform(n_samples=self.n_samples)
+
+        log = metric.log(point_b, point_a)
+        self.assertAllClose(metric.exp(log, point_a), point_b)
+        self.assertAllClose(
+            metric.squared_norm(log, point_a),
+            metric.squared_dist(point_a, point_b))
+
+        tangent_vec = self.space.random_tangent_vec_uniform(
+            n_samples=self.n_samples, base_point=point_a)
+        result = metric.log(metric.exp(tangent_vec, point_a), point_a)
+        self.assertAllClose(result, tangent_vec)
+
+        mean = metric.mean(point_a)
+        result = gs.sum(metric.log(point_a, mean), axis=0)
+        expected = gs.zeros((self.n, self.n))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_base_point_factors(self):
+        base_point = self.space.random_uniform(n_samples=1)
+        point = self.space.random_uniform(n_samples=self.n_samples)
+        tangent_vec = self.space.random_tangent_vec_uniform(
+            n_samples=self.n_samples, base_point=base_point)
+        factors = SPDBasePoint(base_point)
+
+        self.assertAllClose(
+            factors.sqrt, gs.linalg.sqrtm(base_point))
+        self.assertAllClose(
+            factors.inv, gs.linalg.inv(base_point))
+        self.assertAllClose(
+            self.metric.log(point, factors),
+            self.metric.log(point, base_point))
+        self.assertAllClose(
+            self.metric.exp(tangent_vec, factors),
+            self.metric.exp(tangent_vec, base_point))
+        self.assertAllClose(
+            self.metric.inner_product(tangent_vec, tangent_vec, factors),
+            self.metric.inner_product(tangent_vec, tangent_vec, base_point))
+
+    @geomstats.tests.np_only
+    def test_base_point_factors_cache(self):
+        metric = SPDMetric(n=self.n, cache_size=2)
+        base_points = [self.space.random_uniform() for _ in range(3)]
+        point = self.space.random_uniform(n_samples=self.n_samples)
+
+        for base_point in base_points + base_points[-1:]:
+            metric.log(point, base_point)
+        self.assertEqual(len(metric.factors_cache), 2)
+        self.assertTrue(
+            metric.base_point_factors(base_points[-1])
+            is metric.base_point_factors(base_points[-1]))
+
+        base_point = base_points[-1]
+        base_point *= 2.
+        result = metric.log(point, base_point)
+        expected = self.metric.log(point, base_point)
+        self.assertAllClose(result, expected)
+
 
 if __name__ == '__main__':
     geomstats.tests.main()
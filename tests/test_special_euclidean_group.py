@@ -390,6 +390,27 @@ class TestSpecialEuclideanGroupMethods(geomstats.tests.TestCase):
         self.assertAllClose(
             gs.shape(result), (n_samples, self.group.dimension))
 
+    @geomstats.tests.np_only
+    def test_group_exp_and_log_from_identity_vectorization_values(self):
+        n_samples = 10
+        tangent_vecs = self.group.random_uniform(n_samples=n_samples)
+        points = self.group.random_uniform(n_samples=n_samples)
+
+        result = self.group.group_exp_from_identity(tangent_vecs)
+        expected = gs.vstack([
+            self.group.group_exp_from_identity(tangent_vec)
+            for tangent_vec in tangent_vecs])
+        self.assertAllClose(result, expected)
+
+        result = self.group.group_log_from_identity(points)
+        expected = gs.vstack([
+            self.group.group_log_from_identity(point) for point in points])
+        self.assertAllClose(result, expected)
+
+        result = self.group.group_exp_from_identity(
+            self.group.group_log_from_identity(points))
+        self.assertAllClose(result, points)
+
     def test_group_log_from_identity_vectorization(self):
         n_samples = self.n_samples
         points = self.group.random_uniform(n_samples=n_samples)
@@ -1272,6 +1293,177 @@ class TestSpecialEuclideanGroupMethods(geomstats.tests.TestCase):
             expected = helper.to_vector(points[i])
             self.assertAllClose(result, expected)
 
+    @geomstats.tests.np_only
+    def test_random_and_belongs_matrix(self):
+        group = SpecialEuclideanGroup(n=3, point_type='matrix')
+        points = group.random_uniform(n_samples=self.n_samples)
+        result = group.belongs(points)
+        expected = gs.array([[True]] * self.n_samples)
+        self.assertAllClose(result, expected)
+
+        point = gs.copy(points[0])
+        point[3, 0] = 1.
+        result = group.belongs(point)
+        expected = gs.array([[False]])
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_compose_and_inverse_matrix(self):
+        group = SpecialEuclideanGroup(n=3, point_type='matrix')
+        point_a = self.group.random_uniform(n_samples=self.n_samples)
+        point_b = self.group.random_uniform(n_samples=self.n_samples)
+        mat_a = group.matrix_from_vector(point_a)
+        mat_b = group.matrix_from_vector(point_b)
+
+        result = group.compose(mat_a, mat_b)
+        expected = group.matrix_from_vector(
+            self.group.compose(point_a, point_b))
+        self.assertAllClose(result, expected)
+
+        result = group.inverse(mat_a)
+        expected = group.matrix_from_vector(self.group.inverse(point_a))
+        self.assertAllClose(result, expected)
+
+        result = group.compose(mat_a, group.inverse(mat_a))
+        expected = gs.tile(group.identity, (self.n_samples, 1, 1))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_rotation_block_and_translation_column(self):
+        group = SpecialEuclideanGroup(n=3, point_type='matrix')
+        point = self.group.random_uniform(n_samples=self.n_samples)
+        mat = group.matrix_from_vector(point)
+
+        result = group.translation_column(mat)
+        expected = point[:, 3:]
+        self.assertAllClose(result, expected)
+
+        result = group.rotation_block(mat)
+        expected = group.rotations.matrix_from_rotation_vector(point[:, :3])
+        self.assertAllClose(result, expected)
+
+        result[0, 0, 0] = 2.
+        self.assertAllClose(mat[0, 0, 0], 2.)
+
+    @geomstats.tests.np_only
+    def test_group_exp_and_log_matrix(self):
+        for n in [2, 3, 4]:
+            group = SpecialEuclideanGroup(n=n, point_type='matrix')
+            tangent_vec = gs.random.rand(2 * self.n_samples, n + 1, n + 1)
+            tangent_vec[:, n] = 0.
+            tangent_vec[:, :n, :n] -= gs.transpose(
+                tangent_vec[:, :n, :n], axes=(0, 2, 1))
+
+            result = group.group_exp_from_identity(tangent_vec)
+            expected = gs.linalg.expm(tangent_vec)
+            self.assertAllClose(result, expected)
+
+            point = result[:self.n_samples]
+            base_point = result[self.n_samples:]
+            result = group.group_exp(
+                group.group_log(point, base_point), base_point)
+            self.assertAllClose(result, point)
+
+    @geomstats.tests.np_only
+    def test_group_log_from_identity_matrix(self):
+        group = SpecialEuclideanGroup(n=3, point_type='matrix')
+        point = self.group.random_uniform(n_samples=self.n_samples)
+
+        result = group.group_log_from_identity(
+            group.matrix_from_vector(point))
+        tangent_vec = self.group.group_log_from_identity(point)
+        expected = gs.concatenate([
+            gs.concatenate([
+                group.rotations.skew_matrix_from_vector(tangent_vec[:, :3]),
+                gs.expand_dims(tangent_vec[:, 3:], axis=2)], axis=2),
+            gs.zeros((self.n_samples, 1, 4))], axis=1)
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_cumulative_compose_and_relative_poses(self):
+        for point_type in ('vector', 'matrix'):
+            group = SpecialEuclideanGroup(n=3, point_type=point_type)
+            for n_points in [1, 2, 7]:
+                points = group.random_uniform(n_samples=n_points)
+
+                result = group.cumulative_compose(points)
+                expected = [points[:1]]
+                for i in range(1, n_points):
+                    expected.append(
+                        group.compose(expected[-1], points[i:i + 1]))
+                expected = gs.concatenate(expected, axis=0)
+                self.assertAllClose(result, expected)
+
+            result = group.relative_poses(group.cumulative_compose(points))
+            self.assertAllClose(result, points[1:])
+
+    @geomstats.tests.np_only
+    def test_random_uniform_rng(self):
+        for point_type in ('vector', 'matrix'):
+            group = SpecialEuclideanGroup(n=3, point_type=point_type)
+            result = group.random_uniform(
+                n_samples=self.n_samples, rng=gs.random.default_rng(1))
+            expected = group.random_uniform(
+                n_samples=self.n_samples, rng=gs.random.default_rng(1))
+            self.assertAllClose(result, expected)
+            self.assertTrue(gs.all(group.belongs(result)))
+
+        group = SpecialEuclideanGroup(n=4)
+        result = group.belongs(group.random_uniform(n_samples=self.n_samples))
+        self.assertTrue(gs.all(result))
+
+    @geomstats.tests.np_only
+    def test_group_exp_and_log_with_some_identity_base_points(self):
+        group = self.group
+        n_samples = 4
+        tangent_vec = group.random_uniform(n_samples=n_samples)
+        point = group.random_uniform(n_samples=n_samples)
+        base_point = group.random_uniform(n_samples=n_samples)
+        base_point[1] = group.identity
+        base_point[3] = group.identity
+
+        result = group.group_exp(tangent_vec, base_point)
+        expected = gs.vstack([
+            group.group_exp(one_tangent_vec, one_base_point)
+            for one_tangent_vec, one_base_point in zip(
+                tangent_vec, base_point)])
+        self.assertAllClose(result, expected)
+
+        result = group.group_log(point, base_point)
+        expected = gs.vstack([
+            group.group_log(one_point, one_base_point)
+            for one_point, one_base_point in zip(point, base_point)])
+        self.assertAllClose(result, expected)
+
+    def test_group_exp_and_log_with_base_point_none(self):
+        group = self.group
+        tangent_vec = group.random_uniform(n_samples=self.n_samples)
+        point = group.random_uniform(n_samples=self.n_samples)
+        identity = gs.to_ndarray(group.identity, to_ndim=2)
+
+        result = group.group_exp(tangent_vec)
+        expected = group.group_exp(tangent_vec, identity)
+        self.assertAllClose(result, expected)
+
+        result = group.group_log(point)
+        expected = group.group_log(point, identity)
+        self.assertAllClose(result, expected)
+
+    def test_inverse_jacobian_translation(self):
+        group = self.group
+        point = group.random_uniform(n_samples=self.n_samples)
+        point = gs.vstack([
+            point, gs.zeros((1, 6)),
+            gs.array([[0., gs.pi, 0., 1., 2., 3.]])])
+
+        for left_or_right in ('left', 'right'):
+            jacobian = group.jacobian_translation(
+                point, left_or_right=left_or_right)
+            result = group.inverse_jacobian_translation(
+                point, left_or_right=left_or_right)
+            expected = gs.linalg.inv(jacobian)
+            self.assertAllClose(result, expected)
+
 
 if __name__ == '__main__':
         geomstats.tests.main()
@@ -3665,6 +3665,495 @@ class TestSpecialOrthogonalGroupMethods(geomstats.tests.TestCase):
                                     base_point=initial_point)
             # self.assertTrue(gs.allclose(point_step, points[i]))
 
+    @geomstats.tests.np_only
+    def test_parallel_transport_bi_invariant_metric(self):
+        """
+        Test that the closed-form parallel transport of the bi-invariant
+        metric is an isometry, which agrees with the pole ladder.
+        """
+        n = 3
+        group = self.so[n]
+        metric = group.bi_invariant_metric
+
+        base_point = group.random_uniform(n_samples=4)
+        tangent_vec_a = gs.array([
+            [0.1, 0.2, -0.3],
+            [0.5, 0., 0.2],
+            [-0.4, 0.1, 0.1],
+            [0., 0., 0.6]])
+        tangent_vec_b = gs.array([
+            [0.3, -0.1, 0.2],
+            [0., 0.8, 0.1],
+            [0.2, 0.2, -0.5],
+            [0.7, 0., 0.]])
+
+        result = metric.parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        end_point = metric.exp(tangent_vec_b, base_point)
+
+        self.assertAllClose(
+            metric.norm(result, end_point),
+            metric.norm(tangent_vec_a, base_point))
+
+        expected = super(type(metric), metric).parallel_transport(
+            tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(result, expected)
+
+        self.assertRaises(
+            AssertionError, metric.parallel_transport,
+            tangent_vec_a[:2], tangent_vec_b[:3], base_point[:1])
+
+    @geomstats.tests.np_only
+    def test_rotation_vector_from_matrix_accuracy(self):
+        """
+        Test the conversion from rotation matrices to rotation vectors
+        on a batch mixing angles close to 0, generic angles and angles
+        close to pi, with random axes.
+        """
+        group = self.so[3]
+        angles = gs.array([
+            0., 1e-12, 1e-8, 1e-5, 1e-3, .5, 2., 3.,
+            gs.pi - 1e-3, gs.pi - 1e-6, gs.pi - 1e-9, gs.pi])
+        axes = gs.random.rand(len(angles), 3) - .5
+        axes /= gs.linalg.norm(axes, axis=1, keepdims=True)
+        rot_vecs = gs.einsum('n,ni->ni', angles, axes)
+        rot_mats = gs.linalg.expm(group.skew_matrix_from_vector(rot_vecs))
+
+        rot_vecs_result = group.rotation_vector_from_matrix(rot_mats)
+        self.assertAllClose(rot_vecs_result[:-1], rot_vecs[:-1], atol=1e-12)
+
+        # The angle pi has two opposite rotation vectors.
+        result = gs.linalg.expm(group.skew_matrix_from_vector(
+            rot_vecs_result[-1:]))
+        self.assertAllClose(result, rot_mats[-1:], atol=1e-12)
+
+    @geomstats.tests.np_only
+    def test_rotation_vector_from_matrix_close_to_pi_per_sample(self):
+        """
+        Test that the axis of rotations of angle close to pi is read on
+        the largest diagonal element of each rotation matrix.
+        """
+        group = self.so[3]
+        rot_vecs = (gs.pi - 1e-7) * gs.array([
+            [1., 0., 0.], [0., 0., 1.], [0., -1., 0.]])
+        rot_mats = gs.linalg.expm(group.skew_matrix_from_vector(rot_vecs))
+
+        result = group.rotation_vector_from_matrix(rot_mats)
+        self.assertAllClose(result, rot_vecs, atol=1e-12)
+
+    @geomstats.tests.np_only
+    def test_compose_and_inverse_quaternion(self):
+        group = self.so[3]
+        quaternion_group = SpecialOrthogonalGroup(n=3, point_type='quaternion')
+        rot_vec_a = group.random_uniform(n_samples=self.n_samples)
+        rot_vec_b = group.random_uniform(n_samples=self.n_samples)
+        quaternion_a = group.quaternion_from_rotation_vector(rot_vec_a)
+        quaternion_b = group.quaternion_from_rotation_vector(rot_vec_b)
+
+        result = quaternion_group.compose(quaternion_a, quaternion_b)
+        expected = group.quaternion_from_rotation_vector(
+            group.compose(rot_vec_a, rot_vec_b))
+        self.assertAllClose(result, expected)
+
+        result = quaternion_group.compose(quaternion_a[:1], quaternion_b)
+        expected = group.quaternion_from_rotation_vector(
+            group.compose(rot_vec_a[:1], rot_vec_b))
+        self.assertAllClose(result, expected)
+
+        result = quaternion_group.compose(
+            quaternion_a, quaternion_group.inverse(quaternion_a))
+        expected = gs.tile(quaternion_group.identity, (self.n_samples, 1))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_group_exp_and_log_quaternion(self):
+        group = self.so[3]
+        quaternion_group = SpecialOrthogonalGroup(n=3, point_type='quaternion')
+        rot_vec = group.random_uniform(n_samples=self.n_samples)
+        tangent_vec = group.random_uniform(n_samples=self.n_samples)
+        base_point = quaternion_group.random_uniform(n_samples=self.n_samples)
+
+        result = quaternion_group.group_log_from_identity(
+            quaternion_group.group_exp_from_identity(rot_vec))
+        self.assertAllClose(result, rot_vec)
+
+        result = quaternion_group.group_log(
+            quaternion_group.group_exp(tangent_vec, base_point), base_point)
+        self.assertAllClose(result, tangent_vec)
+
+        result = quaternion_group.belongs(
+            quaternion_group.group_exp(tangent_vec, base_point))
+        self.assertTrue(gs.all(result))
+
+    @geomstats.tests.np_only
+    def test_exp_and_log_canonical_metrics_quaternion(self):
+        group = self.so[3]
+        quaternion_group = SpecialOrthogonalGroup(n=3, point_type='quaternion')
+        base_point = group.random_uniform(n_samples=self.n_samples)
+        point = group.random_uniform(n_samples=self.n_samples)
+        tangent_vec = 0.5 * group.random_uniform(n_samples=self.n_samples)
+        base_quaternion = group.quaternion_from_rotation_vector(base_point)
+        quaternion = group.quaternion_from_rotation_vector(point)
+        # Tangent vectors of quaternions are left-translated
+        # to the identity.
+        left_inv_jacobian = group.inverse_jacobian_translation(
+            base_point, left_or_right='left')
+
+        for left_or_right in ['left', 'right']:
+            metric = getattr(group, left_or_right + '_canonical_metric')
+            quaternion_metric = getattr(
+                quaternion_group, left_or_right + '_canonical_metric')
+            tangent_vec_at_id = gs.einsum(
+                'nij,nj->ni', left_inv_jacobian, tangent_vec)
+
+            result = quaternion_metric.exp(tangent_vec_at_id, base_quaternion)
+            expected = quaternion_group.regularize(
+                group.quaternion_from_rotation_vector(
+                    metric.exp(tangent_vec, base_point)))
+            self.assertAllClose(result, expected)
+
+            result = quaternion_metric.log(quaternion, base_quaternion)
+            expected = gs.einsum(
+                'nij,nj->ni', left_inv_jacobian,
+                metric.log(point, base_point))
+            self.assertAllClose(result, expected)
+
+            result = quaternion_metric.log(
+                quaternion_metric.exp(tangent_vec_at_id))
+            self.assertAllClose(result, tangent_vec_at_id)
+
+    @geomstats.tests.np_only
+    def test_dist_and_barycenter_quaternion(self):
+        group = self.so[3]
+        quaternion_group = SpecialOrthogonalGroup(n=3, point_type='quaternion')
+        metric = quaternion_group.bi_invariant_metric
+        rot_vec_a = group.random_uniform(n_samples=self.n_samples)
+        rot_vec_b = group.random_uniform(n_samples=self.n_samples)
+        quaternion_a = group.quaternion_from_rotation_vector(rot_vec_a)
+        quaternion_b = group.quaternion_from_rotation_vector(rot_vec_b)
+
+        result = metric.dist(quaternion_a, quaternion_b)
+        expected = group.bi_invariant_metric.dist(rot_vec_a, rot_vec_b)
+        self.assertAllClose(result, expected)
+
+        barycenter = quaternion_group.group_exponential_barycenter(
+            quaternion_a)
+        result = gs.mean(
+            quaternion_group.group_log(quaternion_a, barycenter), axis=0)
+        self.assertAllClose(result, gs.zeros(3), atol=1e-6)
+
+    @geomstats.tests.np_only
+    def test_inverse_jacobian_translation(self):
+        group = self.so[3]
+        point = group.random_uniform(n_samples=self.n_samples)
+        point = gs.vstack([
+            point, gs.zeros((1, 3)), gs.array([[1e-6, 0., 0.]]),
+            gs.array([[0., gs.pi, 0.]])])
+
+        for left_or_right in ('left', 'right'):
+            jacobian = group.jacobian_translation(
+                point, left_or_right=left_or_right)
+            result = group.inverse_jacobian_translation(
+                point, left_or_right=left_or_right)
+            expected = gs.linalg.inv(jacobian)
+            self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_compose_vector_against_matrix(self):
+        group = self.so[3]
+        n_samples = 10
+        rot_axis = gs.random.normal(size=(n_samples, 3))
+        rot_axis = rot_axis / gs.linalg.norm(rot_axis, axis=1, keepdims=True)
+        points = {
+            'random': group.random_uniform(n_samples=n_samples),
+            'close to 0': 1e-9 * rot_axis,
+            'close to pi': (gs.pi - 1e-6) * rot_axis,
+            'pi': gs.pi * rot_axis}
+
+        for name_a, point_a in points.items():
+            for name_b, point_b in points.items():
+                result = group.matrix_from_rotation_vector(
+                    group.compose(point_a, point_b))
+                expected = gs.matmul(
+                    group.matrix_from_rotation_vector(point_a),
+                    group.matrix_from_rotation_vector(point_b))
+                self.assertAllClose(result, expected, atol=1e-6)
+
+            result = group.compose(point_a[:1], point_a)
+            expected = group.compose(
+                gs.tile(point_a[:1], (n_samples, 1)), point_a)
+            self.assertAllClose(result, expected)
+
+        point = points['close to 0']
+        result = group.compose(point, point)
+        expected = 2. * point
+        self.assertAllClose(result, expected, atol=1e-20)
+
+    @geomstats.tests.np_only
+    def test_cumulative_compose_and_relative_poses(self):
+        for point_type in ('vector', 'matrix', 'quaternion'):
+            group = SpecialOrthogonalGroup(n=3, point_type=point_type)
+            for n_points in [1, 2, 7]:
+                points = group.random_uniform(
+                    n_samples=n_points, point_type='vector')
+                if point_type == 'matrix':
+                    points = group.matrix_from_rotation_vector(points)
+                elif point_type == 'quaternion':
+                    points = group.quaternion_from_rotation_vector(points)
+
+                result = group.cumulative_compose(points)
+                expected = [points[:1]]
+                for i in range(1, n_points):
+                    expected.append(
+                        group.compose(expected[-1], points[i:i + 1]))
+                expected = gs.concatenate(expected, axis=0)
+                self.assertAllClose(result, expected)
+
+            result = group.relative_poses(group.cumulative_compose(points))
+            self.assertAllClose(result, points[1:])
+
+    @geomstats.tests.np_only
+    def test_random_uniform_haar(self):
+        n_samples = 10000
+        for n in self.n_seq:
+            group = self.so[n]
+            rng = gs.random.default_rng(0)
+            points = group.random_uniform(
+                n_samples=n_samples, point_type='matrix', rng=rng)
+
+            result = gs.all(group.belongs(points, point_type='matrix'))
+            self.assertTrue(result)
+            result = gs.linalg.det(points)
+            self.assertAllClose(result, gs.ones(n_samples))
+
+            # Moments of the trace under the Haar measure.
+            trace = gs.einsum('nii->n', points)
+            self.assertAllClose(gs.mean(trace), 0., atol=0.05)
+            expected = 2. if n == 2 else 1.
+            self.assertAllClose(gs.mean(trace ** 2), expected, atol=0.1)
+
+        group = self.so[3]
+        points = group.random_uniform(
+            n_samples=n_samples, rng=gs.random.default_rng(0))
+        angle = gs.linalg.norm(points, axis=1)
+        result = gs.mean(angle)
+        expected = gs.pi / 2. + 2. / gs.pi
+        self.assertAllClose(result, expected, atol=0.05)
+
+    @geomstats.tests.np_only
+    def test_random_uniform_rng(self):
+        for point_type in ('vector', 'matrix', 'quaternion'):
+            group = SpecialOrthogonalGroup(n=3, point_type=point_type)
+            result = group.random_uniform(
+                n_samples=self.n_samples, rng=gs.random.default_rng(1))
+            expected = group.random_uniform(
+                n_samples=self.n_samples, rng=gs.random.default_rng(1))
+            self.assertAllClose(result, expected)
+
+            rngs = gs.random.spawn_rngs(1, 2)
+            points_0 = group.random_uniform(
+                n_samples=self.n_samples, rng=rngs[0])
+            points_1 = group.random_uniform(
+                n_samples=self.n_samples, rng=rngs[1])
+            self.assertFalse(gs.allclose(points_0, points_1))
+
+            rngs = gs.random.spawn_rngs(1, 2)
+            result = group.random_uniform(
+                n_samples=self.n_samples, rng=rngs[1])
+            self.assertAllClose(result, points_1)
+
+    @geomstats.tests.np_only
+    def test_skew_matrix_and_vector_nd(self):
+        for n in [4, 5]:
+            group = SpecialOrthogonalGroup(n=n)
+            vec = gs.random.rand(self.n_samples, group.dimension)
+            skew_mat = group.skew_matrix_from_vector(vec)
+
+            result = skew_mat + gs.transpose(skew_mat, axes=(0, 2, 1))
+            expected = gs.zeros((self.n_samples, n, n))
+            self.assertAllClose(result, expected)
+
+            result = skew_mat[:, 0, 1:]
+            expected = vec[:, :n - 1]
+            self.assertAllClose(result, expected)
+
+            result = group.vector_from_skew_matrix(skew_mat)
+            self.assertAllClose(result, vec)
+
+    @geomstats.tests.np_only
+    def test_matrix_and_rotation_vector_nd(self):
+        for n in [2, 4, 5, 12]:
+            group = SpecialOrthogonalGroup(n=n)
+            rot_vec = gs.random.rand(self.n_samples, group.dimension)
+            rot_mat = group.matrix_from_rotation_vector(rot_vec)
+            expected = gs.linalg.expm(group.skew_matrix_from_vector(rot_vec))
+            self.assertAllClose(rot_mat, expected)
+
+            rot_mat = group.random_uniform(
+                n_samples=self.n_samples, point_type='matrix')
+            result = group.matrix_from_rotation_vector(
+                group.rotation_vector_from_matrix(rot_mat))
+            self.assertAllClose(result, rot_mat)
+
+    @geomstats.tests.np_only
+    def test_rotation_vector_from_matrix_nd_with_angle_pi(self):
+        group = SpecialOrthogonalGroup(n=5)
+        base_change = group.random_uniform(point_type='matrix')[0]
+        for diag in ([-1., -1., 1., 1., 1.],
+                     [-1., 1., -1., 1., 1.],
+                     [-1., -1., -1., -1., 1.]):
+            rot_mat = gs.matmul(
+                base_change,
+                gs.matmul(gs.diag(gs.array(diag)), gs.transpose(base_change)))
+
+            result = group.matrix_from_rotation_vector(
+                group.rotation_vector_from_matrix(rot_mat))
+            self.assertAllClose(result, gs.to_ndarray(rot_mat, to_ndim=3))
+
+    @geomstats.tests.np_only
+    def test_projection_det_and_polar(self):
+        for n in self.n_seq:
+            group = self.so[n]
+            mat = gs.random.rand(self.n_samples, n, n)
+            result = group.projection(mat)
+
+            self.assertTrue(gs.all(group.belongs(result, point_type='matrix')))
+            self.assertAllClose(gs.linalg.det(result), gs.ones(self.n_samples))
+
+            # The polar factor is the projection of matrices of positive det
+            aux_mat = gs.matmul(gs.transpose(mat, axes=(0, 2, 1)), mat)
+            polar_mat = gs.matmul(mat, gs.linalg.inv(gs.linalg.sqrtm(aux_mat)))
+            mask = gs.linalg.det(mat) > 0.
+            self.assertAllClose(result[mask], polar_mat[mask])
+
+    @geomstats.tests.np_only
+    def test_projection_reflection(self):
+        for n in self.n_seq:
+            group = self.so[n]
+            reflection = gs.eye(n)
+            reflection[-1, -1] = - 0.5
+
+            for method in ['svd', 'newton_schulz']:
+                result = group.projection(reflection, method=method)
+                expected = helper.to_matrix(gs.eye(n))
+                self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_projection_newton_schulz(self):
+        for n in self.n_seq:
+            group = self.so[n]
+            rot_mat = group.random_uniform(
+                n_samples=self.n_samples, point_type='matrix')
+            mats = gs.concatenate([
+                rot_mat + 1e-3 * gs.random.rand(self.n_samples, n, n),
+                gs.random.rand(self.n_samples, n, n)])
+
+            result = group.projection(mats, method='newton_schulz')
+            expected = group.projection(mats, method='svd')
+            self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_group_exponential_barycenter_quaternion_eig(self):
+        group = self.so[3]
+        base_point = group.random_uniform()
+        points = group.compose(
+            base_point, 0.3 * gs.random.normal(size=(20, 3)))
+        weights = gs.random.rand(20)
+
+        quaternion_group = SpecialOrthogonalGroup(
+            n=3, point_type='quaternion')
+        expected = group.rotation_vector_from_quaternion(
+            quaternion_group.group_exponential_barycenter(
+                group.quaternion_from_rotation_vector(points), weights))
+
+        estimate, deviation = group.group_exponential_barycenter(
+            points, weights, method='quaternion_eig', return_deviation=True)
+        result = group.bi_invariant_metric.dist(estimate, expected)
+        self.assertAllClose(result, deviation)
+        self.assertTrue(gs.all(deviation < 0.1))
+
+        result, deviation = group.group_exponential_barycenter(
+            points, weights, method='quaternion_eig', n_iterations=5,
+            return_deviation=True)
+        self.assertAllClose(result, expected)
+        self.assertAllClose(deviation, gs.zeros((1, 1)))
+
+        quaternion_estimate, quaternion_deviation = (
+            quaternion_group.group_exponential_barycenter(
+                group.quaternion_from_rotation_vector(points), weights,
+                method='quaternion_eig', return_deviation=True))
+        self.assertAllClose(
+            quaternion_estimate,
+            group.quaternion_from_rotation_vector(estimate))
+        _, vector_deviation = group.group_exponential_barycenter(
+            points, weights, method='quaternion_eig', return_deviation=True)
+        self.assertAllClose(quaternion_deviation, vector_deviation)
+
+        result = group.group_exponential_barycenter(
+            group.matrix_from_rotation_vector(points), weights,
+            point_type='matrix', method='quaternion_eig', n_iterations=5)
+        expected = group.matrix_from_rotation_vector(expected)
+        self.assertAllClose(result, expected)
+
+    def test_group_exponential_barycenter_quaternion_eig_nd(self):
+        group = SpecialOrthogonalGroup(n=4)
+        points = group.random_uniform(n_samples=self.n_samples)
+        self.assertRaises(
+            NotImplementedError,
+            lambda: group.group_exponential_barycenter(
+                points, method='quaternion_eig'))
+
+    @geomstats.tests.np_only
+    def test_conversions_vectorization(self):
+        group = self.so[3]
+        rot_vec = group.random_uniform(n_samples=self.n_samples)
+        rot_mat = group.matrix_from_rotation_vector(rot_vec)
+        quaternion = group.quaternion_from_rotation_vector(rot_vec)
+
+        result = group.matrix_from_quaternion(quaternion)
+        self.assertAllClose(result, rot_mat)
+        result = group.quaternion_from_matrix(rot_mat)
+        self.assertAllClose(result, quaternion)
+
+        for extrinsic_or_intrinsic in ('extrinsic', 'intrinsic'):
+            for order in ('xyz', 'zyx'):
+                tait_bryan_angles = group.tait_bryan_angles_from_matrix(
+                    rot_mat, extrinsic_or_intrinsic, order)
+                result = gs.vstack([
+                    group.tait_bryan_angles_from_matrix(
+                        one_rot_mat, extrinsic_or_intrinsic, order)
+                    for one_rot_mat in rot_mat])
+                self.assertAllClose(result, tait_bryan_angles)
+
+                result = group.matrix_from_tait_bryan_angles(
+                    tait_bryan_angles, extrinsic_or_intrinsic, order)
+                self.assertAllClose(result, rot_mat)
+
+                result = group.quaternion_from_tait_bryan_angles(
+                    tait_bryan_angles, extrinsic_or_intrinsic, order)
+                self.assertAllClose(result, quaternion)
+
+                result = group.tait_bryan_angles_from_quaternion(
+                    quaternion, extrinsic_or_intrinsic, order)
+                self.assertAllClose(result, tait_bryan_angles)
+
+    @geomstats.tests.np_only
+    def test_tait_bryan_angles_from_matrix_gimbal_lock(self):
+        group = self.so[3]
+        tait_bryan_angles = gs.array([
+            [0.3, gs.pi / 2., -0.4],
+            [0.3, - gs.pi / 2., 0.2]])
+
+        for extrinsic_or_intrinsic in ('extrinsic', 'intrinsic'):
+            for order in ('xyz', 'zyx'):
+                rot_mat = group.matrix_from_tait_bryan_angles(
+                    tait_bryan_angles, extrinsic_or_intrinsic, order)
+                angles = group.tait_bryan_angles_from_matrix(
+                    rot_mat, extrinsic_or_intrinsic, order)
+                result = group.matrix_from_tait_bryan_angles(
+                    angles, extrinsic_or_intrinsic, order)
+                self.assertAllClose(result, rot_mat)
+
 
 if __name__ == '__main__':
         geomstats.tests.main()
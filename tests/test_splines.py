@@ -0,0 +1,126 @@
+"""
+Unit tests for the Bezier splines on manifolds.
+"""
+
+import geomstats.backend as gs
+import geomstats.splines as splines
+import geomstats.tests
+
+from geomstats.euclidean_space import EuclideanSpace
+from geomstats.hypersphere import Hypersphere
+from geomstats.special_euclidean_group import SpecialEuclideanGroup
+from geomstats.special_orthogonal_group import SpecialOrthogonalGroup
+from geomstats.splines import BezierSpline
+from geomstats.splines import de_casteljau
+
+
+class TestSplinesMethods(geomstats.tests.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        gs.random.seed(1234)
+
+        self.sphere = Hypersphere(dimension=2)
+        self.so3_group = SpecialOrthogonalGroup(n=3)
+        self.se3_group = SpecialEuclideanGroup(n=3)
+        self.euclidean = EuclideanSpace(dimension=2)
+
+        self.times = gs.linspace(0., 2., 9)
+
+    def check_against_naive(self, metric, points):
+        control_points = gs.reshape(points, (2, 4) + points.shape[1:])
+        spline = BezierSpline(metric, control_points)
+
+        result = spline(self.times)
+        expected = splines._naive_evaluate(spline, self.times)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_evaluate_hypersphere(self):
+        points = self.sphere.random_uniform(n_samples=8)
+        self.check_against_naive(self.sphere.metric, points)
+
+    @geomstats.tests.np_only
+    def test_evaluate_so3(self):
+        points = self.so3_group.random_uniform(n_samples=8)
+        self.check_against_naive(self.so3_group.bi_invariant_metric, points)
+
+    @geomstats.tests.np_only
+    def test_evaluate_se3(self):
+        points = self.se3_group.random_uniform(n_samples=8)
+        self.check_against_naive(
+            self.se3_group.left_canonical_metric, points)
+
+    @geomstats.tests.np_only
+    def test_evaluate_euclidean(self):
+        """
+        Test that the spline is the classical Bezier curve,
+        given by the Bernstein polynomials, in Euclidean space.
+        """
+        control_points = self.euclidean.random_uniform(n_samples=4)
+        spline = BezierSpline(self.euclidean.metric, control_points)
+
+        times = gs.linspace(0., 1., 5)
+        result = spline(times)
+
+        bernstein = gs.stack([
+            (1. - times) ** 3,
+            3. * times * (1. - times) ** 2,
+            3. * times ** 2 * (1. - times),
+            times ** 3], axis=1)
+        expected = gs.matmul(bernstein, control_points)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_evaluate_end_points(self):
+        control_points = self.sphere.random_uniform(n_samples=4)
+        spline = BezierSpline(self.sphere.metric, control_points)
+
+        result = spline(gs.array([0., 1.]))
+        expected = control_points[[0, -1]]
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_evaluate_degree_1_is_geodesic(self):
+        control_points = self.sphere.random_uniform(n_samples=2)
+        spline = BezierSpline(self.sphere.metric, control_points)
+
+        times = gs.linspace(0., 1., 5)
+        result = spline(times)
+        geodesic = self.sphere.metric.geodesic(
+            initial_point=control_points[0], end_point=control_points[1])
+        expected = geodesic(times)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_evaluate_batch_size(self):
+        points = self.sphere.random_uniform(n_samples=8)
+        control_points = gs.reshape(points, (2, 4, 3))
+        spline = BezierSpline(self.sphere.metric, control_points)
+
+        result = spline.evaluate(self.times, batch_size=2)
+        expected = spline.evaluate(self.times)
+
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_de_casteljau_control_logs(self):
+        control_points = gs.reshape(
+            self.sphere.random_uniform(n_samples=6), (2, 3, 3))
+        times = gs.array([.3, .8])
+
+        spline = BezierSpline(self.sphere.metric, control_points)
+        result = de_casteljau(
+            self.sphere.metric, control_points, times,
+            control_logs=spline.control_logs)
+        expected = de_casteljau(self.sphere.metric, control_points, times)
+
+        self.assertAllClose(result, expected)
+
+
+if __name__ == '__main__':
+        geomstats.tests.main()